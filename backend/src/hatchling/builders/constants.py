@@ -38,6 +38,7 @@ class BuildEnvVars:
     HOOK_ENABLE_PREFIX = 'HATCH_BUILD_HOOK_ENABLE_'
     CLEAN = 'HATCH_BUILD_CLEAN'
     CLEAN_HOOKS_AFTER = 'HATCH_BUILD_CLEAN_HOOKS_AFTER'
+    PLUGIN_INDEX_DIR = 'HATCH_BUILD_PLUGIN_INDEX_DIR'
 
 
 EDITABLES_REQUIREMENT = 'editables~=0.3'
@@ -4,11 +4,11 @@ import gzip
 import os
 import tarfile
 import tempfile
-from contextlib import closing
+from contextlib import closing, contextmanager
 from copy import copy
 from io import BytesIO
 from time import time as get_current_timestamp
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Generator
 
 from hatchling.builders.config import BuilderConfig
 from hatchling.builders.plugin.interface import BuilderInterface
@@ -28,12 +28,13 @@ if TYPE_CHECKING:
 
 
 class SdistArchive:
-    def __init__(self, name: str, *, reproducible: bool) -> None:
+    def __init__(self, name: str, *, reproducible: bool, staging_directory: str | None = None) -> None:
         """
         https://peps.python.org/pep-0517/#source-distributions
         """
         self.name = name
         self.reproducible = reproducible
+        self.staging_directory = staging_directory
         self.timestamp: int | None = get_reproducible_timestamp() if reproducible else None
 
         raw_fd, self.path = tempfile.mkstemp(suffix='.tar.gz')
@@ -55,6 +56,38 @@ class SdistArchive:
         with closing(BytesIO(contents)) as buffer:
             self.tf.addfile(tar_info, buffer)
 
+        self.stage_file(tar_info, contents)
+
+    def add_file(self, tar_info: tarfile.TarInfo, path: str) -> None:
+        if self.staging_directory is None:
+            with open(path, 'rb') as f:
+                self.tf.addfile(tar_info, f)
+
+            return
+
+        # Files are read once for both the archive and the staging directory
+        with open(path, 'rb') as f:
+            contents = f.read()
+
+        with closing(BytesIO(contents)) as buffer:
+            self.tf.addfile(tar_info, buffer)
+
+        self.stage_file(tar_info, contents)
+
+    def stage_file(self, tar_info: tarfile.TarInfo, contents: bytes) -> None:
+        """
+        Writes a file of the archive to the staging directory, if any, as it would be extracted.
+        """
+        if self.staging_directory is None:
+            return
+
+        path = os.path.join(self.staging_directory, *tar_info.name.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(contents)
+
+        os.chmod(path, tar_info.mode)
+
     def normalize_tar_metadata(self, tar_info: tarfile.TarInfo | None) -> tarfile.TarInfo | None:
         if not self.reproducible or tar_info is None:
             return tar_info
@@ -148,6 +181,27 @@ class SdistBuilder(BuilderInterface):
 
     PLUGIN_NAME = 'sdist'
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.__staging_directory: str | None = None
+
+    @contextmanager
+    def staged(self) -> Generator[str, None, None]:
+        """
+        Source distributions built while this is active are also written, uncompressed, to a temporary
+        directory. The path of the project as it would be extracted from the archive is yielded.
+        """
+        import shutil
+
+        staging_directory = tempfile.mkdtemp()
+        self.__staging_directory = staging_directory
+        try:
+            yield os.path.join(staging_directory, self.artifact_project_id)
+        finally:
+            self.__staging_directory = None
+            shutil.rmtree(staging_directory, ignore_errors=True)
+
     def get_version_api(self) -> dict[str, Callable]:
         return {'standard': self.build_standard}
 
@@ -166,8 +220,22 @@ class SdistBuilder(BuilderInterface):
     def build_standard(self, directory: str, **build_data: Any) -> str:
         found_packages = set()
 
-        with SdistArchive(self.artifact_project_id, reproducible=self.config.reproducible) as archive:
+        with SdistArchive(
+            self.artifact_project_id,
+            reproducible=self.config.reproducible,
+            staging_directory=self.__staging_directory,
+        ) as archive:
+            # Write the metadata first so that it can be read without decompressing the entire archive
+            archive.create_file(
+                self.config.core_metadata_constructor(self.metadata, extra_dependencies=build_data['dependencies']),
+                'PKG-INFO',
+            )
+
             for included_file in self.recurse_included_files():
+                # The metadata of a source distribution being rebuilt is superseded
+                if included_file.distribution_path == 'PKG-INFO':
+                    continue
+
                 if self.config.support_legacy:
                     possible_package, file_name = os.path.split(included_file.relative_path)
                     if file_name == '__init__.py':
@@ -183,17 +251,11 @@ class SdistBuilder(BuilderInterface):
                     continue
 
                 if tar_info.isfile():
-                    with open(included_file.path, 'rb') as f:
-                        archive.addfile(tar_info, f)
+                    archive.add_file(tar_info, included_file.path)
                 else:  # no cov
                     # TODO: Investigate if this is necessary (for symlinks, etc.)
                     archive.addfile(tar_info)
 
-            archive.create_file(
-                self.config.core_metadata_constructor(self.metadata, extra_dependencies=build_data['dependencies']),
-                'PKG-INFO',
-            )
-
             if self.config.support_legacy:
                 archive.create_file(
                     self.construct_setup_py_file(sorted(found_packages), extra_dependencies=build_data['dependencies']),
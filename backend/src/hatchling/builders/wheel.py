@@ -496,60 +496,13 @@ class WheelBuilder(BuilderInterface):
         return self.build_editable_detection(directory, **build_data)
 
     def build_editable_detection(self, directory: str, **build_data: Any) -> str:
-        from editables import EditableProject
-
         build_data['tag'] = self.get_default_tag()
 
+        editable_files, editable_dependencies = self.__get_detected_editable_files()
         with WheelArchive(
             self.artifact_project_id, reproducible=self.config.reproducible
         ) as archive, RecordFile() as records:
-            exposed_packages = {}
-            for included_file in self.recurse_selected_project_files():
-                if not included_file.path.endswith('.py'):
-                    continue
-
-                relative_path = included_file.relative_path
-                distribution_path = included_file.distribution_path
-                path_parts = relative_path.split(os.sep)
-
-                # Root file
-                if len(path_parts) == 1:  # no cov
-                    exposed_packages[os.path.splitext(relative_path)[0]] = os.path.join(self.root, relative_path)
-                    continue
-
-                # Root package
-                root_module = path_parts[0]
-                if distribution_path == relative_path:
-                    exposed_packages[root_module] = os.path.join(self.root, root_module)
-                else:
-                    distribution_module = distribution_path.split(os.sep)[0]
-                    try:
-                        exposed_packages[distribution_module] = os.path.join(
-                            self.root,
-                            f'{relative_path[: relative_path.index(distribution_path)]}{distribution_module}',
-                        )
-                    except ValueError:
-                        message = (
-                            'Dev mode installations are unsupported when any path rewrite in the `sources` option '
-                            'changes a prefix rather than removes it, see: '
-                            'https://github.com/pfmoore/editables/issues/20'
-                        )
-                        raise ValueError(message) from None
-
-            editable_project = EditableProject(self.metadata.core.name, self.root)
-
-            if self.config.dev_mode_exact:
-                for module, relative_path in exposed_packages.items():
-                    editable_project.map(module, relative_path)
-            else:
-                for relative_path in exposed_packages.values():
-                    editable_project.add_to_path(os.path.dirname(relative_path))
-
-            for raw_filename, content in sorted(editable_project.files()):
-                filename = raw_filename
-                if filename.endswith('.pth') and not filename.startswith('_'):
-                    filename = f'_{filename}'
-
+            for filename, content in editable_files:
                 record = archive.write_file(filename, content)
                 records.write(record)
 
@@ -558,7 +511,7 @@ class WheelBuilder(BuilderInterface):
                 records.write(record)
 
             extra_dependencies = list(build_data['dependencies'])
-            for raw_dependency in editable_project.dependencies():
+            for raw_dependency in editable_dependencies:
                 dependency = raw_dependency
                 if dependency == 'editables':
                     dependency = EDITABLES_REQUIREMENT
@@ -584,13 +537,9 @@ class WheelBuilder(BuilderInterface):
         with WheelArchive(
             self.artifact_project_id, reproducible=self.config.reproducible
         ) as archive, RecordFile() as records:
-            directories = sorted(
-                os.path.normpath(os.path.join(self.root, relative_directory))
-                for relative_directory in self.config.dev_mode_dirs
-            )
-
-            record = archive.write_file(f"_{self.metadata.core.name.replace('-', '_')}.pth", '\n'.join(directories))
-            records.write(record)
+            for filename, content in self.get_editable_files():
+                record = archive.write_file(filename, content)
+                records.write(record)
 
             for included_file in self.recurse_forced_files(self.get_forced_inclusion_map(build_data)):
                 record = archive.add_file(included_file)
@@ -607,6 +556,88 @@ class WheelBuilder(BuilderInterface):
         normalize_artifact_permissions(target)
         return target
 
+    def get_editable_files(self) -> list[tuple[str, str]]:
+        """
+        Returns the name and contents of every file that exposes the project to editable installations. These
+        are placed at the root of the installation and only depend on the selected project files.
+        """
+        if self.config.dev_mode_dirs:
+            directories = sorted(
+                os.path.normpath(os.path.join(self.root, relative_directory))
+                for relative_directory in self.config.dev_mode_dirs
+            )
+            return [(f"_{self.metadata.core.name.replace('-', '_')}.pth", '\n'.join(directories))]
+
+        editable_files, _ = self.__get_detected_editable_files()
+        return editable_files
+
+    def get_exposed_packages(self) -> dict[str, str]:
+        """
+        Returns the top-level modules and packages of the selected project files mapped to their location.
+        """
+        exposed_packages = {}
+        for included_file in self.recurse_selected_project_files():
+            if not included_file.path.endswith('.py'):
+                continue
+
+            relative_path = included_file.relative_path
+            distribution_path = included_file.distribution_path
+            path_parts = relative_path.split(os.sep)
+
+            # Root file
+            if len(path_parts) == 1:  # no cov
+                exposed_packages[os.path.splitext(relative_path)[0]] = os.path.join(self.root, relative_path)
+                continue
+
+            # Root package
+            root_module = path_parts[0]
+            if distribution_path == relative_path:
+                exposed_packages[root_module] = os.path.join(self.root, root_module)
+            else:
+                distribution_module = distribution_path.split(os.sep)[0]
+                try:
+                    exposed_packages[distribution_module] = os.path.join(
+                        self.root,
+                        f'{relative_path[: relative_path.index(distribution_path)]}{distribution_module}',
+                    )
+                except ValueError:
+                    message = (
+                        'Dev mode installations are unsupported when any path rewrite in the `sources` option '
+                        'changes a prefix rather than removes it, see: '
+                        'https://github.com/pfmoore/editables/issues/20'
+                    )
+                    raise ValueError(message) from None
+
+        return exposed_packages
+
+    def __get_detected_editable_files(self) -> tuple[list[tuple[str, str]], list[str]]:
+        exposed_packages = self.get_exposed_packages()
+        if not self.config.dev_mode_exact:
+            # Equivalent to adding every directory to the path of an `editables` project, which is then not
+            # required to determine the files of editable installations
+            import re
+            from pathlib import Path
+
+            project_name = re.sub(r'[-_.]+', '_', self.metadata.core.name).lower()
+            path_entries = [str(Path(os.path.dirname(path)).resolve()) for path in exposed_packages.values()]
+            return ([(f'_{project_name}.pth', '\n'.join(path_entries))] if path_entries else []), []
+
+        from editables import EditableProject
+
+        editable_project = EditableProject(self.metadata.core.name, self.root)
+        for module, relative_path in exposed_packages.items():
+            editable_project.map(module, relative_path)
+
+        editable_files = []
+        for raw_filename, content in sorted(editable_project.files()):
+            filename = raw_filename
+            if filename.endswith('.pth') and not filename.startswith('_'):
+                filename = f'_{filename}'
+
+            editable_files.append((filename, content))
+
+        return editable_files, editable_project.dependencies()
+
     def write_data(
         self, archive: WheelArchive, records: RecordFile, build_data: dict[str, Any], extra_dependencies: Sequence[str]
     ) -> None:
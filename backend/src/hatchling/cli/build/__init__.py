@@ -15,8 +15,11 @@ def build_impl(
     clean_hooks_after: bool,
     clean_only: bool,
     show_dynamic_deps: bool,
+    wheel_from_sdist: bool,
+    artifacts_file: str | None = None,
 ) -> None:
     import os
+    from contextlib import ExitStack
 
     from hatchling.bridge.app import Application
     from hatchling.builders.constants import BuildEnvVars
@@ -42,6 +45,15 @@ def build_impl(
         target_data['sdist'] = []
         target_data['wheel'] = []
 
+    if wheel_from_sdist:
+        if set(target_data) - {'sdist', 'wheel'}:
+            app.abort('Only the `sdist` and `wheel` targets may be built with --wheel-from-sdist')
+        elif 'editable' in target_data.get('wheel', []):
+            app.abort('The `editable` wheel version cannot be built with --wheel-from-sdist')
+
+        # The wheel is built from the files of the source distribution
+        target_data = {'sdist': target_data.get('sdist', []), 'wheel': target_data.get('wheel', [])}
+
     builders = {}
     unknown_targets = []
     for target_name in target_data:
@@ -61,36 +73,62 @@ def build_impl(
         os.environ[BuildEnvVars.NO_HOOKS] = 'true'
 
     dynamic_dependencies: dict[str, None] = {}
-    for i, (target_name, versions) in enumerate(target_data.items()):
-        # Separate targets with a blank line
-        if not (clean_only or show_dynamic_deps) and i != 0:  # no cov
-            app.display_info()
-
-        builder_class = builders[target_name]
-
-        # Display name before instantiation in case of errors
-        if not (clean_only or show_dynamic_deps) and len(target_data) > 1:
-            app.display_mini_header(target_name)
-
-        builder = builder_class(root, plugin_manager=plugin_manager, metadata=metadata, app=app.get_safe_application())
-        if show_dynamic_deps:
-            for dependency in builder.config.dynamic_dependencies:
-                dynamic_dependencies[dependency] = None
-
-            continue
-
-        for artifact in builder.build(
-            directory=directory,
-            versions=versions,
-            hooks_only=hooks_only,
-            clean=clean,
-            clean_hooks_after=clean_hooks_after,
-            clean_only=clean_only,
-        ):
-            if os.path.isfile(artifact) and artifact.startswith(root):
-                app.display_info(os.path.relpath(artifact, root))
-            else:  # no cov
-                app.display_info(artifact)
+    artifacts: list[str] = []
+    staged_root = ''
+    with ExitStack() as stack:
+        for i, (target_name, versions) in enumerate(target_data.items()):
+            # Separate targets with a blank line
+            if not (clean_only or show_dynamic_deps) and i != 0:  # no cov
+                app.display_info()
+
+            builder_class = builders[target_name]
+
+            # Display name before instantiation in case of errors
+            if not (clean_only or show_dynamic_deps) and len(target_data) > 1:
+                app.display_mini_header(target_name)
+
+            builder = builder_class(
+                root, plugin_manager=plugin_manager, metadata=metadata, app=app.get_safe_application()
+            )
+            if show_dynamic_deps:
+                for dependency in builder.config.dynamic_dependencies:
+                    dynamic_dependencies[dependency] = None
+
+                continue
+
+            target_directory = directory
+            if wheel_from_sdist and not (clean_only or hooks_only) and target_name == 'sdist':
+                staged_root = stack.enter_context(builder.staged())
+            elif staged_root and target_name == 'wheel':
+                # The output directory is still relative to the project rather than the source distribution
+                if target_directory is None:
+                    target_directory = (
+                        builder.config.normalize_build_directory(os.environ[BuildEnvVars.LOCATION])
+                        if BuildEnvVars.LOCATION in os.environ
+                        else builder.config.directory
+                    )
+
+                builder = builder_class(staged_root, plugin_manager=plugin_manager, app=app.get_safe_application())
+
+            for artifact in builder.build(
+                directory=target_directory,
+                versions=versions,
+                hooks_only=hooks_only,
+                clean=clean,
+                clean_hooks_after=clean_hooks_after,
+                clean_only=clean_only,
+            ):
+                if os.path.isfile(artifact):
+                    artifacts.append(os.path.abspath(artifact))
+
+                if os.path.isfile(artifact) and artifact.startswith(root):
+                    app.display_info(os.path.relpath(artifact, root))
+                else:  # no cov
+                    app.display_info(artifact)
+
+    if artifacts_file is not None:
+        with open(artifacts_file, 'w', encoding='utf-8') as f:
+            f.writelines(f'{artifact}\n' for artifact in artifacts)
 
     if show_dynamic_deps:
         app.display(str(list(dynamic_dependencies)))
@@ -115,5 +153,12 @@ def build_command(subparsers: argparse._SubParsersAction, defaults: Any) -> None
     parser.add_argument('--clean-hooks-after', dest='clean_hooks_after', action='store_true', default=None)
     parser.add_argument('--clean-only', dest='clean_only', action='store_true')
     parser.add_argument('--show-dynamic-deps', dest='show_dynamic_deps', action='store_true')
+    parser.add_argument(
+        '--wheel-from-sdist',
+        dest='wheel_from_sdist',
+        action='store_true',
+        help='Build the wheel from the files of the source distribution',
+    )
+    parser.add_argument('--artifacts-file', dest='artifacts_file', help=argparse.SUPPRESS)
     parser.add_argument('--app', dest='called_by_app', action='store_true', help=argparse.SUPPRESS)
     parser.set_defaults(func=build_impl)
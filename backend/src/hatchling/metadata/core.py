@@ -11,6 +11,7 @@ from hatchling.metadata.utils import (
     is_valid_project_name,
     normalize_project_name,
     normalize_requirement,
+    parse_requirement,
 )
 from hatchling.plugin.manager import PluginManagerBound
 from hatchling.utils.constants import DEFAULT_CONFIG_FILE
@@ -265,6 +266,39 @@ class ProjectMetadata(Generic[PluginManagerBound]):
         _ = self.version
         self.core.validate_fields()
 
+    def get_cache_inputs(self) -> dict[str, list[str]] | None:
+        """
+        Returns the files, relative to the project root, and the environment variables that determine the
+        resolved metadata, or `None` if the version source or any metadata hook does not declare its inputs.
+        """
+        import json
+        import re
+
+        files = ['pyproject.toml', DEFAULT_CONFIG_FILE, 'PKG-INFO']
+        # Context formatting of fields like dependencies may read environment variables
+        env_vars = sorted(set(re.findall(r'\{env:([^:}]+)', json.dumps(self.config))))
+
+        inputs_providers: list[VersionSourceInterface | MetadataHookInterface] = []
+        if 'version' in self.dynamic:
+            inputs_providers.append(self.hatch.version.source)
+
+        inputs_providers.extend(self.hatch.metadata.hooks.values())
+        for inputs_provider in inputs_providers:
+            inputs = inputs_provider.get_cache_inputs()
+            if inputs is None:
+                return None
+
+            files.extend(inputs.get('files', []))
+            env_vars.extend(inputs.get('env-vars', []))
+
+            # The hook class is loaded from a script that is not part of the configuration
+            if inputs_provider.PLUGIN_NAME == 'custom':
+                from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+                files.append(inputs_provider.config.get('path', DEFAULT_BUILD_SCRIPT))
+
+        return {'files': list(dict.fromkeys(files)), 'env-vars': list(dict.fromkeys(env_vars))}
+
 
 class BuildMetadata:
     """
@@ -283,7 +317,7 @@ class BuildMetadata:
     @property
     def requires_complex(self) -> list[Requirement]:
         if self._requires_complex is None:
-            from packaging.requirements import InvalidRequirement, Requirement
+            from packaging.requirements import InvalidRequirement
 
             requires = self.config.get('requires', [])
             if not isinstance(requires, list):
@@ -298,7 +332,7 @@ class BuildMetadata:
                     raise TypeError(message)
 
                 try:
-                    requires_complex.append(Requirement(entry))
+                    requires_complex.append(parse_requirement(entry))
                 except InvalidRequirement as e:
                     message = f'Dependency #{i} of field `build-system.requires` is invalid: {e}'
                     raise ValueError(message) from None
@@ -1167,7 +1201,7 @@ class CoreMetadata:
         https://peps.python.org/pep-0621/#dependencies-optional-dependencies
         """
         if self._dependencies_complex is None:
-            from packaging.requirements import InvalidRequirement, Requirement
+            from packaging.requirements import InvalidRequirement
 
             if 'dependencies' in self.config:
                 dependencies = self.config['dependencies']
@@ -1192,7 +1226,7 @@ class CoreMetadata:
                     raise TypeError(message)
 
                 try:
-                    requirement = Requirement(self.context.format(entry))
+                    requirement = parse_requirement(self.context.format(entry))
                 except InvalidRequirement as e:
                     message = f'Dependency #{i} of field `project.dependencies` is invalid: {e}'
                     raise ValueError(message) from None
@@ -1227,7 +1261,7 @@ class CoreMetadata:
         https://peps.python.org/pep-0621/#dependencies-optional-dependencies
         """
         if self._optional_dependencies_complex is None:
-            from packaging.requirements import InvalidRequirement, Requirement
+            from packaging.requirements import InvalidRequirement
 
             if 'optional-dependencies' in self.config:
                 optional_dependencies = self.config['optional-dependencies']
@@ -1284,7 +1318,7 @@ class CoreMetadata:
                         raise TypeError(message)
 
                     try:
-                        requirement = Requirement(self.context.format(entry))
+                        requirement = parse_requirement(self.context.format(entry))
                     except InvalidRequirement as e:
                         message = (
                             f'Dependency #{i} of option `{option}` of field `project.optional-dependencies` '
@@ -64,3 +64,15 @@ class MetadataHookInterface(ABC):  # no cov
         This returns extra classifiers that should be considered valid in addition to the ones known to PyPI.
         """
         return []
+
+    def get_cache_inputs(self) -> dict[str, list[str]] | None:  # noqa: PLR6301
+        """
+        This should return the inputs that fully determine the metadata updates besides the project configuration,
+        allowing resolved metadata to be cached. The mapping may contain the following keys:
+
+        - `files` - paths relative to the project root whose contents are read
+        - `env-vars` - names of environment variables that are read
+
+        The default is `None`, meaning that the metadata must be resolved every time.
+        """
+        return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -21,6 +22,32 @@ def normalize_project_name(project_name: str) -> str:
     return re.sub(r'[-_.]+', '-', project_name).lower()
 
 
+def parse_requirement(requirement: str) -> Requirement:
+    """
+    Parse a requirement string, reusing prior results for identical strings. A new object is always
+    returned because callers like `normalize_requirement` modify requirements in place.
+    """
+    from packaging.requirements import Requirement
+
+    parsed = _parse_requirement(requirement)
+
+    # Copying the attributes is orders of magnitude faster than parsing or `copy.copy`
+    new_requirement = Requirement.__new__(Requirement)
+    new_requirement.name = parsed.name
+    new_requirement.url = parsed.url
+    new_requirement.extras = set(parsed.extras)
+    new_requirement.specifier = parsed.specifier
+    new_requirement.marker = parsed.marker
+    return new_requirement
+
+
+@lru_cache(maxsize=4096)
+def _parse_requirement(requirement: str) -> Requirement:
+    from packaging.requirements import Requirement
+
+    return Requirement(requirement)
+
+
 def normalize_requirement(requirement: Requirement) -> None:
     # Changes to this function affect reproducibility between versions
     from packaging.specifiers import SpecifierSet
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-from typing import Callable, TypeVar
+import json
+import os
+import sys
+from typing import Any, Callable, TypeVar
 
 import pluggy
 
 
 class PluginManager:
-    def __init__(self) -> None:
+    def __init__(self, *, index_directory: str | None = None) -> None:
+        if index_directory is None:
+            from hatchling.builders.constants import BuildEnvVars
+
+            # Frontends such as Hatch choose where builds persist the index
+            index_directory = os.environ.get(BuildEnvVars.PLUGIN_INDEX_DIR) or None
+
         self.manager = pluggy.PluginManager('hatch')
-        self.third_party_plugins = ThirdPartyPlugins(self.manager)
+        self.third_party_plugins = ThirdPartyPlugins(self.manager, index_directory=index_directory)
         self.initialized = False
 
     def initialize(self) -> None:
@@ -95,17 +104,151 @@ class ClassRegister:
             if name in classes:
                 return classes[name]
 
+            # Only import the third-party plugins that are known to provide the name
+            if self.third_party_plugins.load_providers(self.registration_method.name, name):
+                return self.collect(include_third_party=False).get(name)
+
         return self.collect().get(name)
 
 
 class ThirdPartyPlugins:
-    def __init__(self, manager: pluggy.PluginManager) -> None:
+    def __init__(self, manager: pluggy.PluginManager, *, index_directory: str | None = None) -> None:
         self.manager = manager
+        self.index_directory = index_directory
         self.loaded = False
 
+        self._index: dict[str, Any] | None = None
+        self._index_loaded = False
+
+    @property
+    def index_path(self) -> str | None:
+        if self.index_directory is None:
+            return None
+
+        from hashlib import sha256
+
+        # Every interpreter has its own set of installed distributions
+        return os.path.join(self.index_directory, f'{sha256(str(sys.executable).encode()).hexdigest()[:16]}.json')
+
+    @property
+    def index(self) -> dict[str, Any] | None:
+        if not self._index_loaded:
+            self._index = self._read_index()
+            self._index_loaded = True
+
+        return self._index
+
     def load(self) -> None:
-        self.manager.load_setuptools_entrypoints('hatch')
+        from importlib.metadata import distributions
+
+        entry_points: dict[str, str] = {}
+        for dist in list(distributions()):
+            for entry_point in dist.entry_points:
+                if entry_point.group != 'hatch' or entry_point.name in entry_points:
+                    continue
+
+                entry_points[entry_point.name] = entry_point.value
+                self._load_entry_point(entry_point.name, entry_point.value)
+
         self.loaded = True
+        self._write_index(entry_points)
+
+    def load_providers(self, hook_name: str, plugin_name: str) -> bool:
+        """
+        Load only the entry points that registered `plugin_name` for `hook_name` according to the index.
+        Returns `False` when there is no usable index and therefore every entry point must be loaded.
+        """
+        index = self.index
+        if index is None:
+            return False
+
+        for entry_point_name in index['plugins'].get(hook_name, {}).get(plugin_name, []):
+            self._load_entry_point(entry_point_name, index['entry_points'][entry_point_name])
+
+        return True
+
+    def _load_entry_point(self, name: str, value: str) -> None:
+        if self.manager.get_plugin(name) or self.manager.is_blocked(name):
+            return
+
+        from importlib.metadata import EntryPoint
+
+        plugin = EntryPoint(name, value, 'hatch').load()
+        self.manager.register(plugin, name=name)
+
+    def _read_index(self) -> dict[str, Any] | None:
+        index_path = self.index_path
+        if index_path is None:
+            return None
+
+        try:
+            with open(index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(index, dict) or index.get('key') != get_site_packages_key():
+            return None
+
+        return index
+
+    def _write_index(self, entry_points: dict[str, str]) -> None:
+        index_path = self.index_path
+        if index_path is None or (self.index is not None and self.index['entry_points'] == entry_points):
+            return
+
+        plugins: dict[str, dict[str, list[str]]] = {}
+        for entry_point_name in entry_points:
+            plugin = self.manager.get_plugin(entry_point_name)
+            if plugin is None:
+                continue
+
+            for hook_caller in self.manager.get_hookcallers(plugin) or []:
+                for hook_impl in hook_caller.get_hookimpls():
+                    if hook_impl.plugin is not plugin:
+                        continue
+
+                    registered_classes = hook_impl.function()
+                    if not isinstance(registered_classes, list):
+                        registered_classes = [registered_classes]
+
+                    for registered_class in registered_classes:
+                        plugin_name = getattr(registered_class, 'PLUGIN_NAME', None)
+                        if plugin_name:
+                            plugins.setdefault(hook_caller.name, {}).setdefault(plugin_name, []).append(
+                                entry_point_name
+                            )
+
+        index = {'key': get_site_packages_key(), 'entry_points': entry_points, 'plugins': plugins}
+        temp_path = f'{index_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+
+            os.replace(temp_path, index_path)
+        except OSError:  # no cov
+            pass
+
+        self._index = index
+        self._index_loaded = True
+
+
+def get_site_packages_key() -> list[list[Any]]:
+    # Installing or removing a distribution adds or removes its metadata directory,
+    # which changes the modification time of the containing import path entry
+    key: list[list[Any]] = []
+    for entry in sys.path:
+        # The current directory changes too often to be meaningful
+        if not entry:
+            continue
+
+        try:
+            key.append([entry, os.stat(entry or os.curdir).st_mtime_ns])
+        except OSError:
+            key.append([entry, None])
+
+    return key
 
 
 PluginManagerBound = TypeVar('PluginManagerBound', bound=PluginManager)
@@ -62,3 +62,14 @@ class CodeSource(VersionSourceInterface):
     def set_version(self, version: str, version_data: dict) -> None:  # noqa: ARG002, PLR6301
         message = 'Cannot rewrite loaded code'
         raise NotImplementedError(message)
+
+    def get_cache_inputs(self) -> dict[str, list[str]] | None:
+        relative_path = self.config.get('path')
+        if not relative_path or not isinstance(relative_path, str):
+            return None
+
+        # Modules imported from the search paths cannot be tracked
+        if self.config.get('search-paths'):
+            return None
+
+        return {'files': [relative_path]}
@@ -27,3 +27,10 @@ class EnvSource(VersionSourceInterface):
     def set_version(self, version: str, version_data: dict) -> None:  # noqa: ARG002, PLR6301
         message = 'Cannot set environment variables'
         raise NotImplementedError(message)
+
+    def get_cache_inputs(self) -> dict[str, list[str]] | None:
+        variable = self.config.get('variable', '')
+        if not variable or not isinstance(variable, str):
+            return None
+
+        return {'env-vars': [variable]}
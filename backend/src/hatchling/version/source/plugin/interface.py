@@ -67,3 +67,15 @@ class VersionSourceInterface(ABC):  # no cov
         This should update the version to the first argument with the data provided during retrieval.
         """
         raise NotImplementedError
+
+    def get_cache_inputs(self) -> dict[str, list[str]] | None:  # noqa: PLR6301
+        """
+        This should return the inputs that fully determine the version besides the project configuration,
+        allowing resolved metadata to be cached. The mapping may contain the following keys:
+
+        - `files` - paths relative to the project root whose contents are read
+        - `env-vars` - names of environment variables that are read
+
+        The default is `None`, meaning that the version must be resolved every time.
+        """
+        return None
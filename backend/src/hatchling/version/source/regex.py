@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from hatchling.version.core import VersionFile
 from hatchling.version.source.plugin.interface import VersionSourceInterface
 
@@ -27,3 +29,10 @@ class RegexSource(VersionSourceInterface):
 
     def set_version(self, version: str, version_data: dict) -> None:  # noqa: PLR6301
         version_data['version_file'].set_version(version)
+
+    def get_cache_inputs(self) -> dict[str, list[str]] | None:
+        relative_path = self.config.get('path', '')
+        if not relative_path or not isinstance(relative_path, str):
+            return None
+
+        return {'files': [relative_path]}
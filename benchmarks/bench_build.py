@@ -0,0 +1,33 @@
+import pytest
+
+from benchmarks.conftest import PROJECT_SIZES, clean_directory
+
+
+@pytest.mark.parametrize('num_files', PROJECT_SIZES)
+def test_wheel(benchmark, run, synthetic_project, num_files):
+    project_root = synthetic_project(num_files)
+    output_dir = project_root / 'dist'
+
+    benchmark.pedantic(
+        run,
+        args=('-m', 'hatchling', 'build', '-t', 'wheel'),
+        kwargs={'cwd': project_root},
+        setup=lambda: clean_directory(output_dir),
+        rounds=3,
+        warmup_rounds=1,
+    )
+
+
+@pytest.mark.parametrize('num_files', PROJECT_SIZES)
+def test_sdist(benchmark, run, synthetic_project, num_files):
+    project_root = synthetic_project(num_files)
+    output_dir = project_root / 'dist'
+
+    benchmark.pedantic(
+        run,
+        args=('-m', 'hatchling', 'build', '-t', 'sdist'),
+        kwargs={'cwd': project_root},
+        setup=lambda: clean_directory(output_dir),
+        rounds=3,
+        warmup_rounds=1,
+    )
@@ -0,0 +1,30 @@
+import pytest
+
+
+def test_import(benchmark, run):
+    benchmark(run, '-c', 'import hatch.cli')
+
+
+def test_version_option(benchmark, run):
+    benchmark(run, '-m', 'hatch', '--version')
+
+
+def test_env_show(benchmark, run, project):
+    benchmark(run, '-m', 'hatch', 'env', 'show', cwd=project)
+
+
+def test_run_warm_environment(benchmark, run, project):
+    benchmark(run, '-m', 'hatch', 'run', 'python', '-c', 'pass', cwd=project)
+
+
+def test_dep_hash(benchmark, run, project):
+    benchmark(run, '-m', 'hatch', 'dep', 'hash', cwd=project)
+
+
+def test_version(benchmark, run, project):
+    benchmark(run, '-m', 'hatch', 'version', cwd=project)
+
+
+@pytest.mark.parametrize('field', ['name', 'version'])
+def test_project_metadata(benchmark, run, project, field):
+    benchmark(run, '-m', 'hatch', 'project', 'metadata', field, cwd=project)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import Callable, Generator
+
+import pytest
+
+from hatch.utils.fs import Path, temp_directory
+from hatch.utils.structures import EnvVars
+
+# The number of source files in the synthetic projects used for build benchmarks
+PROJECT_SIZES = (100, 10_000, 100_000)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--max-project-size',
+        type=int,
+        default=max(PROJECT_SIZES),
+        help='Skip build benchmarks for synthetic projects with more files than this',
+    )
+
+
+@pytest.fixture(scope='session', autouse=True)
+def isolation() -> Generator[Path, None, None]:
+    with temp_directory() as d:
+        data_dir = d / 'data'
+        data_dir.mkdir()
+        cache_dir = d / 'cache'
+        cache_dir.mkdir()
+        config_file = d / 'config.toml'
+        config_file.touch()
+
+        env_vars = {
+            'HATCH_DATA_DIR': str(data_dir),
+            'HATCH_CACHE_DIR': str(cache_dir),
+            'HATCH_CONFIG': str(config_file),
+            'HATCH_INTERACTIVE': 'false',
+            'NO_COLOR': '1',
+        }
+        with EnvVars(env_vars):
+            yield d
+
+
+@pytest.fixture(scope='session')
+def run() -> Callable[..., subprocess.CompletedProcess]:
+    def run(*args: str, cwd: Path | None = None) -> subprocess.CompletedProcess:
+        process = subprocess.run(
+            [sys.executable, *args], cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=False
+        )
+        if process.returncode:  # no cov
+            raise AssertionError(process.stdout.decode('utf-8'))
+
+        return process
+
+    return run
+
+
+@pytest.fixture(scope='session')
+def project(isolation, run) -> Path:
+    project_root = isolation / 'projects' / 'my-app'
+    package_root = project_root / 'src' / 'my_app'
+    package_root.ensure_dir_exists()
+    (package_root / '__init__.py').touch()
+    (package_root / '__about__.py').write_text("__version__ = '0.0.1'\n")
+    (project_root / 'pyproject.toml').write_text(
+        """\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "my-app"
+dynamic = ["version"]
+dependencies = ["packaging", "tomli; python_version < '3.11'"]
+
+[tool.hatch.version]
+path = "src/my_app/__about__.py"
+
+[tool.hatch.envs.default]
+dependencies = ["pytest"]
+"""
+    )
+
+    # Environments are created outside of the timed runs
+    run('-m', 'hatch', 'env', 'create', cwd=project_root)
+    run('-m', 'hatch', 'version', cwd=project_root)
+
+    return project_root
+
+
+@pytest.fixture(scope='session')
+def synthetic_project(isolation, request) -> Callable[[int], Path]:
+    max_project_size = request.config.getoption('--max-project-size')
+    projects: dict[int, Path] = {}
+
+    def generate(num_files: int) -> Path:
+        if num_files > max_project_size:
+            pytest.skip(f'Project size {num_files} exceeds --max-project-size={max_project_size}')
+
+        if num_files in projects:
+            return projects[num_files]
+
+        project_root = isolation / 'synthetic' / f'files-{num_files}'
+        package_root = project_root / 'src' / 'synthetic'
+        package_root.ensure_dir_exists()
+        (package_root / '__init__.py').touch()
+        (project_root / 'pyproject.toml').write_text(
+            """\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "synthetic"
+version = "0.0.1"
+"""
+        )
+
+        # Keep directories reasonably sized like real projects
+        files_per_directory = 100
+        for i in range(num_files):
+            directory = package_root / f'module{i // files_per_directory}'
+            if not i % files_per_directory:
+                directory.mkdir()
+                (directory / '__init__.py').touch()
+
+            (directory / f'file{i}.py').write_text(f'VALUE = {i}\n')
+
+        projects[num_files] = project_root
+        return project_root
+
+    return generate
+
+
+def clean_directory(path: Path) -> None:
+    if path.is_dir():
+        path.remove()
+
+    os.makedirs(path)
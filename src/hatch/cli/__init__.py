@@ -19,6 +19,7 @@ from hatch.cli.publish import publish
 from hatch.cli.python import python
 from hatch.cli.run import run
 from hatch.cli.self import self_command
+from hatch.cli.server import server
 from hatch.cli.shell import shell
 from hatch.cli.status import status
 from hatch.cli.test import test
@@ -218,6 +219,7 @@ hatch.add_command(publish)
 hatch.add_command(python)
 hatch.add_command(run)
 hatch.add_command(self_command)
+hatch.add_command(server)
 hatch.add_command(shell)
 hatch.add_command(status)
 hatch.add_command(test)
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
     from packaging.requirements import Requirement
 
     from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.python.cache import ArchiveCache
+    from hatch.python.discovery import InterpreterRegistry
 
 
 class Application(Terminal):
@@ -52,7 +54,9 @@ class Application(Terminal):
         self.project.prepare_environment(environment)
 
     def run_shell_commands(self, context: ExecutionContext) -> None:
-        with context.env.command_context():
+        from hatch.utils.structures import EnvVars
+
+        with context.env.command_context(), EnvVars(context.get_module_search_path_env_vars()):
             try:
                 resolved_commands = list(context.env.resolve_commands(context.shell_commands))
             except Exception as e:  # noqa: BLE001
@@ -187,11 +191,61 @@ class Application(Terminal):
     def get_python_manager(self, directory: str | None = None):
         from hatch.python.core import PythonManager
 
+        archive_cache = self.get_python_archive_cache()
         configured_dir = directory or self.config.dirs.python
         if configured_dir == 'isolated':
-            return PythonManager(self.data_dir / 'pythons')
+            return PythonManager(self.data_dir / 'pythons', archive_cache)
+
+        return PythonManager(Path(configured_dir).expand(), archive_cache)
+
+    def get_python_archive_cache(self) -> ArchiveCache | None:
+        if self.cache_dir is None:
+            return None
+
+        from hatch.config.constants import PythonEnvVars
+        from hatch.python.cache import DEFAULT_MAX_SIZE, ArchiveCache
+
+        max_size = os.environ.get(PythonEnvVars.CACHE_MAX_SIZE, '')
+        if max_size and not max_size.isdigit():
+            self.abort(f'Environment variable `{PythonEnvVars.CACHE_MAX_SIZE}` must be a number of bytes')
 
-        return PythonManager(Path(configured_dir).expand())
+        return ArchiveCache(self.cache_dir / 'python-archives', int(max_size) if max_size else DEFAULT_MAX_SIZE)
+
+    def get_interpreter_registry(self) -> InterpreterRegistry:
+        from hatch.python.discovery import InterpreterRegistry
+
+        return InterpreterRegistry(None if self.data_dir is None else self.data_dir / 'interpreters.json')
+
+    def verify_artifacts(self, artifacts: list[Path], *, jobs: int | None = None) -> None:
+        """
+        Verifies artifacts concurrently and records their digests in the checksum manifest of their
+        directories, aborting if any are invalid.
+        """
+        from hatch.index.checksums import update_manifests, verify_artifacts
+
+        with self.status(f'Verifying {len(artifacts)} artifact{"" if len(artifacts) == 1 else "s"}'):
+            results = verify_artifacts(artifacts, jobs=jobs)
+
+        for result in results:
+            artifact = result.artifact
+            displayed_path = (
+                str(artifact.relative_to(self.project.location))
+                if self.project.location in artifact.parents
+                else str(artifact)
+            )
+            self.display_info(f'{displayed_path} ...', end=' ')
+            if result.valid:
+                self.display_success('verified')
+            else:
+                self.display_error('failed')
+                for error in result.errors:
+                    self.display_error(f'  {error}')
+
+        update_manifests(results)
+
+        failed = sum(not result.valid for result in results)
+        if failed:
+            self.abort(f'Failed to verify {failed} artifact{"" if failed == 1 else "s"}')
 
     @cached_property
     def shell_data(self) -> tuple[str, str]:
@@ -6,6 +6,7 @@ import click
 
 if TYPE_CHECKING:
     from hatch.cli.application import Application
+    from hatch.utils.fs import Path
 
 
 @click.command(short_help='Build a project')
@@ -48,16 +49,44 @@ if TYPE_CHECKING:
         '[env var: `HATCH_BUILD_CLEAN_HOOKS_AFTER`]'
     ),
 )
+@click.option(
+    '--verify',
+    is_flag=True,
+    help=(
+        'Whether or not to verify the integrity of the artifacts in the output directory and record their '
+        'checksums for publishing'
+    ),
+)
+@click.option(
+    '--wheel-from-sdist',
+    is_flag=True,
+    help=(
+        'Whether or not to build the wheel from the files of the source distribution, ensuring that it is '
+        'complete. Both are built in a single pass that reads the project files once'
+    ),
+)
 @click.option('--clean-only', is_flag=True, hidden=True)
 @click.pass_obj
-def build(app: Application, location, targets, hooks_only, no_hooks, ext, clean, clean_hooks_after, clean_only):
+def build(
+    app: Application,
+    location,
+    targets,
+    hooks_only,
+    no_hooks,
+    ext,
+    clean,
+    clean_hooks_after,
+    verify,
+    wheel_from_sdist,
+    clean_only,
+):
     """Build a project."""
     app.ensure_environment_plugin_dependencies()
 
     from hatch.config.constants import AppEnvVars
     from hatch.project.config import env_var_enabled
     from hatch.project.constants import BUILD_BACKEND, DEFAULT_BUILD_DIRECTORY, BuildEnvVars
-    from hatch.utils.fs import Path
+    from hatch.utils.fs import Path, temp_directory
     from hatch.utils.runner import ExecutionContext
     from hatch.utils.structures import EnvVars
 
@@ -68,63 +97,169 @@ def build(app: Application, location, targets, hooks_only, no_hooks, ext, clean,
     elif not targets:
         targets = ('sdist', 'wheel')
 
+    build_backend = app.project.metadata.build.build_backend
+    if wheel_from_sdist:
+        if build_backend != BUILD_BACKEND:
+            app.abort(f'Building the wheel from the source distribution is not supported by `{build_backend}`')
+
+        target_names = {target.partition(':')[0] for target in targets}
+        if target_names - {'sdist', 'wheel'}:
+            app.abort('Only the `sdist` and `wheel` targets may be built with --wheel-from-sdist')
+
+        wheel_versions = {
+            version
+            for target in targets
+            if target.partition(':')[0] == 'wheel'
+            for version in target.partition(':')[2].split(',')
+        }
+        if 'editable' in wheel_versions:
+            app.abort('The `editable` wheel version cannot be built with --wheel-from-sdist')
+
+        # Both targets are built by a single command
+        sdist_targets = [target for target in targets if target.partition(':')[0] == 'sdist'] or ['sdist']
+        wheel_targets = [target for target in targets if target.partition(':')[0] == 'wheel'] or ['wheel']
+        targets = (*sdist_targets, *wheel_targets)
+        target_groups = [targets]
+    else:
+        target_groups = [(target,) for target in targets]
+
     env_vars = {}
     if app.verbose:
         env_vars[AppEnvVars.VERBOSE] = str(app.verbosity)
     elif app.quiet:
         env_vars[AppEnvVars.QUIET] = str(abs(app.verbosity))
 
-    with EnvVars(env_vars):
-        app.project.prepare_build_environment(targets=[target.split(':')[0] for target in targets])
+    # Only the artifacts produced by this build are verified
+    verify = verify and not (hooks_only or clean_only)
+    artifacts: list[Path] = []
 
-    build_backend = app.project.metadata.build.build_backend
-    with app.project.location.as_cwd(), app.project.build_env.get_env_vars():
-        for target in targets:
-            target_name, _, _ = target.partition(':')
-            if not clean_only:
-                app.display_header(target_name)
-
-            if build_backend != BUILD_BACKEND:
-                if target_name == 'sdist':
-                    directory = build_dir or app.project.location / DEFAULT_BUILD_DIRECTORY
-                    directory.ensure_dir_exists()
-                    artifact_path = app.project.build_frontend.build_sdist(directory)
-                elif target_name == 'wheel':
-                    directory = build_dir or app.project.location / DEFAULT_BUILD_DIRECTORY
-                    directory.ensure_dir_exists()
-                    artifact_path = app.project.build_frontend.build_wheel(directory)
+    # Hooks of backends other than Hatchling are all called by a single process
+    with app.project.build_frontend.session(), temp_directory() as temp_dir:
+        artifacts_file = temp_dir / 'artifacts.txt'
+        with EnvVars(env_vars):
+            app.project.prepare_build_environment(targets=[target.split(':')[0] for target in targets])
+
+        # The build environment may have a version of Hatchling that predates some options
+        build_options: list[str] = []
+        if build_backend == BUILD_BACKEND and (verify or wheel_from_sdist):
+            with app.project.location.as_cwd(), app.project.build_env.get_env_vars():
+                build_options = app.project.build_frontend.hatch.get_build_options()
+
+            if wheel_from_sdist and 'wheel_from_sdist' not in build_options:
+                app.abort('The version of Hatchling in the build environment does not support --wheel-from-sdist')
+
+        with app.project.location.as_cwd(), app.project.build_env.get_env_vars():
+            for target_group in target_groups:
+                target_name = ' -> '.join(dict.fromkeys(target.partition(':')[0] for target in target_group))
+                if not clean_only:
+                    app.display_header(target_name)
+
+                if build_backend != BUILD_BACKEND:
+                    if target_name == 'sdist':
+                        directory = build_dir or app.project.location / DEFAULT_BUILD_DIRECTORY
+                        directory.ensure_dir_exists()
+                        artifact_path = app.project.build_frontend.build_sdist(directory)
+                    elif target_name == 'wheel':
+                        directory = build_dir or app.project.location / DEFAULT_BUILD_DIRECTORY
+                        directory.ensure_dir_exists()
+                        artifact_path = app.project.build_frontend.build_wheel(directory)
+                    else:
+                        app.abort(f'Target `{target_name}` is not supported by `{build_backend}`')
+
+                    artifacts.append(artifact_path)
+                    app.display_info(
+                        str(artifact_path.relative_to(app.project.location))
+                        if app.project.location in artifact_path.parents
+                        else str(artifact_path)
+                    )
                 else:
-                    app.abort(f'Target `{target_name}` is not supported by `{build_backend}`')
+                    command = ['python', '-u', '-m', 'hatchling', 'build']
+                    for target in target_group:
+                        command.extend(('--target', target))
+
+                    if wheel_from_sdist:
+                        command.append('--wheel-from-sdist')
+
+                    # We deliberately pass the location unchanged so that absolute paths may be non-local
+                    # and reflect wherever builds actually take place
+                    if location:
+                        command.extend(('--directory', location))
+
+                    if hooks_only or env_var_enabled(BuildEnvVars.HOOKS_ONLY):
+                        command.append('--hooks-only')
+
+                    if no_hooks or env_var_enabled(BuildEnvVars.NO_HOOKS):
+                        command.append('--no-hooks')
+
+                    if clean or env_var_enabled(BuildEnvVars.CLEAN):
+                        command.append('--clean')
+
+                    if clean_hooks_after or env_var_enabled(BuildEnvVars.CLEAN_HOOKS_AFTER):
+                        command.append('--clean-hooks-after')
+
+                    if clean_only:
+                        command.append('--clean-only')
+
+                    # Otherwise, the artifacts are the files of the output directories that changed
+                    output_files: dict[Path, tuple[int, int]] = {}
+                    if verify and 'artifacts_file' in build_options:
+                        command.extend(('--artifacts-file', str(artifacts_file)))
+                    elif verify:
+                        output_directories = get_output_directories(app, location, target_group)
+                        output_files = get_file_states(output_directories)
+
+                    context = ExecutionContext(app.project.build_env)
+                    context.add_shell_command(command)
+                    context.env_vars.update(env_vars)
+                    app.execute_context(context)
+
+                    if verify and artifacts_file.is_file():
+                        artifacts.extend(Path(path) for path in artifacts_file.read_text(encoding='utf-8').splitlines())
+                        artifacts_file.unlink()
+                    elif verify and 'artifacts_file' not in build_options:
+                        artifacts.extend(
+                            path
+                            for path, state in get_file_states(output_directories).items()
+                            if output_files.get(path) != state
+                        )
+
+    if verify:
+        from hatch.index.checksums import ARTIFACT_EXTENSIONS
+
+        artifacts = [artifact for artifact in artifacts if artifact.name.endswith(ARTIFACT_EXTENSIONS)]
+        if not artifacts:
+            app.abort('No artifacts were built')
+
+        app.display_header('verify')
+        app.verify_artifacts(artifacts)
+
+
+def get_output_directories(app: Application, location: str | None, targets: tuple[str, ...]) -> list[Path]:
+    import os
 
-                app.display_info(
-                    str(artifact_path.relative_to(app.project.location))
-                    if app.project.location in artifact_path.parents
-                    else str(artifact_path)
-                )
-            else:
-                command = ['python', '-u', '-m', 'hatchling', 'build', '--target', target]
+    from hatch.project.constants import BuildEnvVars
 
-                # We deliberately pass the location unchanged so that absolute paths may be non-local
-                # and reflect wherever builds actually take place
-                if location:
-                    command.extend(('--directory', location))
+    # Relative locations are resolved by the backend from the project root, which is the current directory
+    if location:
+        return [app.project.location / location]
 
-                if hooks_only or env_var_enabled(BuildEnvVars.HOOKS_ONLY):
-                    command.append('--hooks-only')
+    if BuildEnvVars.LOCATION in os.environ:
+        return [app.project.location / os.environ[BuildEnvVars.LOCATION]]
 
-                if no_hooks or env_var_enabled(BuildEnvVars.NO_HOOKS):
-                    command.append('--no-hooks')
+    return [
+        app.project.location / app.project.config.build.target(target.partition(':')[0]).directory for target in targets
+    ]
 
-                if clean or env_var_enabled(BuildEnvVars.CLEAN):
-                    command.append('--clean')
 
-                if clean_hooks_after or env_var_enabled(BuildEnvVars.CLEAN_HOOKS_AFTER):
-                    command.append('--clean-hooks-after')
+def get_file_states(directories: list[Path]) -> dict[Path, tuple[int, int]]:
+    states: dict[Path, tuple[int, int]] = {}
+    for directory in directories:
+        if not directory.is_dir():
+            continue
 
-                if clean_only:
-                    command.append('--clean-only')
+        for path in directory.iterdir():
+            if path.is_file():
+                stat = path.stat()
+                states[path] = (stat.st_mtime_ns, stat.st_size)
 
-                context = ExecutionContext(app.project.build_env)
-                context.add_shell_command(command)
-                context.env_vars.update(env_vars)
-                app.execute_context(context)
+    return states
@@ -70,9 +70,10 @@ def show(
         app.display(json.dumps(contextual_config, separators=(',', ':')))
         return
 
-    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.requirements import InvalidRequirement
 
-    from hatchling.metadata.utils import get_normalized_dependency, normalize_project_name
+    from hatch.utils.dep import normalize_dependency
+    from hatchling.metadata.utils import normalize_project_name
 
     if internal:
         target_standalone_envs = app.project.config.internal_envs
@@ -126,11 +127,9 @@ def show(
             normalized_dependencies = set()
             for dependency in dependencies:
                 try:
-                    req = Requirement(dependency)
+                    normalized_dependencies.add(normalize_dependency(dependency))
                 except InvalidRequirement:
                     normalized_dependencies.add(dependency)
-                else:
-                    normalized_dependencies.add(get_normalized_dependency(req))
 
             matrix_columns['Dependencies'][i] = '\n'.join(sorted(normalized_dependencies))
 
@@ -175,7 +174,7 @@ def show(
 
         if environment.environment_dependencies_complex:
             standalone_columns['Dependencies'][i] = '\n'.join(
-                sorted({get_normalized_dependency(d) for d in environment.environment_dependencies_complex})
+                sorted({normalize_dependency(str(d)) for d in environment.environment_dependencies_complex})
             )
 
         env_vars = dict(environment.env_vars)
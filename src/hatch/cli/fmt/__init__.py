@@ -14,6 +14,12 @@ if TYPE_CHECKING:
 @click.option('--linter', '-l', is_flag=True, help='Only run the linter')
 @click.option('--formatter', '-f', is_flag=True, help='Only run the formatter')
 @click.option('--sync', is_flag=True, help='Sync the default config file with the current version of Hatch')
+@click.option(
+    '--changed', is_flag=True, help='Only process files changed since the last commit, including untracked files'
+)
+@click.option(
+    '--since', 'since_ref', help='Only process files changed since a Git reference, including untracked files'
+)
 @click.pass_obj
 def fmt(
     app: Application,
@@ -23,12 +29,33 @@ def fmt(
     linter: bool,
     formatter: bool,
     sync: bool,
+    changed: bool,
+    since_ref: str | None,
 ):
-    """Format and lint source code."""
+    """
+    Format and lint source code.
+
+    You may restrict processing to files that Git considers changed, such as before committing:
+
+    \b
+    ```
+    hatch fmt --changed
+    ```
+    """
     if linter and formatter:
         app.abort('Cannot specify both --linter and --formatter')
 
-    from hatch.cli.fmt.core import StaticAnalysisEnvironment
+    if changed and since_ref:
+        app.abort('Cannot specify both --changed and --since')
+
+    from hatch.cli.fmt.core import StaticAnalysisEnvironment, get_changed_files
+
+    changed_files: list[str] = []
+    if changed or since_ref:
+        changed_files = get_changed_files(app.platform, app.project.location, since_ref or 'HEAD')
+        if not changed_files:
+            app.display_info('No changed files to process')
+            return
 
     app.ensure_environment_plugin_dependencies()
 
@@ -63,6 +90,11 @@ def fmt(
             preview = True
             default_args.append('--preview')
 
+        if changed_files:
+            # Explicitly passed files are otherwise processed even if they are excluded by the config
+            arguments.append('--force-exclude')
+            arguments.extend(changed_files)
+
         internal_args = context.env.join_command_args(default_args)
         if internal_args:
             # Add an extra space if required
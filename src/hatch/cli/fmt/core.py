@@ -6,6 +6,10 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from hatch.env.plugin.interface import EnvironmentInterface
     from hatch.utils.fs import Path
+    from hatch.utils.platform import Platform
+
+# https://docs.astral.sh/ruff/configuration/#default-inclusions
+SOURCE_FILE_EXTENSIONS = ('.py', '.pyi', '.ipynb')
 
 
 class StaticAnalysisEnvironment:
@@ -80,11 +84,11 @@ class StaticAnalysisEnvironment:
     def write_config_file(self, *, preview: bool) -> None:
         config_contents = self.construct_config_file(preview=preview)
         if self.config_path:
-            (self.env.root / self.config_path).write_atomic(config_contents, 'w', encoding='utf-8')
+            write_if_changed(self.env.root / self.config_path, config_contents)
             return
 
         self.internal_config_file.parent.ensure_dir_exists()
-        self.internal_config_file.write_text(config_contents)
+        write_if_changed(self.internal_config_file, config_contents)
 
         # TODO: remove everything below once this is fixed https://github.com/astral-sh/ruff/issues/8737
         if self.internal_user_config_file is None:
@@ -112,7 +116,7 @@ class StaticAnalysisEnvironment:
         else:
             contents = f'extend = "{config_path}"\n{old_contents}'
 
-        self.internal_user_config_file.write_text(contents)
+        write_if_changed(self.internal_user_config_file, contents)
 
     @cached_property
     def internal_user_config_file(self) -> Path | None:
@@ -157,6 +161,27 @@ class StaticAnalysisEnvironment:
         return self.user_config.get(section, {})
 
 
+def write_if_changed(path: Path, contents: str) -> None:
+    # Avoid invalidating the caches of tools that track the modification time of the config
+    try:
+        if path.read_text(encoding='utf-8') == contents:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    path.write_atomic(contents, 'w', encoding='utf-8')
+
+
+def get_changed_files(platform: Platform, root: Path, ref: str) -> list[str]:
+    """
+    Returns the paths, relative to the root, of existing source files that differ from the Git reference
+    or are untracked and not ignored.
+    """
+    from hatch.utils.git import get_changed_files as get_changed_paths
+
+    return [path for path in get_changed_paths(platform, root, ref) if path.endswith(SOURCE_FILE_EXTENSIONS)]
+
+
 STABLE_RULES: tuple[str, ...] = (
     'A001',
     'A002',
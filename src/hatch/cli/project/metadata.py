@@ -29,13 +29,15 @@ def metadata(app: Application, field: str | None):
 
     from hatch.project.constants import BUILD_BACKEND
 
-    app.project.prepare_build_environment()
-    build_backend = app.project.metadata.build.build_backend
-    with app.project.location.as_cwd(), app.project.build_env.get_env_vars():
-        if build_backend != BUILD_BACKEND:
-            project_metadata = app.project.build_frontend.get_core_metadata()
-        else:
-            project_metadata = app.project.build_frontend.hatch.get_core_metadata()
+    project_metadata = app.project.get_cached_core_metadata()
+    if project_metadata is None:
+        app.project.prepare_build_environment()
+        build_backend = app.project.metadata.build.build_backend
+        with app.project.location.as_cwd(), app.project.build_env.get_env_vars():
+            if build_backend != BUILD_BACKEND:
+                project_metadata = app.project.build_frontend.get_core_metadata()
+            else:
+                project_metadata = app.project.build_frontend.hatch.get_core_metadata()
 
     if field:
         if field not in project_metadata:
@@ -35,6 +35,17 @@ from hatch.config.constants import PublishEnvVars
     envvar=PublishEnvVars.CLIENT_KEY,
     help="The path to the client certificate's private key [env var: `HATCH_INDEX_CLIENT_KEY`]",
 )
+@click.option(
+    '--jobs',
+    '-j',
+    type=click.IntRange(min=1),
+    help='The maximum number of artifacts to upload concurrently (default is 4)',
+)
+@click.option(
+    '--verify',
+    is_flag=True,
+    help='Whether or not to verify the integrity of artifacts and record their checksums before publishing',
+)
 @click.option('--no-prompt', '-n', is_flag=True, help='Disable prompts, such as for missing required fields')
 @click.option(
     '--initialize-auth', is_flag=True, help='Save first-time authentication information even if nothing was published'
@@ -69,6 +80,8 @@ def publish(
     ca_cert,
     client_cert,
     client_key,
+    jobs,
+    verify,
     no_prompt,
     initialize_auth,
     publisher_name,
@@ -76,7 +89,7 @@ def publish(
     yes,
 ):
     """Publish build artifacts."""
-    option_map = {'no_prompt': no_prompt, 'initialize_auth': initialize_auth}
+    option_map = {'no_prompt': no_prompt, 'initialize_auth': initialize_auth, 'verify': verify}
     if publisher_name == 'index':
         if options:
             app.abort('Use the standard CLI flags rather than passing explicit options when using the `index` plugin')
@@ -93,6 +106,8 @@ def publish(
             option_map['client_cert'] = client_cert
         if client_key:
             option_map['client_key'] = client_key
+        if jobs:
+            option_map['jobs'] = jobs
     else:  # no cov
         for option in options:
             key, _, value = option.partition('=')
@@ -1,5 +1,6 @@
 import click
 
+from hatch.cli.python.cache import cache
 from hatch.cli.python.find import find
 from hatch.cli.python.install import install
 from hatch.cli.python.remove import remove
@@ -12,6 +13,7 @@ def python():
     pass
 
 
+python.add_command(cache)
 python.add_command(find)
 python.add_command(install)
 python.add_command(remove)
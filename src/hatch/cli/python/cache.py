@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from hatch.cli.application import Application
+    from hatch.python.cache import ArchiveCache
+
+
+BINARY_UNIT = 1024
+
+
+def format_size(size: float) -> str:
+    if size < BINARY_UNIT:
+        return f'{size:.0f} B'
+
+    for unit in ('KiB', 'MiB'):
+        size /= BINARY_UNIT
+        if size < BINARY_UNIT:
+            return f'{size:.1f} {unit}'
+
+    return f'{size / BINARY_UNIT:.1f} GiB'
+
+
+def get_archive_cache(app: Application) -> ArchiveCache:
+    archive_cache = app.get_python_archive_cache()
+    if archive_cache is None:
+        app.abort('No cache directory is configured')
+
+    return archive_cache
+
+
+@click.group(short_help='Manage the cache of downloaded Python distributions')
+def cache():
+    pass
+
+
+@cache.command(short_help='Show the cached Python distribution archives')
+@click.option('--ascii', 'force_ascii', is_flag=True, help='Whether or not to only use ASCII characters')
+@click.pass_obj
+def show(app: Application, *, force_ascii: bool):
+    """Show the cached Python distribution archives, most recently used first."""
+    from datetime import datetime
+
+    archive_cache = get_archive_cache(app)
+    entries = archive_cache.entries()
+    if not entries:
+        app.display_info('The cache is empty')
+        return
+
+    columns: dict[str, dict[int, str]] = {'Archive': {}, 'Size': {}, 'Last used': {}}
+    for i, entry in enumerate(entries):
+        columns['Archive'][i] = entry.name
+        columns['Size'][i] = format_size(entry.size)
+        columns['Last used'][i] = datetime.fromtimestamp(entry.last_used).strftime('%Y-%m-%d %H:%M')  # noqa: DTZ006
+
+    app.display_table(
+        'Archives',
+        columns,
+        show_lines=True,
+        column_options={'Archive': {'no_wrap': True}},
+        force_ascii=force_ascii,
+    )
+    total_size = sum({entry.sha256: entry.size for entry in entries}.values())
+    app.display(f'Total: {format_size(total_size)} / {format_size(archive_cache.max_size)}')
+
+
+@cache.command(short_help='Remove cached Python distribution archives')
+@click.option(
+    '--max-size',
+    type=click.IntRange(min=0),
+    help='Evict the least recently used archives until the cache is at most this many bytes, overriding configuration',
+)
+@click.option('--all', 'remove_all', is_flag=True, help='Remove every cached archive')
+@click.pass_obj
+def prune(app: Application, *, max_size: int | None, remove_all: bool):
+    """
+    Remove cached Python distribution archives.
+
+    By default, the least recently used archives are evicted until the cache fits within the maximum size,
+    which may be configured by setting the `HATCH_PYTHON_CACHE_MAX_SIZE` environment variable to a number
+    of bytes.
+    """
+    archive_cache = get_archive_cache(app)
+    evicted = archive_cache.prune(0 if remove_all else max_size)
+
+    freed = sum({entry.sha256: entry.size for entry in evicted}.values())
+    app.display_success(f'Removed {len(evicted)} archive{"" if len(evicted) == 1 else "s"} ({format_size(freed)})')
@@ -9,12 +9,37 @@ if TYPE_CHECKING:
 
 
 @click.command(short_help='Locate Python binaries')
-@click.argument('name')
+@click.argument('name', required=False)
 @click.option('-p', '--parent', is_flag=True, help='Show the parent directory of the Python binary')
 @click.option('--dir', '-d', 'directory', help='The directory in which distributions reside')
+@click.option(
+    '--refresh', is_flag=True, help='Rebuild the registry of interpreters used when creating virtual environments'
+)
 @click.pass_obj
-def find(app: Application, *, name: str, parent: bool, directory: str | None):
-    """Locate Python binaries."""
+def find(app: Application, *, name: str | None, parent: bool, directory: str | None, refresh: bool):
+    """
+    Locate Python binaries.
+
+    Interpreters found on PATH are remembered so that they are not queried again when creating
+    virtual environments. You may rebuild that registry, which shows every interpreter found:
+
+    \b
+    ```
+    hatch python find --refresh
+    ```
+    """
+    if refresh:
+        with app.status('Discovering Python interpreters'):
+            interpreters = app.get_interpreter_registry().refresh()
+
+        if name is None:
+            for python_info in interpreters:
+                app.display(f'{python_info.executable} ({python_info.implementation} {python_info.version_str})')
+
+            return
+    elif name is None:
+        app.abort('Missing argument `NAME`')
+
     manager = app.get_python_manager(directory)
     installed = manager.get_installed()
     if name not in installed:
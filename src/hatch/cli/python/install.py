@@ -7,6 +7,8 @@ import click
 if TYPE_CHECKING:
     from hatch.cli.application import Application
 
+DEFAULT_JOBS = 4
+
 
 def ensure_path_public(path: str, shells: list[str]) -> bool:
     import userpath
@@ -25,8 +27,16 @@ def ensure_path_public(path: str, shells: list[str]) -> bool:
 @click.option(
     '--dir', '-d', 'directory', help='The directory in which to install distributions, overriding configuration'
 )
+@click.option(
+    '--jobs',
+    '-j',
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOBS,
+    show_default=True,
+    help='The maximum number of distributions to download and extract concurrently',
+)
 @click.pass_obj
-def install(app: Application, *, names: tuple[str, ...], private: bool, update: bool, directory: str | None):
+def install(app: Application, *, names: tuple[str, ...], private: bool, update: bool, directory: str | None, jobs: int):
     """
     Install Python distributions.
 
@@ -75,7 +85,7 @@ def install(app: Application, *, names: tuple[str, ...], private: bool, update:
     elif incompatible and (not compatible or 'all' not in names):
         app.abort(f'Incompatible distributions: {", ".join(incompatible)}')
 
-    directories_made_public = []
+    pending: dict[str, bool] = {}
     for name in compatible:
         needs_update = False
         if name in installed:
@@ -88,14 +98,48 @@ def install(app: Application, *, names: tuple[str, ...], private: bool, update:
             if not (update or app.confirm(f'Update {name}?')):
                 app.abort(f'Distribution is already installed: {name}')
 
-        with app.status(f'{"Updating" if needs_update else "Installing"} {name}'):
-            dist = manager.install(name)
-            if not private:
-                python_directory = str(dist.python_path.parent)
-                if not ensure_path_public(python_directory, shells=shells):
-                    directories_made_public.append(python_directory)
+        pending[name] = needs_update
+
+    if not pending:
+        return
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    status_verb = 'Updating' if all(pending.values()) else 'Installing'
+    status_target = next(iter(pending)) if len(pending) == 1 else f'{len(pending)} distributions'
+
+    finished = {}
+    failed = []
+    with app.status(f'{status_verb} {status_target}') as status, ThreadPoolExecutor(
+        max_workers=min(jobs, len(pending))
+    ) as executor:
+        futures = {executor.submit(manager.install, name): name for name in pending}
+        # Report each distribution as soon as it finishes but do not abort the others on failure
+        for completed, future in enumerate(as_completed(futures), 1):
+            if len(pending) > 1:
+                status.update(f'{status_verb} {status_target} ({completed}/{len(pending)} done)')
+
+            name = futures[future]
+            action = 'update' if pending[name] else 'install'
+            try:
+                dist = future.result()
+            except Exception as e:  # noqa: BLE001
+                app.display_error(f'Failed to {action} {name}: {e}')
+                failed.append(name)
+                continue
+
+            finished[name] = dist
+            app.display_success(f'{"Updated" if pending[name] else "Installed"} {name} @ {dist.path}')
 
-        app.display_success(f'{"Updated" if needs_update else "Installed"} {name} @ {dist.path}')
+    directories_made_public = []
+    if not private:
+        for name in pending:
+            if name not in finished:
+                continue
+
+            python_directory = str(finished[name].python_path.parent)
+            if not ensure_path_public(python_directory, shells=shells):
+                directories_made_public.append(python_directory)
 
     if directories_made_public:
         multiple = len(directories_made_public) > 1
@@ -105,3 +149,7 @@ def install(app: Application, *, names: tuple[str, ...], private: bool, update:
         )
         for public_directory in directories_made_public:
             app.display(public_directory)
+
+    if failed:
+        failed.sort(key=list(pending).index)
+        app.abort(f'Failed distributions: {", ".join(failed)}')
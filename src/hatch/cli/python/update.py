@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 import click
 
-from hatch.cli.python.install import install
+from hatch.cli.python.install import DEFAULT_JOBS, install
 
 if TYPE_CHECKING:
     from hatch.cli.application import Application
@@ -13,8 +13,16 @@ if TYPE_CHECKING:
 @click.command(short_help='Update Python distributions')
 @click.argument('names', required=True, nargs=-1)
 @click.option('--dir', '-d', 'directory', help='The directory in which distributions reside')
+@click.option(
+    '--jobs',
+    '-j',
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOBS,
+    show_default=True,
+    help='The maximum number of distributions to download and extract concurrently',
+)
 @click.pass_context
-def update(ctx: click.Context, *, names: tuple[str, ...], directory: str | None):
+def update(ctx: click.Context, *, names: tuple[str, ...], directory: str | None, jobs: int):
     """
     Update Python distributions.
 
@@ -35,4 +43,4 @@ def update(ctx: click.Context, *, names: tuple[str, ...], directory: str | None)
     if not_installed:
         app.abort(f'Distributions not installed: {", ".join(not_installed)}')
 
-    ctx.invoke(install, names=selection, directory=directory, private=True, update=True)
+    ctx.invoke(install, names=selection, directory=directory, private=True, update=True, jobs=jobs)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from hatch.cli.application import Application
+
+
+@click.command(short_help='Answer queries from editors and other tools over a socket')
+@click.option('--socket', 'socket_path', help='The path to the Unix socket, defaults to one in the cache directory')
+@click.option(
+    '--idle-timeout',
+    type=float,
+    help='The number of seconds without any open connection after which the server exits, defaults to never',
+)
+@click.pass_obj
+def server(app: Application, *, socket_path: str | None, idle_timeout: float | None):
+    """
+    Run a resident server that answers queries about the project.
+
+    The application, project, configuration and environment objects are kept in memory so that
+    repeated queries do not pay for interpreter startup and project loading. Everything is reloaded
+    whenever the project's `pyproject.toml`/`hatch.toml` or the config file change.
+
+    The server speaks [JSON-RPC 2.0](https://www.jsonrpc.org/specification) with one message per line.
+    The following methods are supported, each accepting the command-line arguments in an `args` array
+    and optionally the environment name as `env`:
+
+    \b
+    - `dep.hash`
+    - `dep.show.requirements`
+    - `dep.show.table`
+    - `env.find`
+    - `env.show`
+    - `project.metadata`
+    - `run`
+    - `status`
+    - `version`
+
+    Results are objects containing the `exit_code`, `stdout` and `stderr` of the command. The
+    `server.ping` and `server.shutdown` methods are also available.
+
+    Every connection is handled concurrently, but commands run one at a time in the order they
+    are received because they share the process's working directory and output streams.
+    """
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
+        app.abort('Unix sockets are not supported on this platform')
+
+    if app.project.root is None:
+        app.abort('No project detected')
+
+    from hatch.server.core import ProjectServer
+    from hatch.utils.fs import Path
+
+    path = Path(socket_path).resolve() if socket_path else app.cache_dir / 'server' / f'{app.project.location.id}.sock'
+
+    app.display_info(str(path))
+    ProjectServer(app, path).serve(idle_timeout=idle_timeout)
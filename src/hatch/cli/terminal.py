@@ -30,6 +30,9 @@ class NullStatus(TerminalStatus):
     def stop(self):
         pass
 
+    def update(self, message: str) -> None:
+        pass
+
     def __exit__(self, exc_type, exc_value, traceback):
         pass
 
@@ -76,6 +79,19 @@ class BorrowedStatus(TerminalStatus):
 
             self.__output(Text(final_text, style=self.__success_style))
 
+    def update(self, message: str) -> None:
+        """
+        Replaces the current message, such as to report progress, without displaying it again when
+        the output is not interactive.
+        """
+        if not self.__messages:
+            return
+
+        text = Text(message, style=self.__waiting_style)
+        self.__messages[-1] = (text, self.__messages[-1][1])
+        if self.__status is not None:
+            self.__status.update(text)
+
     def __call__(self, message: str, final_text: str = '') -> BorrowedStatus:
         self.__messages.append((Text(message, style=self.__waiting_style), final_text))
         return self
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 
 import click
 
+from hatch.config.constants import AppEnvVars
+
 if TYPE_CHECKING:
     from hatch.cli.application import Application
     from hatch.env.plugin.interface import EnvironmentInterface
@@ -17,6 +19,21 @@ if TYPE_CHECKING:
 @click.option('--retry-delay', type=float, help='Seconds to wait between retries')
 @click.option('--cover', '-c', is_flag=True, help='Measure code coverage')
 @click.option('--cover-quiet', is_flag=True, help='Disable coverage reporting after tests, implicitly enabling --cover')
+@click.option(
+    '--affected',
+    is_flag=True,
+    help='Only run tests affected by files changed since the last commit, including untracked files',
+)
+@click.option('--since', 'since_ref', help='Only run tests affected by files changed since a Git reference')
+@click.option('--shard', help='Only run the tests of a shard in every environment, in the form INDEX/TOTAL e.g. 1/4')
+@click.option(
+    '--durations-file',
+    envvar=AppEnvVars.TEST_DURATIONS_FILE,
+    help=(
+        'The file into which the test durations of shards are merged, e.g. to be cached or committed in CI '
+        '[env var: `HATCH_TEST_DURATIONS_FILE`]'
+    ),
+)
 @click.option('--all', '-a', 'test_all', is_flag=True, help='Test all environments in the matrix')
 @click.option('--python', '-py', help='The Python versions to test, equivalent to: -i py=...')
 @click.option('--include', '-i', 'included_variable_specs', multiple=True, help='The matrix variables to include')
@@ -33,6 +50,10 @@ def test(
     retry_delay: float | None,
     cover: bool,
     cover_quiet: bool,
+    affected: bool,
+    since_ref: str | None,
+    shard: str | None,
+    durations_file: str | None,
     test_all: bool,
     python: str | None,
     included_variable_specs: tuple[str, ...],
@@ -66,6 +87,23 @@ def test(
 
     The `-py`/`--python` option is a shortcut for specifying the inclusion `-i py=...`.
 
+    The `--shard` option splits the tests of each environment into a number of shards, for example
+    to distribute them across CI jobs that each run `hatch test --shard 2/4`. Every test is assigned
+    to the same shard on every job, balanced by the durations recorded during previous sharded runs.
+    Durations are recorded in the data directory and only used once every shard has run, unless the
+    `--durations-file` option selects a file that every job reads before any job updates its own copy,
+    such as one that is cached or committed for CI.
+
+    The `--affected` option only runs tests affected by files that Git considers changed, including
+    untracked files, and `--since` compares with the commit at which the last commit diverged from a
+    Git reference. The files covered by each test are recorded when either option is combined with
+    `--cover`, and tests that have never been recorded always run:
+
+    \b
+    ```
+    hatch test --cover --affected
+    ```
+
     \b
     !!! note
         The inclusion option is treated as an intersection while the exclusion option is treated as a
@@ -93,7 +131,8 @@ def test(
 
     import sys
 
-    from hatch.cli.test.core import PatchedCoverageConfig
+    from hatch.cli.test.core import CoverageCombiner, ImpactMap, PatchedCoverageConfig, PytestPlugin
+    from hatch.utils.fs import Path
     from hatch.utils.runner import parse_matrix_variables, select_environments
 
     if python is not None:
@@ -115,6 +154,36 @@ def test(
     if retries is None and retry_delay is not None:
         app.abort('The --retry-delay option requires the --retries option to be set as well.')
 
+    if shard is not None:
+        index, _, total = shard.partition('/')
+        if not (index.isdigit() and total.isdigit() and 1 <= int(index) <= int(total)):
+            app.abort(f'Invalid shard `{shard}`, must be of the form INDEX/TOTAL with 1 <= INDEX <= TOTAL')
+
+    if affected and since_ref:
+        app.abort('Cannot specify both --affected and --since')
+
+    select_affected = affected or since_ref is not None
+    impact_map: ImpactMap | None = None
+    if select_affected:
+        impact_map = ImpactMap(app.project.location, app.data_dir)
+        if impact_map.exists():
+            from hatch.utils.git import get_changed_files
+
+            # Deleted files may affect the tests that covered them
+            changed_files = get_changed_files(
+                app.platform, app.project.location, since_ref or 'HEAD', include_deleted=True
+            )
+            if not changed_files:
+                app.display_info('No changed files, no tests are affected')
+                return
+
+            impact_map.write_changed_files(changed_files)
+        else:
+            if not cover:
+                app.display_warning('No test impact has been recorded, use --cover to record it')
+
+            impact_map = None
+
     app.ensure_environment_plugin_dependencies()
 
     test_envs = app.project.config.internal_matrices['hatch-test']['envs']
@@ -160,6 +229,20 @@ def test(
     if cover:
         patched_coverage.write_config_file()
 
+    record_contexts = cover and select_affected
+    pytest_plugin = PytestPlugin(app.project.location, app.data_dir)
+    pytest_plugin_arguments: list[str] = []
+    if shard is not None or select_affected:
+        pytest_plugin.write()
+        pytest_plugin_arguments.extend(
+            pytest_plugin.get_arguments(
+                shard=shard,
+                durations_file=None if durations_file is None else Path(durations_file).resolve(),
+                impact_map=impact_map,
+                record_contexts=record_contexts,
+            )
+        )
+
     for context in app.runner_context(selected_envs, ignore_compat=multiple_possible, display_header=multiple_possible):
         internal_arguments: list[str] = list(context.env.config.get('extra-args', []))
 
@@ -178,6 +261,10 @@ def test(
         if (seconds_delay := context.env.config.get('retry-delay', retry_delay)) is not None:
             internal_arguments.extend(['--reruns-delay', str(seconds_delay)])
 
+        if pytest_plugin_arguments:
+            internal_arguments.extend(pytest_plugin_arguments)
+            context.module_search_paths.append(str(pytest_plugin.directory))
+
         internal_args = context.env.join_command_args(internal_arguments)
         if internal_args:
             # Add an extra space if required
@@ -196,8 +283,26 @@ def test(
             context.env_vars['COVERAGE_PROCESS_START'] = coverage_config_file
 
     if cover:
+        combiner = CoverageCombiner(patched_coverage, app.cache_dir / 'coverage' / app.project.location.id)
+        data_files = combiner.find_data_files()
+        combine_env: EnvironmentInterface | None = None
         for context in app.runner_context([selected_envs[0]]):
-            context.add_shell_command('cov-combine')
+            # Data files are merged concurrently unless the script has been customized
+            if data_files and context.env.scripts.get('cov-combine') == ['coverage combine']:
+                combine_env = context.env
+            else:
+                context.add_shell_command('cov-combine')
+
+        if combine_env is not None:
+            with app.project.ensure_cwd(), combine_env.command_context():
+                failed_process = combiner.combine(combine_env, data_files)
+
+            if failed_process is not None:
+                app.display_error(failed_process.stdout.decode('utf-8', 'replace').rstrip())
+                app.abort(code=failed_process.returncode)
+
+        if record_contexts and not ImpactMap(app.project.location, app.data_dir).update(patched_coverage.data_file):
+            app.display_warning('Unable to record test impact from the coverage data')
 
         if not cover_quiet:
             for context in app.runner_context([selected_envs[0]]):
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from configparser import ConfigParser
+    from subprocess import CompletedProcess
 
+    from hatch.env.plugin.interface import EnvironmentInterface
     from hatch.utils.fs import Path
 
 
@@ -27,6 +29,25 @@ class PatchedCoverageConfig:
     def internal_config_path(self) -> Path:
         return self.data_dir / 'coverage' / self.project_root.id / self.user_config_path.name
 
+    @cached_property
+    def data_file(self) -> Path:
+        data_file = '.coverage'
+        if self.user_config_path.is_file():
+            if self.user_config_path.name == '.coveragerc':
+                from configparser import ConfigParser
+
+                cfg = ConfigParser()
+                cfg.read(str(self.user_config_path))
+                data_file = cfg.get('run', 'data_file', fallback=data_file)
+            else:
+                from hatch.utils.toml import load_toml_data
+
+                project_data = load_toml_data(self.user_config_path.read_text())
+                data_file = project_data.get('tool', {}).get('coverage', {}).get('run', {}).get('data_file', data_file)
+
+        # Tests run from the project root
+        return self.project_root / data_file
+
     def write_config_file(self) -> None:
         self.internal_config_path.parent.ensure_dir_exists()
         if self.internal_config_path.name == '.coveragerc':
@@ -54,3 +75,306 @@ class PatchedCoverageConfig:
     def _write_ini(self, cfg: ConfigParser) -> None:
         with self.internal_config_path.open('w', encoding='utf-8') as f:
             cfg.write(f)
+
+
+class PytestPlugin:
+    """
+    The plugin that is loaded into test environments, which provides sharding and test impact selection,
+    records the duration of every test for balancing shards in subsequent runs and labels coverage data
+    with the test being run.
+    """
+
+    NAME = 'hatch_test_plugin'
+
+    def __init__(self, project_root: Path, data_dir: Path) -> None:
+        self.project_root = project_root
+        self.data_dir = data_dir
+
+    @cached_property
+    def directory(self) -> Path:
+        return self.data_dir / '.config' / 'pytest'
+
+    @cached_property
+    def durations_path(self) -> Path:
+        return self.data_dir / 'tests' / self.project_root.id / 'durations.json'
+
+    def write(self) -> None:
+        from hatch.utils.fs import Path
+
+        contents = (Path(__file__).parent / 'pytest_plugin.py').read_text(encoding='utf-8')
+        plugin_path = self.directory / f'{self.NAME}.py'
+        # Avoid invalidating the bytecode cache
+        if plugin_path.is_file() and plugin_path.read_text(encoding='utf-8') == contents:
+            return
+
+        self.directory.ensure_dir_exists()
+        plugin_path.write_atomic(contents, 'w', encoding='utf-8')
+
+    def get_arguments(
+        self,
+        *,
+        shard: str | None = None,
+        durations_file: Path | None = None,
+        impact_map: ImpactMap | None = None,
+        record_contexts: bool = False,
+    ) -> list[str]:
+        arguments = ['-p', self.NAME]
+        if shard is not None:
+            if durations_file is None:
+                arguments.extend(('--hatch-shard', shard, '--hatch-durations', str(self.durations_path)))
+            else:
+                arguments.extend(('--hatch-shard', shard, '--hatch-durations', str(durations_file)))
+                arguments.append('--hatch-durations-shared')
+
+        if impact_map is not None:
+            arguments.extend((
+                '--hatch-impact-map',
+                str(impact_map.path),
+                '--hatch-changed-files',
+                str(impact_map.changed_files_path),
+            ))
+
+        if record_contexts:
+            arguments.append('--hatch-contexts')
+
+        return arguments
+
+
+class ImpactMap:
+    """
+    The files covered by every test, from coverage data measured in contexts named after each test.
+    Test node IDs are stored once and every file refers to the tests that covered it by index.
+    """
+
+    def __init__(self, project_root: Path, data_dir: Path) -> None:
+        self.project_root = project_root
+        self.data_dir = data_dir
+
+    @cached_property
+    def path(self) -> Path:
+        return self.data_dir / 'tests' / self.project_root.id / 'impact.json'
+
+    @cached_property
+    def changed_files_path(self) -> Path:
+        return self.path.parent / 'changed.json'
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    def load(self) -> tuple[dict[str, set[str]], set[str]]:
+        import json
+
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            tests: list[str] = data['tests']
+            covered_files: dict[str, set[str]] = {test: set() for test in tests}
+            for path, indices in data['files'].items():
+                for index in indices:
+                    covered_files[tests[index]].add(path)
+
+            return covered_files, set(data['global'])
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            return {}, set()
+
+    def save(self, covered_files: dict[str, set[str]], global_files: set[str]) -> None:
+        import json
+
+        tests = sorted(covered_files)
+        files: dict[str, list[int]] = {}
+        for index, test in enumerate(tests):
+            for path in covered_files[test]:
+                files.setdefault(path, []).append(index)
+
+        data = {'tests': tests, 'files': dict(sorted(files.items())), 'global': sorted(global_files - set(files))}
+        self.path.parent.ensure_dir_exists()
+        self.path.write_atomic(json.dumps(data, separators=(',', ':')), 'w', encoding='utf-8')
+
+    def update(self, coverage_data_file: Path) -> bool:
+        """
+        Replaces the covered files of every test measured in the coverage data and removes tests of files
+        that no longer exist. Returns whether the coverage data could be read.
+        """
+        import sqlite3
+
+        try:
+            measured_files = read_coverage_contexts(coverage_data_file, self.project_root)
+        except (OSError, sqlite3.Error):
+            return False
+
+        covered_files, global_files = self.load()
+        global_files.update(measured_files.pop('', set()))
+        covered_files.update(measured_files)
+        covered_files = {
+            test: paths
+            for test, paths in covered_files.items()
+            if self.project_root.joinpath(test.split('::', 1)[0]).is_file()
+        }
+
+        self.save(covered_files, global_files)
+        return True
+
+    def write_changed_files(self, changed_files: list[str]) -> None:
+        import json
+
+        self.changed_files_path.parent.ensure_dir_exists()
+        self.changed_files_path.write_atomic(json.dumps(changed_files), 'w', encoding='utf-8')
+
+
+def read_coverage_contexts(data_file: Path, root: Path) -> dict[str, set[str]]:
+    """
+    Returns the files within the root, relative to it, that were measured in each context of a
+    coverage data file.
+
+    https://coverage.readthedocs.io/en/7.4.4/dbschema.html
+    """
+    import os
+    import sqlite3
+    from contextlib import closing
+
+    if not data_file.is_file():
+        message = f'Coverage data file not found: {data_file}'
+        raise FileNotFoundError(message)
+
+    root_path = os.path.abspath(root)
+    measured_files: dict[str, set[str]] = {}
+    query = """
+        SELECT DISTINCT context.context, file.path FROM line_bits
+        JOIN context ON context.id = line_bits.context_id JOIN file ON file.id = line_bits.file_id
+        UNION
+        SELECT DISTINCT context.context, file.path FROM arc
+        JOIN context ON context.id = arc.context_id JOIN file ON file.id = arc.file_id
+    """
+    relative_paths: dict[str, str | None] = {}
+    with closing(sqlite3.connect(str(data_file))) as connection:
+        rows: Any = connection.execute(query)
+        for context, path in rows:
+            if path not in relative_paths:
+                absolute_path = os.path.abspath(os.path.join(root_path, path))
+                relative_paths[path] = (
+                    os.path.relpath(absolute_path, root_path).replace(os.sep, '/')
+                    if absolute_path.startswith(root_path + os.sep)
+                    else None
+                )
+
+            if (relative_path := relative_paths[path]) is not None:
+                measured_files.setdefault(context, set()).add(relative_path)
+
+    return measured_files
+
+
+class CoverageCombiner:
+    """
+    Combines parallel coverage data files by merging groups of them concurrently, then groups of the
+    results, until a single data file remains. The result of every merge is cached by the digests of
+    its inputs and the coverage configuration so that the same data is never merged twice.
+    """
+
+    MIN_GROUP_SIZE = 4
+
+    def __init__(self, patched_coverage: PatchedCoverageConfig, cache_dir: Path, *, jobs: int | None = None) -> None:
+        import os
+
+        self.patched_coverage = patched_coverage
+        self.cache_dir = cache_dir
+        self.jobs = jobs or os.cpu_count() or 1
+        self.__used_cache_entries: set[str] = set()
+
+    @cached_property
+    def config_digest(self) -> str:
+        import hashlib
+
+        config_path = self.patched_coverage.user_config_path
+        return hashlib.sha256(config_path.read_bytes() if config_path.is_file() else b'').hexdigest()
+
+    def find_data_files(self) -> list[Path]:
+        # https://coverage.readthedocs.io/en/7.4.4/cmd.html#cmd-combine
+        data_file = self.patched_coverage.data_file
+        if not data_file.parent.is_dir():
+            return []
+
+        return sorted(path for path in data_file.parent.glob(f'{data_file.name}.*') if path.is_file())
+
+    def combine(self, environment: EnvironmentInterface, data_files: list[Path]) -> CompletedProcess | None:
+        """
+        Combines the data files into the configured data file, removing them as `coverage combine` does,
+        and returns the first merge that failed, if any.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            nodes = list(zip(data_files, executor.map(get_file_digest, data_files)))
+            while True:
+                group_size = max(self.MIN_GROUP_SIZE, -(-len(nodes) // self.jobs))
+                groups = [nodes[i : i + group_size] for i in range(0, len(nodes), group_size)]
+                results = list(executor.map(lambda group: self.__merge(environment, group), groups))
+                nodes = []
+                for result in results:
+                    if not isinstance(result, tuple):
+                        return result
+
+                    nodes.append(result)
+
+                if len(nodes) == 1:
+                    break
+
+        nodes[0][0].replace(self.patched_coverage.data_file)
+        self.__prune_cache()
+        return None
+
+    def __merge(
+        self, environment: EnvironmentInterface, group: list[tuple[Path, str]]
+    ) -> tuple[Path, str] | CompletedProcess:
+        import hashlib
+        import os
+        import shutil
+        import subprocess
+
+        # Merged data only depends on the inputs and the configuration, such as path remapping
+        key = hashlib.sha256(
+            '\n'.join([self.config_digest, *sorted(digest for _, digest in group)]).encode('utf-8')
+        ).hexdigest()
+        self.__used_cache_entries.add(key)
+
+        data_file = self.patched_coverage.data_file
+        output = data_file.parent / f'{data_file.name}.hatch-{key[:16]}'
+        cached_output = self.cache_dir / key
+        if cached_output.is_file():
+            shutil.copyfile(cached_output, output)
+            for path, _ in group:
+                path.unlink()
+
+            return output, key
+
+        command = environment.join_command_args(['coverage', 'combine', *(str(path) for path, _ in group)])
+        process = environment.run_shell_command(
+            command,
+            env={**os.environ, 'COVERAGE_FILE': str(output)},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        if process.returncode:
+            return process
+
+        self.cache_dir.ensure_dir_exists()
+        temp_output = self.cache_dir / f'{key}.tmp'
+        shutil.copyfile(output, temp_output)
+        temp_output.replace(cached_output)
+        return output, key
+
+    def __prune_cache(self) -> None:
+        for entry in self.cache_dir.iterdir() if self.cache_dir.is_dir() else ():
+            if entry.name not in self.__used_cache_entries:
+                entry.unlink()
+
+
+def get_file_digest(path: Path) -> str:
+    import hashlib
+
+    from hatch.utils.network import DEFAULT_CHUNK_SIZE
+
+    hasher = hashlib.sha256()
+    with path.open('rb') as f:
+        while chunk := f.read(DEFAULT_CHUNK_SIZE):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
@@ -0,0 +1,283 @@
+"""
+A pytest plugin that is loaded in test environments. It is copied to a directory that is added to the
+module search path, so it must only depend on the standard library and pytest.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+import pytest
+
+
+def pytest_addoption(parser: Any) -> None:
+    group = parser.getgroup('hatch')
+    group.addoption('--hatch-shard', default=None, help='Only run the tests of a shard, in the form INDEX/TOTAL')
+    group.addoption('--hatch-durations', default=None, help='The file in which test durations are recorded')
+    group.addoption(
+        '--hatch-durations-shared',
+        action='store_true',
+        default=False,
+        help='Merge recorded durations directly into the durations file',
+    )
+    group.addoption(
+        '--hatch-contexts', action='store_true', default=False, help='Record coverage with the node ID of every test'
+    )
+    group.addoption(
+        '--hatch-impact-map', default=None, help='The file in which the files covered by tests are recorded'
+    )
+    group.addoption(
+        '--hatch-changed-files', default=None, help='Only run tests affected by the files listed in the file'
+    )
+
+
+def pytest_configure(config: Any) -> None:
+    if config.getoption('hatch_contexts'):
+        config.pluginmanager.register(CoverageContexts(), 'hatch-contexts')
+
+    shard = config.getoption('hatch_shard')
+    durations_file = config.getoption('hatch_durations')
+    # Reports of distributed tests are sent to the controller, which alone records durations. This
+    # happens before workers are started so they observe the same durations.
+    if shard is not None and durations_file and not hasattr(config, 'workerinput'):
+        index, total = parse_shard(shard)
+        # Shared files are copied to every job, e.g. by CI caches, so all shards read them before any updates them
+        if config.getoption('hatch_durations_shared'):
+            recorder = DurationRecorder(durations_file, merge=True)
+        else:
+            merge_pending_durations(durations_file, total)
+            recorder = DurationRecorder(get_pending_durations_path(durations_file, index, total))
+
+        config.pluginmanager.register(recorder, 'hatch-durations')
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: Any, items: list[Any]) -> None:
+    impact_map_file = config.getoption('hatch_impact_map')
+    changed_files_file = config.getoption('hatch_changed_files')
+    if impact_map_file and changed_files_file:
+        impact_map = load_impact_map(impact_map_file)
+        changed_files = load_changed_files(changed_files_file)
+        if impact_map is not None and changed_files is not None:
+            affected = select_affected([item.nodeid for item in items], impact_map, changed_files)
+            deselect(config, items, [item for item, is_affected in zip(items, affected) if is_affected])
+
+    shard = config.getoption('hatch_shard')
+    if shard is None:
+        return
+
+    index, total = parse_shard(shard)
+    durations = load_durations(config.getoption('hatch_durations'))
+    assignments = partition([item.nodeid for item in items], total, durations)
+
+    deselect(config, items, [item for item, assigned_shard in zip(items, assignments) if assigned_shard == index])
+
+
+def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
+    # Changes affecting none of the tests are not a failure, nor are shards left without tests
+    if exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED and (
+        session.config.getoption('hatch_changed_files') or session.config.getoption('hatch_shard') is not None
+    ):
+        session.exitstatus = pytest.ExitCode.OK
+
+
+def deselect(config: Any, items: list[Any], selected: list[Any]) -> None:
+    if len(selected) == len(items):
+        return
+
+    selected_ids = {id(item) for item in selected}
+    config.hook.pytest_deselected(items=[item for item in items if id(item) not in selected_ids])
+    items[:] = selected
+
+
+def parse_shard(shard: str) -> tuple[int, int]:
+    index, _, total = shard.partition('/')
+    if not (index.isdigit() and total.isdigit() and 1 <= int(index) <= int(total)):
+        message = f'Invalid shard `{shard}`, must be of the form INDEX/TOTAL with 1 <= INDEX <= TOTAL'
+        raise pytest.UsageError(message)
+
+    return int(index) - 1, int(total)
+
+
+def partition(node_ids: list[str], total: int, durations: dict[str, float]) -> list[int]:
+    """
+    Assigns each test to a shard, returning the zero-based shard of every test in the same order. The
+    longest tests are assigned first, each to the shard with the least total duration so far. Tests
+    without a recorded duration are assumed to take the average, so that without any recorded
+    durations the tests are distributed evenly by count. Ties are broken by node ID so that every
+    shard computes the same assignments regardless of collection order.
+    """
+    known_durations = [durations[node_id] for node_id in node_ids if node_id in durations]
+    default_duration = sum(known_durations) / len(known_durations) if known_durations else 1.0
+
+    loads = [0.0] * total
+    assignments = [0] * len(node_ids)
+    for i in sorted(
+        range(len(node_ids)), key=lambda i: (-durations.get(node_ids[i], default_duration), node_ids[i], i)
+    ):
+        shard = min(range(total), key=lambda s: (loads[s], s))
+        assignments[i] = shard
+        loads[shard] += durations.get(node_ids[i], default_duration)
+
+    return assignments
+
+
+def select_affected(node_ids: list[str], impact_map: dict[str, Any], changed_files: list[str]) -> list[bool]:
+    """
+    Determines whether each test may be affected by the changed files, in the same order. Tests are
+    affected if they covered any of the files, if their own file changed, or if they are absent from
+    the map. Files that were covered only outside of tests, such as during collection, affect every test.
+    """
+    changed = set(changed_files)
+    if changed.intersection(impact_map['global']):
+        return [True] * len(node_ids)
+
+    tests: list[str] = impact_map['tests']
+    affected: set[str] = set()
+    for path in changed:
+        affected.update(tests[index] for index in impact_map['files'].get(path, ()))
+
+    known = set(tests)
+    return [node_id in affected or node_id not in known or node_id.split('::', 1)[0] in changed for node_id in node_ids]
+
+
+def load_impact_map(path: str) -> dict[str, Any] | None:
+    try:
+        with open(path, encoding='utf-8') as f:
+            impact_map = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not (
+        isinstance(impact_map, dict)
+        and isinstance(impact_map.get('tests'), list)
+        and isinstance(impact_map.get('files'), dict)
+        and isinstance(impact_map.get('global'), list)
+    ):
+        return None
+
+    # Invalid indices would select arbitrary tests
+    total = len(impact_map['tests'])
+    for indices in impact_map['files'].values():
+        if not (isinstance(indices, list) and all(isinstance(i, int) and 0 <= i < total for i in indices)):
+            return None
+
+    return impact_map
+
+
+def load_changed_files(path: str) -> list[str] | None:
+    try:
+        with open(path, encoding='utf-8') as f:
+            changed_files = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return changed_files if isinstance(changed_files, list) else None
+
+
+def load_durations(path: str | None) -> dict[str, float]:
+    if not path:
+        return {}
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            durations = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(durations, dict):
+        return {}
+
+    return {node_id: duration for node_id, duration in durations.items() if isinstance(duration, (int, float))}
+
+
+def get_pending_durations_path(path: str, index: int, total: int) -> str:
+    return f'{path}.{index + 1}-of-{total}'
+
+
+def merge_pending_durations(path: str, total: int) -> None:
+    """
+    Every shard must partition tests using the same durations, so the durations recorded by each shard
+    are kept aside until all shards have run and only then merged, before the next run of any shard.
+    """
+    pending_paths = [get_pending_durations_path(path, index, total) for index in range(total)]
+    if not all(os.path.isfile(pending_path) for pending_path in pending_paths):
+        return
+
+    durations = load_durations(path)
+    for pending_path in pending_paths:
+        durations.update(load_durations(pending_path))
+
+    write_durations(path, durations)
+    for pending_path in pending_paths:
+        os.remove(pending_path)
+
+
+def write_durations(path: str, durations: dict[str, float]) -> None:
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+    os.replace(temp_path, path)
+
+
+class DurationRecorder:
+    def __init__(self, path: str, *, merge: bool = False) -> None:
+        self.path = path
+        self.merge = merge
+        self.durations: dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: Any) -> None:
+        # Only the last attempt of retried tests is recorded
+        if report.when == 'setup':
+            self.durations[report.nodeid] = 0.0
+
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self) -> None:
+        if self.durations:
+            durations = load_durations(self.path) if self.merge else {}
+            durations.update((node_id, round(duration, 6)) for node_id, duration in self.durations.items())
+            write_durations(self.path, durations)
+
+
+class CoverageContexts:
+    """
+    Measures every test, including its fixtures, in a coverage context named after its node ID. This
+    only works when the tests run under coverage, which is started for every process by `coverage run`
+    and `COVERAGE_PROCESS_START`.
+    """
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: Any) -> Any:  # noqa: PLR6301
+        coverage = switch_coverage_context(item.nodeid)
+
+        yield
+
+        if coverage is not None:
+            coverage.switch_context('')
+
+
+def switch_coverage_context(context: str) -> Any:
+    try:
+        from coverage import Coverage
+    except ImportError:
+        return None
+
+    coverage = Coverage.current()
+    if coverage is None:
+        return None
+
+    # Contexts may only be switched while measuring
+    try:
+        coverage.switch_context(context)
+    except Exception:  # noqa: BLE001
+        return None
+
+    return coverage
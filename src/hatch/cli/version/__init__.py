@@ -41,16 +41,21 @@ def version(app: Application, *, desired_version: str | None, force: bool):
                 app.abort('The version can only be set when Hatchling is the build backend')
 
             app.ensure_environment_plugin_dependencies()
-            app.project.prepare_build_environment()
+            if (project_metadata := app.project.get_cached_core_metadata()) is None:
+                app.project.prepare_build_environment()
 
-            with app.project.location.as_cwd(), app.project.build_env.get_env_vars():
-                project_metadata = app.project.build_frontend.get_core_metadata()
+                with app.project.location.as_cwd(), app.project.build_env.get_env_vars():
+                    project_metadata = app.project.build_frontend.get_core_metadata()
 
             app.display(project_metadata['version'])
         else:
             from hatch.utils.runner import ExecutionContext
 
             app.ensure_environment_plugin_dependencies()
+            if not desired_version and (project_metadata := app.project.get_cached_core_metadata()) is not None:
+                app.display(project_metadata['version'])
+                return
+
             app.project.prepare_build_environment()
 
             context = ExecutionContext(app.project.build_env)
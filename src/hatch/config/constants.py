@@ -6,6 +6,8 @@ class AppEnvVars:
     VERBOSE = 'HATCH_VERBOSE'
     INTERACTIVE = 'HATCH_INTERACTIVE'
     PYTHON = 'HATCH_PYTHON'
+    HTTP2 = 'HATCH_HTTP2'
+    TEST_DURATIONS_FILE = 'HATCH_TEST_DURATIONS_FILE'
     # https://no-color.org
     NO_COLOR = 'NO_COLOR'
     FORCE_COLOR = 'FORCE_COLOR'
@@ -33,6 +35,7 @@ class PythonEnvVars:
     CUSTOM_SOURCE_PREFIX = 'HATCH_PYTHON_CUSTOM_SOURCE_'
     CUSTOM_PATH_PREFIX = 'HATCH_PYTHON_CUSTOM_PATH_'
     CUSTOM_VERSION_PREFIX = 'HATCH_PYTHON_CUSTOM_VERSION_'
+    CACHE_MAX_SIZE = 'HATCH_PYTHON_CACHE_MAX_SIZE'
 
 
 class VersionEnvVars:
@@ -3,9 +3,14 @@ from __future__ import annotations
 import re
 import sys
 from importlib.metadata import Distribution, DistributionFinder
+from typing import TYPE_CHECKING
 
 from packaging.markers import default_environment
-from packaging.requirements import Requirement
+
+from hatchling.metadata.utils import parse_requirement
+
+if TYPE_CHECKING:
+    from packaging.requirements import Requirement
 
 
 class DistributionCache:
@@ -60,7 +65,7 @@ def dependency_in_sync(
         available_extras: list[str] = distribution.metadata.get_all('Provides-Extra', [])
 
         for requirement_string in transitive_requirements:
-            transitive_requirement = Requirement(requirement_string)
+            transitive_requirement = parse_requirement(requirement_string)
             if not transitive_requirement.marker:
                 continue
 
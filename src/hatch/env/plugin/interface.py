@@ -205,6 +205,14 @@ class EnvironmentInterface(ABC):
                 new_env_vars[key] = self.metadata.context.format(value)
 
         new_env_vars[AppEnvVars.ENV_ACTIVE] = self.name
+
+        # Builds share the cache directory of the index of third-party plugins with Hatch itself
+        if self.builder and self.app.cache_dir is not None:
+            from hatch.project.constants import BuildEnvVars
+
+            if BuildEnvVars.PLUGIN_INDEX_DIR not in os.environ:
+                new_env_vars.setdefault(BuildEnvVars.PLUGIN_INDEX_DIR, str(self.app.cache_dir / 'plugins'))
+
         return new_env_vars
 
     @cached_property
@@ -249,7 +257,9 @@ class EnvironmentInterface(ABC):
 
     @cached_property
     def environment_dependencies_complex(self):
-        from packaging.requirements import InvalidRequirement, Requirement
+        from packaging.requirements import InvalidRequirement
+
+        from hatchling.metadata.utils import parse_requirement
 
         dependencies_complex = []
         with self.apply_context():
@@ -265,7 +275,7 @@ class EnvironmentInterface(ABC):
                         raise TypeError(message)
 
                     try:
-                        dependencies_complex.append(Requirement(self.metadata.context.format(entry)))
+                        dependencies_complex.append(parse_requirement(self.metadata.context.format(entry)))
                     except InvalidRequirement as e:
                         message = f'Dependency #{i} of field `tool.hatch.envs.{self.name}.{option}` is invalid: {e}'
                         raise ValueError(message) from None
@@ -608,6 +618,17 @@ class EnvironmentInterface(ABC):
         in the environment.
         """
 
+    def refresh_project_dev_mode(self, editable_files: list[tuple[str, str]]) -> bool:  # noqa: ARG002, PLR6301
+        """
+        This may update the installation of the project in development mode by only replacing the files,
+        given as pairs of name and contents, that expose the project at the root of the installation. It is
+        called when these files change, such as when top-level modules are added, and should return whether
+        or not the installation was updated. The files are computed by the version of Hatchling that Hatch
+        ships with, so installations built by any other version should not be updated. Otherwise, the project is installed again with
+        [install_project_dev_mode](reference.md#hatch.env.plugin.interface.EnvironmentInterface.install_project_dev_mode).
+        """
+        return False
+
     def dependency_hash(self):
         """
         This should return a hash of the environment's
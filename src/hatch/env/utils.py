@@ -32,3 +32,69 @@ def add_verbosity_flag(command: list[str], verbosity: int, *, adjustment=0):
     flag = get_verbosity_flag(verbosity, adjustment=adjustment)
     if flag:
         command.append(flag)
+
+
+def replace_editable_files(
+    sys_path: list[str], project_name: str, editable_files: list[tuple[str, str]], *, generator: str
+) -> bool:
+    """
+    Replaces the files that expose an editable installation of a project, which are at the root of the
+    installation, and records them in its `RECORD` file. This is only possible if the installation was
+    built by the `generator` of the files, every file is already installed and no other path configuration
+    file remains.
+    """
+    import csv
+    import hashlib
+    import json
+    from base64 import urlsafe_b64encode
+    from io import StringIO
+
+    from hatch.dep.sync import DistributionCache
+    from hatch.utils.fs import Path
+
+    distribution = DistributionCache(sys_path)[project_name]
+    if distribution is None:
+        return False
+
+    try:
+        direct_url = json.loads(distribution.read_text('direct_url.json') or '{}')
+    except ValueError:
+        return False
+
+    if not direct_url.get('dir_info', {}).get('editable', False):
+        return False
+
+    wheel_metadata = (distribution.read_text('WHEEL') or '').splitlines()
+    if f'Generator: {generator}' not in wheel_metadata:
+        return False
+
+    rows = list(csv.reader((distribution.read_text('RECORD') or '').splitlines()))
+    record_files = [row[0] for row in rows if row and row[0].endswith('.dist-info/RECORD')]
+    if len(record_files) != 1:
+        return False
+
+    installed_files = {row[0] for row in rows if row and '/' not in row[0]}
+    new_files = dict(editable_files)
+    if not installed_files.issuperset(new_files) or any(
+        path.endswith('.pth') and path not in new_files for path in installed_files
+    ):
+        return False
+
+    site_packages = Path(str(distribution.locate_file('')))
+    for row in rows:
+        if not row or row[0] not in new_files:
+            continue
+
+        path = site_packages / row[0]
+        contents = new_files[row[0]].encode('utf-8')
+        mode = path.stat().st_mode if path.is_file() else 0o644
+        path.write_atomic(contents, 'wb')
+        path.chmod(mode)
+
+        digest = urlsafe_b64encode(hashlib.sha256(contents).digest()).rstrip(b'=').decode('ascii')
+        row[1:] = [f'sha256={digest}', str(len(contents))]
+
+    record = StringIO()
+    csv.writer(record, lineterminator='\n').writerows(rows)
+    (site_packages / record_files[0]).write_atomic(record.getvalue(), 'w', encoding='utf-8')
+    return True
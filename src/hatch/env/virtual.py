@@ -19,9 +19,9 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from packaging.specifiers import SpecifierSet
-    from virtualenv.discovery.py_info import PythonInfo
 
     from hatch.python.core import PythonManager
+    from hatch.python.discovery import Interpreter, InterpreterDiscovery
 
 
 class VirtualEnvironment(EnvironmentInterface):
@@ -180,6 +180,15 @@ class VirtualEnvironment(EnvironmentInterface):
                 self.construct_pip_install_command(['--editable', self.apply_features(str(self.root))])
             )
 
+    def refresh_project_dev_mode(self, editable_files):
+        from hatch.env.utils import replace_editable_files
+        from hatchling.__about__ import __version__
+
+        with self.safe_activation():
+            return replace_editable_files(
+                self.virtual_env.sys_path, self.metadata.name, editable_files, generator=f'hatchling {__version__}'
+            )
+
     def dependencies_in_sync(self):
         if not self.dependencies:
             return True
@@ -258,7 +267,18 @@ class VirtualEnvironment(EnvironmentInterface):
     def python_manager(self) -> PythonManager:
         from hatch.python.core import PythonManager
 
-        return PythonManager(self.isolated_data_directory / '.pythons')
+        return PythonManager(self.isolated_data_directory / '.pythons', self.app.get_python_archive_cache())
+
+    @cached_property
+    def interpreter_discovery(self) -> InterpreterDiscovery:
+        from hatch.python.discovery import InterpreterDiscovery
+
+        # Every resolution attempt, such as for the preferred version and then any version, shares the results
+        return InterpreterDiscovery(
+            self.app.get_interpreter_registry(),
+            env=self.get_interpreter_resolver_env(),
+            predicate=self._interpreter_is_compatible,
+        )
 
     def get_interpreter_resolver_env(self) -> dict[str, str]:
         env = dict(os.environ)
@@ -284,7 +304,7 @@ class VirtualEnvironment(EnvironmentInterface):
 
                 break
 
-    def _interpreter_is_compatible(self, interpreter: PythonInfo) -> bool:
+    def _interpreter_is_compatible(self, interpreter: Interpreter) -> bool:
         return (
             interpreter.executable
             and self._is_stable_path(interpreter.executable)
@@ -328,26 +348,8 @@ class VirtualEnvironment(EnvironmentInterface):
         return None
 
     def _find_existing_interpreter(self, python_version: str = '') -> str | None:
-        from virtualenv.discovery import builtin as virtualenv_discovery
-
-        propose_interpreters = virtualenv_discovery.propose_interpreters
-
-        def _patched_propose_interpreters(*args, **kwargs):
-            for interpreter, impl_must_match in propose_interpreters(*args, **kwargs):
-                if not self._interpreter_is_compatible(interpreter):
-                    continue
-
-                yield interpreter, impl_must_match
-
-        virtualenv_discovery.propose_interpreters = _patched_propose_interpreters
-        try:
-            python_info = virtualenv_discovery.get_interpreter(
-                python_version, (), env=self.get_interpreter_resolver_env()
-            )
-            if python_info is not None:
-                return python_info.executable
-        finally:
-            virtualenv_discovery.propose_interpreters = propose_interpreters
+        python_info = self.interpreter_discovery.find(python_version)
+        return None if python_info is None else python_info.executable
 
     def _get_available_distribution(self, python_version: str = '') -> str | None:
         from hatch.python.resolve import get_compatible_distributions
@@ -8,3 +8,7 @@ class PythonDistributionUnknownError(HatchError):
 
 class PythonDistributionResolutionError(HatchError):
     pass
+
+
+class DownloadError(HatchError):
+    pass
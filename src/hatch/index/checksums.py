@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from hatch.index.multipart import compute_digests, map_file
+
+if TYPE_CHECKING:
+    from hatch.utils.fs import Path
+
+MANIFEST_FILE_NAME = '.checksums.json'
+ARTIFACT_EXTENSIONS = ('.whl', '.tar.gz')
+# Weak and variable-length hash functions are not permitted
+RECORD_HASH_ALGORITHMS = frozenset(hashlib.algorithms_guaranteed - {'md5', 'sha1', 'shake_128', 'shake_256'})
+
+
+class ArtifactVerification:
+    def __init__(self, artifact: Path, digests: dict[str, str], errors: list[str]) -> None:
+        self.artifact = artifact
+        self.digests = digests
+        self.errors = errors
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+class ChecksumManifest:
+    """
+    The digests of the artifacts in a directory, recorded along with the size and modification time of
+    each artifact so that outdated entries are ignored.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.__directory = directory
+        self.__entries: dict[str, dict[str, Any]] | None = None
+
+    @property
+    def path(self) -> Path:
+        return self.__directory / MANIFEST_FILE_NAME
+
+    @property
+    def entries(self) -> dict[str, dict[str, Any]]:
+        if self.__entries is None:
+            import json
+
+            try:
+                entries = json.loads(self.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                entries = {}
+
+            self.__entries = entries if isinstance(entries, dict) else {}
+
+        return self.__entries
+
+    def get(self, artifact: Path) -> dict[str, str] | None:
+        entry = self.entries.get(artifact.name)
+        if not isinstance(entry, dict):
+            return None
+
+        try:
+            stat = artifact.stat()
+        except OSError:
+            return None
+
+        if entry.get('size') != stat.st_size or entry.get('mtime_ns') != stat.st_mtime_ns:
+            return None
+
+        digests = entry.get('digests')
+        return digests if isinstance(digests, dict) else None
+
+    def set(self, artifact: Path, digests: dict[str, str]) -> None:
+        stat = artifact.stat()
+        self.entries[artifact.name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'digests': digests}
+
+    def save(self) -> None:
+        import json
+
+        # Entries of removed artifacts are pruned
+        entries = {name: entry for name, entry in sorted(self.entries.items()) if (self.__directory / name).is_file()}
+        self.path.write_atomic(json.dumps(entries, indent=2), 'w', encoding='utf-8')
+
+
+def verify_artifact(artifact: Path) -> ArtifactVerification:
+    """
+    Computes the digests of an artifact and checks its integrity, including every `RECORD` entry of wheels.
+    The digests are computed over a memory map of the artifact so the archive is then read from the page cache.
+    """
+    try:
+        with map_file(artifact) as mapping:
+            digests = compute_digests(mapping)
+
+        errors = validate_wheel(artifact) if artifact.name.endswith('.whl') else validate_sdist(artifact)
+    except OSError as e:
+        return ArtifactVerification(artifact, {}, [str(e)])
+
+    return ArtifactVerification(artifact, digests, errors)
+
+
+def verify_artifacts(artifacts: list[Path], *, jobs: int | None = None) -> list[ArtifactVerification]:
+    """
+    Verifies artifacts concurrently, returning the results in the same order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Hashing and decompression release the GIL
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(verify_artifact, artifacts))
+
+
+def validate_wheel(artifact: Path) -> list[str]:
+    # https://packaging.python.org/en/latest/specifications/recording-installed-packages/#the-record-file
+    import csv
+    import zipfile
+    from base64 import urlsafe_b64encode
+
+    from hatch.utils.network import DEFAULT_CHUNK_SIZE
+
+    errors: list[str] = []
+    try:
+        with zipfile.ZipFile(str(artifact)) as zip_archive:
+            file_names = [name for name in zip_archive.namelist() if not name.endswith('/')]
+            record_files = [name for name in file_names if name.count('/') == 1 and name.endswith('.dist-info/RECORD')]
+            if len(record_files) != 1:
+                return ['Could not find a single `.dist-info/RECORD` file']
+
+            record_file = record_files[0]
+            unrecorded = {record_file, f'{record_file}.jws', f'{record_file}.p7s'}
+            records: dict[str, tuple[str, str]] = {}
+            for row in csv.reader(zip_archive.read(record_file).decode('utf-8').splitlines()):
+                if not row:
+                    continue
+
+                if len(row) != 3:  # noqa: PLR2004
+                    errors.append(f'Invalid RECORD entry: {",".join(row)}')
+                    continue
+
+                path, hash_value, size = row
+                if path not in unrecorded:
+                    records[path] = (hash_value, size)
+
+            for name in file_names:
+                if name in unrecorded:
+                    continue
+
+                if name not in records:
+                    errors.append(f'File not listed in RECORD: {name}')
+                    continue
+
+                hash_value, expected_size = records.pop(name)
+                algorithm, _, expected_digest = hash_value.partition('=')
+                if algorithm not in RECORD_HASH_ALGORITHMS:
+                    errors.append(f'Unsupported hash algorithm `{algorithm}` in RECORD for: {name}')
+                    continue
+
+                hasher = hashlib.new(algorithm)
+                size = 0
+                with zip_archive.open(name) as f:
+                    while chunk := f.read(DEFAULT_CHUNK_SIZE):
+                        hasher.update(chunk)
+                        size += len(chunk)
+
+                if urlsafe_b64encode(hasher.digest()).rstrip(b'=').decode('ascii') != expected_digest:
+                    errors.append(f'Digest mismatch for: {name}')
+                if expected_size and expected_size != str(size):
+                    errors.append(f'Size mismatch for: {name}')
+
+            errors.extend(f'File listed in RECORD not found: {path}' for path in records)
+    except (zipfile.BadZipFile, EOFError, UnicodeDecodeError) as e:
+        errors.append(f'Invalid wheel: {e}')
+
+    return errors
+
+
+def validate_sdist(artifact: Path) -> list[str]:
+    import tarfile
+
+    from hatch.utils.network import DEFAULT_CHUNK_SIZE
+
+    try:
+        with tarfile.open(str(artifact), mode='r|gz') as tar_archive:
+            # Decompress every member to detect truncated or corrupted archives
+            for tar_info in tar_archive:
+                if tar_info.isfile():
+                    with tar_archive.extractfile(tar_info) as f:  # type: ignore[union-attr]
+                        while f.read(DEFAULT_CHUNK_SIZE):
+                            pass
+    except (tarfile.TarError, EOFError, OSError) as e:
+        return [f'Invalid source distribution: {e}']
+
+    return []
+
+
+def update_manifests(results: list[ArtifactVerification]) -> None:
+    """
+    Records the digests of valid artifacts in the manifest of their respective directories.
+    """
+    manifests: dict[Path, ChecksumManifest] = {}
+    for result in results:
+        if not result.valid:
+            continue
+
+        directory = result.artifact.parent
+        if directory not in manifests:
+            manifests[directory] = ChecksumManifest(directory)
+
+        manifests[directory].set(result.artifact, result.digests)
+
+    for manifest in manifests.values():
+        manifest.save()
+
+
+def find_artifacts(directory: Path) -> list[Path]:
+    return sorted(path for path in directory.iterdir() if path.name.endswith(ARTIFACT_EXTENSIONS))
@@ -29,11 +29,22 @@ class IndexURLs:
 
 
 class PackageIndex:
-    def __init__(self, repo: str, *, user='', auth='', ca_cert=None, client_cert=None, client_key=None):
+    def __init__(
+        self,
+        repo: str,
+        *,
+        user='',
+        auth='',
+        ca_cert=None,
+        client_cert=None,
+        client_key=None,
+        trailing_digests=False,
+    ):
         self.urls = IndexURLs(repo)
         self.repo = str(self.urls.repo)
         self.user = user
         self.auth = auth
+        self.trailing_digests = trailing_digests
 
         self.__cert = None
         if client_cert:
@@ -47,50 +58,21 @@ class PackageIndex:
 
     @cached_property
     def client(self) -> httpx.Client:
-        import httpx
+        from hatch.utils.network import get_client
 
-        from hatch.utils.network import DEFAULT_TIMEOUT
+        return get_client(verify=self.__verify, cert=self.__cert)
 
-        return httpx.Client(
-            transport=httpx.HTTPTransport(retries=3, verify=self.__verify, cert=self.__cert),
-            timeout=DEFAULT_TIMEOUT,
-        )
-
-    def upload_artifact(self, artifact: Path, data: dict):
-        import hashlib
-        import io
+    def upload_artifact(self, artifact: Path, data: dict, *, digests: dict[str, str] | None = None):
+        from hatch.index.multipart import MultipartUpload
 
         data[':action'] = 'file_upload'
         data['protocol_version'] = '1'
 
-        with artifact.open('rb') as f:
-            # https://github.com/pypa/warehouse/blob/7fc3ce5bd7ecc93ef54c1652787fb5e7757fe6f2/tests/unit/packaging/test_tasks.py#L189-L191
-            md5_hash = hashlib.md5()  # noqa: S324
-            sha256_hash = hashlib.sha256()
-            blake2_256_hash = hashlib.blake2b(digest_size=32)
-
-            while True:
-                chunk = f.read(io.DEFAULT_BUFFER_SIZE)
-                if not chunk:
-                    break
-
-                md5_hash.update(chunk)
-                sha256_hash.update(chunk)
-                blake2_256_hash.update(chunk)
-
-            data['md5_digest'] = md5_hash.hexdigest()
-            data['sha256_digest'] = sha256_hash.hexdigest()
-            data['blake2_256_digest'] = blake2_256_hash.hexdigest()
-
-            f.seek(0)
-
-            response = self.client.post(
-                self.repo,
-                data=data,
-                files={'content': (artifact.name, f, 'application/octet-stream')},
-                auth=(self.user, self.auth),
-            )
-            response.raise_for_status()
+        body = MultipartUpload(artifact, data, digests=digests, trailing_digests=self.trailing_digests)
+        response = self.client.post(self.repo, content=body, headers=body.headers, auth=(self.user, self.auth))
+        response.raise_for_status()
+
+        data.update(body.digests)
 
     def get_simple_api(self, project: str) -> httpx.Response:
         return self.client.get(
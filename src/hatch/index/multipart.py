@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from contextlib import contextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from hatch.utils.network import DEFAULT_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    import mmap
+
+    from hatch.utils.fs import Path
+
+# https://github.com/pypa/warehouse/blob/7fc3ce5bd7ecc93ef54c1652787fb5e7757fe6f2/tests/unit/packaging/test_tasks.py#L189-L191
+DIGEST_ALGORITHMS: dict[str, Callable[..., Any]] = {
+    'md5_digest': hashlib.md5,
+    'sha256_digest': hashlib.sha256,
+    'blake2_256_digest': lambda data=b'': hashlib.blake2b(data, digest_size=32),
+}
+
+
+class MultipartUpload:
+    """
+    A `multipart/form-data` request body for the legacy upload API that reads the artifact only once.
+
+    By default, the digests of the artifact are computed while it is being sent and are encoded as
+    fields that follow it, which most indexes accept because form fields may appear in any order.
+    Otherwise, the digests are computed beforehand in a single pass over a memory map of the artifact
+    that is then reused for the upload, so the file is still only read from disk once. Digests that
+    are already known, such as from a checksum manifest, precede the file and are not recomputed.
+    """
+
+    def __init__(
+        self,
+        artifact: Path,
+        fields: dict[str, Any],
+        *,
+        digests: dict[str, str] | None = None,
+        trailing_digests: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.__artifact = artifact
+        self.__fields = fields
+        self.__known_digests = digests
+        self.__trailing_digests = trailing_digests and digests is None
+        self.__chunk_size = chunk_size
+        self.__boundary = os.urandom(16).hex().encode('ascii')
+        self.__digests: dict[str, str] = {}
+
+    @property
+    def digests(self) -> dict[str, str]:
+        """
+        The digests of the artifact, available once the body has been fully iterated.
+        """
+        return self.__digests
+
+    @cached_property
+    def headers(self) -> dict[str, str]:
+        # The digests have a fixed length so the size is known before they are computed
+        placeholder_digests = self.__known_digests or {
+            name: '0' * algorithm().digest_size * 2 for name, algorithm in DIGEST_ALGORITHMS.items()
+        }
+        size = (
+            len(self.__encode_preamble(placeholder_digests))
+            + self.__artifact.stat().st_size
+            + len(self.__encode_trailer(placeholder_digests))
+        )
+
+        return {
+            'Content-Type': f'multipart/form-data; boundary={self.__boundary.decode("ascii")}',
+            'Content-Length': str(size),
+        }
+
+    def __iter__(self) -> Iterator[bytes]:
+        with map_file(self.__artifact) as mapping:
+            if self.__trailing_digests:
+                hashers = {name: algorithm() for name, algorithm in DIGEST_ALGORITHMS.items()}
+
+                yield self.__encode_preamble({})
+                for offset in range(0, len(mapping), self.__chunk_size):
+                    chunk = mapping[offset : offset + self.__chunk_size]
+                    for hasher in hashers.values():
+                        hasher.update(chunk)
+
+                    yield chunk
+
+                self.__digests = {name: hasher.hexdigest() for name, hasher in hashers.items()}
+            else:
+                self.__digests = (
+                    compute_digests(mapping) if self.__known_digests is None else dict(self.__known_digests)
+                )
+
+                yield self.__encode_preamble(self.__digests)
+                for offset in range(0, len(mapping), self.__chunk_size):
+                    yield mapping[offset : offset + self.__chunk_size]
+
+        yield self.__encode_trailer(self.__digests)
+
+    def __encode_preamble(self, digests: dict[str, str]) -> bytes:
+        parts = [self.__encode_field(name, value) for name, value in self.__iter_fields(self.__fields)]
+        if not self.__trailing_digests:
+            parts.extend(self.__encode_field(name, value) for name, value in digests.items())
+
+        parts.append(
+            self.__encode_part_header(
+                b'form-data; name="content"; filename="%s"' % quote(self.__artifact.name),
+                b'Content-Type: application/octet-stream\r\n',
+            )
+        )
+        return b''.join(parts)
+
+    def __encode_trailer(self, digests: dict[str, str]) -> bytes:
+        parts = [b'\r\n']
+        if self.__trailing_digests:
+            parts.extend(self.__encode_field(name, value) for name, value in digests.items())
+
+        parts.append(b'--%s--\r\n' % self.__boundary)
+        return b''.join(parts)
+
+    def __encode_field(self, name: str, value: str) -> bytes:
+        return self.__encode_part_header(b'form-data; name="%s"' % quote(name)) + value.encode('utf-8') + b'\r\n'
+
+    def __encode_part_header(self, disposition: bytes, extra_headers: bytes = b'') -> bytes:
+        return b'--%s\r\nContent-Disposition: %s\r\n%s\r\n' % (self.__boundary, disposition, extra_headers)
+
+    @staticmethod
+    def __iter_fields(fields: dict[str, Any]) -> Iterator[tuple[str, str]]:
+        for name, value in fields.items():
+            if isinstance(value, (list, tuple)):
+                for item in value:
+                    yield name, str(item)
+            else:
+                yield name, str(value)
+
+
+def compute_digests(data: bytes | mmap.mmap) -> dict[str, str]:
+    # Each hash function consumes the entire buffer without copying it
+    with memoryview(data) as view:
+        return {name: algorithm(view).hexdigest() for name, algorithm in DIGEST_ALGORITHMS.items()}
+
+
+@contextmanager
+def map_file(path: Path) -> Iterator[bytes | mmap.mmap]:
+    import mmap
+
+    with path.open('rb') as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            yield mapping
+
+
+def quote(value: str) -> bytes:
+    # https://html.spec.whatwg.org/multipage/form-control-infrastructure.html#multipart-form-data
+    return value.replace('"', '%22').replace('\r', '%0D').replace('\n', '%0A').encode('utf-8')
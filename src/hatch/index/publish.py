@@ -17,29 +17,13 @@ RENAMED_METADATA_FIELDS = {'classifier': 'classifiers', 'project_url': 'project_
 
 
 def get_wheel_form_data(artifact):
-    import zipfile
-
     from packaging.tags import parse_tag
 
-    with zipfile.ZipFile(str(artifact), 'r') as zip_archive:
-        for path in zip_archive.namelist():
-            root = path.split('/', 1)[0]
-            if root.endswith('.dist-info'):
-                dist_info_dir = root
-                break
-        else:  # no cov
-            message = f'Could not find the `.dist-info` directory in wheel: {artifact}'
-            raise ArtifactMetadataError(message)
-
-        try:
-            with zip_archive.open(f'{dist_info_dir}/METADATA') as zip_file:
-                metadata_file_contents = zip_file.read().decode('utf-8')
-        except KeyError:  # no cov
-            message = f'Could not find a `METADATA` file in the `{dist_info_dir}` directory'
-            raise ArtifactMetadataError(message) from None
-        else:
-            data = parse_headers(metadata_file_contents)
+    metadata_file_contents = read_sidecar_metadata(artifact)
+    if metadata_file_contents is None:
+        metadata_file_contents = read_wheel_metadata(artifact)
 
+    data = parse_headers(metadata_file_contents)
     data['filetype'] = 'bdist_wheel'
 
     # Examples:
@@ -52,33 +36,77 @@ def get_wheel_form_data(artifact):
 
 
 def get_sdist_form_data(artifact):
-    import tarfile
+    metadata_file_contents = read_sidecar_metadata(artifact)
+    if metadata_file_contents is None:
+        metadata_file_contents = read_sdist_metadata(artifact)
 
-    with tarfile.open(str(artifact), 'r:gz') as tar_archive:
-        pkg_info_dir_parts = []
-        for tar_info in tar_archive:
-            if tar_info.isfile():
-                pkg_info_dir_parts.append(tar_info.name.split('/', 1)[0])
+    data = parse_headers(metadata_file_contents)
+    data['filetype'] = 'sdist'
+    data['pyversion'] = 'source'
+
+    return data
+
+
+def read_sidecar_metadata(artifact):
+    """
+    Returns the contents of the core metadata file stored next to the artifact, as served by indexes
+    implementing PEP 658, if it is at least as recent as the artifact.
+    """
+    metadata_file = artifact.parent / f'{artifact.name}.metadata'
+    try:
+        if metadata_file.stat().st_mtime < artifact.stat().st_mtime:
+            return None
+
+        return metadata_file.read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+
+def read_wheel_metadata(artifact):
+    import zipfile
+
+    with zipfile.ZipFile(str(artifact), 'r') as zip_archive:
+        for path in zip_archive.namelist():
+            root = path.split('/', 1)[0]
+            if root.endswith('.dist-info'):
+                dist_info_dir = root
                 break
         else:  # no cov
-            message = f'Could not find any files in sdist: {artifact}'
+            message = f'Could not find the `.dist-info` directory in wheel: {artifact}'
             raise ArtifactMetadataError(message)
 
-        pkg_info_dir_parts.append('PKG-INFO')
-        pkg_info_path = '/'.join(pkg_info_dir_parts)
         try:
-            with tar_archive.extractfile(pkg_info_path) as tar_file:
-                metadata_file_contents = tar_file.read().decode('utf-8')
+            with zip_archive.open(f'{dist_info_dir}/METADATA') as zip_file:
+                return zip_file.read().decode('utf-8')
         except KeyError:  # no cov
-            message = f'Could not find file: {pkg_info_path}'
+            message = f'Could not find a `METADATA` file in the `{dist_info_dir}` directory'
             raise ArtifactMetadataError(message) from None
-        else:
-            data = parse_headers(metadata_file_contents)
 
-    data['filetype'] = 'sdist'
-    data['pyversion'] = 'source'
 
-    return data
+def read_sdist_metadata(artifact):
+    import tarfile
+
+    # Read the archive as a stream so that decompression stops as soon as the metadata file is found,
+    # which is the first member of source distributions built by Hatchling
+    pkg_info_path = None
+    with tarfile.open(str(artifact), 'r|gz') as tar_archive:
+        for tar_info in tar_archive:
+            if not tar_info.isfile():
+                continue
+
+            if pkg_info_path is None:
+                pkg_info_path = f'{tar_info.name.split("/", 1)[0]}/PKG-INFO'
+
+            if tar_info.name == pkg_info_path:
+                with tar_archive.extractfile(tar_info) as tar_file:
+                    return tar_file.read().decode('utf-8')
+
+    if pkg_info_path is None:  # no cov
+        message = f'Could not find any files in sdist: {artifact}'
+        raise ArtifactMetadataError(message)
+
+    message = f'Could not find file: {pkg_info_path}'
+    raise ArtifactMetadataError(message)
 
 
 def parse_headers(metadata_file_contents):
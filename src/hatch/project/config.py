@@ -59,7 +59,9 @@ class ProjectConfig:
     @property
     def env_requires_complex(self) -> list[Requirement]:
         if self._env_requires_complex is None:
-            from packaging.requirements import InvalidRequirement, Requirement
+            from packaging.requirements import InvalidRequirement
+
+            from hatchling.metadata.utils import parse_requirement
 
             requires = self.env.get('requires', [])
             if not isinstance(requires, list):
@@ -74,7 +76,7 @@ class ProjectConfig:
                     raise TypeError(message)
 
                 try:
-                    requires_complex.append(Requirement(entry))
+                    requires_complex.append(parse_requirement(entry))
                 except InvalidRequirement as e:
                     message = f'Requirement #{i} in `tool.hatch.env.requires` is invalid: {e}'
                     raise ValueError(message) from None
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 import re
 from contextlib import contextmanager
 from functools import cached_property
-from typing import TYPE_CHECKING, Generator, cast
+from typing import TYPE_CHECKING, Any, Generator, cast
 
 from hatch.project.env import EnvironmentMetadata
 from hatch.utils.fs import Path
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
     from hatch.config.model import RootConfig
     from hatch.env.plugin.interface import EnvironmentInterface
     from hatch.project.frontend.core import BuildFrontend
+    from hatchling.builders.wheel import WheelBuilder
 
 
 class Project:
@@ -43,7 +45,11 @@ class Project:
         if self._plugin_manager is None:
             from hatch.plugin.manager import PluginManager
 
-            self._plugin_manager = PluginManager()
+            index_directory = None
+            if self.__app is not None and self.__app.cache_dir is not None:
+                index_directory = str(self.__app.cache_dir / 'plugins')
+
+            self._plugin_manager = PluginManager(index_directory=index_directory)
 
         return self._plugin_manager
 
@@ -197,6 +203,51 @@ class Project:
 
             self.env_metadata.update_dependency_hash(environment, new_dep_hash)
 
+        if environment.dev_mode and not environment.skip_install:
+            self.refresh_dev_mode(environment)
+
+    def refresh_dev_mode(self, environment: EnvironmentInterface) -> None:
+        """
+        Updates the installation of the project in development mode whenever the files that expose it change,
+        which are determined by the selected project files and the `dev-mode-dirs` option of the wheel target.
+        """
+        from hatch.project.constants import BUILD_BACKEND
+
+        if environment.metadata.build.build_backend != BUILD_BACKEND:
+            return
+
+        import json
+        from hashlib import sha256
+
+        from hatchling.builders.wheel import WheelBuilder
+
+        builder = WheelBuilder(str(environment.root), plugin_manager=self.plugin_manager, metadata=environment.metadata)
+        try:
+            dev_mode_state = get_dev_mode_state(builder)
+        except Exception:  # noqa: BLE001
+            # Invalid configuration is reported by the backend upon installation
+            return
+
+        # Selecting the project files requires walking the entire project
+        if dev_mode_state == self.env_metadata.dev_mode_state(environment):
+            return
+
+        try:
+            editable_files = builder.get_editable_files()
+        except Exception:  # noqa: BLE001
+            return
+
+        editable_hash = sha256(json.dumps(editable_files).encode('utf-8')).hexdigest()
+        current_editable_hash = self.env_metadata.editable_hash(environment)
+
+        # The files of existing installations are recorded without being compared
+        if current_editable_hash and editable_hash != current_editable_hash:
+            with environment.app_status_project_installation():
+                if not environment.refresh_project_dev_mode(editable_files):
+                    environment.install_project_dev_mode()
+
+        self.env_metadata.update_editable_hash(environment, editable_hash, dev_mode_state)
+
     def prepare_build_environment(self, *, targets: list[str] | None = None) -> None:
         from hatch.project.constants import BUILD_BACKEND
 
@@ -234,6 +285,22 @@ class Project:
                 with self.build_env.app_status_dependency_synchronization():
                     self.build_env.sync_dependencies()
 
+                # The backend must be imported again to observe the new dependencies
+                self.build_frontend.close_session()
+
+    def get_cached_core_metadata(self) -> dict[str, Any] | None:
+        from hatch.project.constants import BUILD_BACKEND
+
+        if not self.build_env.exists():
+            return None
+
+        # The inputs are checked with the same environment variables used for resolution
+        with self.location.as_cwd(), self.build_env.get_env_vars():
+            if self.metadata.build.build_backend != BUILD_BACKEND:
+                return self.build_frontend.get_cached_core_metadata()
+
+            return self.build_frontend.hatch.metadata_cache.get()
+
     def get_dependencies(self) -> tuple[list[str], dict[str, list[str]]]:
         dynamic_fields = {'dependencies', 'optional-dependencies'}
         if not dynamic_fields.intersection(self.metadata.dynamic):
@@ -243,13 +310,15 @@ class Project:
 
         from hatch.project.constants import BUILD_BACKEND
 
-        self.prepare_build_environment()
-        build_backend = self.metadata.build.build_backend
-        with self.location.as_cwd(), self.build_env.get_env_vars():
-            if build_backend != BUILD_BACKEND:
-                project_metadata = self.build_frontend.get_core_metadata()
-            else:
-                project_metadata = self.build_frontend.hatch.get_core_metadata()
+        project_metadata = self.get_cached_core_metadata()
+        if project_metadata is None:
+            self.prepare_build_environment()
+            build_backend = self.metadata.build.build_backend
+            with self.location.as_cwd(), self.build_env.get_env_vars():
+                if build_backend != BUILD_BACKEND:
+                    project_metadata = self.build_frontend.get_core_metadata()
+                else:
+                    project_metadata = self.build_frontend.hatch.get_core_metadata()
 
         dynamic_dependencies: list[str] = project_metadata.get('dependencies', [])
         dynamic_features: dict[str, list[str]] = project_metadata.get('optional-dependencies', {})
@@ -405,3 +474,43 @@ class Project:
 
         with open(str(project_file_path), 'w', encoding='utf-8') as f:
             f.write(tomlkit.dumps(raw_config))
+
+
+def get_dev_mode_state(builder: WheelBuilder) -> str:
+    """
+    Returns a hash that changes whenever the files exposing the project to editable installations might, without
+    walking the project. This covers the configuration files and the modification times of the directories in
+    which top-level modules and packages may be added or removed.
+    """
+    import json
+    from hashlib import sha256
+
+    from hatch.project.constants import DEFAULT_CONFIG_FILE
+    from hatchling.__about__ import __version__
+
+    root = builder.root
+    config_files = {}
+    for file_name in ('pyproject.toml', DEFAULT_CONFIG_FILE, '.gitignore'):
+        path = os.path.join(root, file_name)
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                config_files[file_name] = sha256(f.read()).hexdigest()
+
+    source_roots = {root}
+    source_roots.update(os.path.join(root, source) for source in builder.config.sources if source)
+    source_roots.update(os.path.join(root, directory) for directory in builder.config.dev_mode_dirs)
+
+    modification_times = {}
+    for source_root in sorted(source_roots):
+        try:
+            modification_times[source_root] = os.stat(source_root).st_mtime_ns
+            entries = list(os.scandir(source_root))
+        except OSError:
+            continue
+
+        for entry in entries:
+            if not entry.name.startswith('.') and entry.is_dir():
+                modification_times[entry.path] = entry.stat().st_mtime_ns
+
+    state = {'backend': __version__, 'config_files': config_files, 'modification_times': modification_times}
+    return sha256(json.dumps(state, sort_keys=True).encode('utf-8')).hexdigest()
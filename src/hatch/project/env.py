@@ -388,6 +388,18 @@ class EnvironmentMetadata:
         metadata['dependency_hash'] = dependency_hash
         self._write(environment, metadata)
 
+    def editable_hash(self, environment: EnvironmentInterface) -> str:
+        return self._read(environment).get('editable_hash', '')
+
+    def dev_mode_state(self, environment: EnvironmentInterface) -> str:
+        return self._read(environment).get('dev_mode_state', '')
+
+    def update_editable_hash(self, environment: EnvironmentInterface, editable_hash: str, dev_mode_state: str) -> None:
+        metadata = self._read(environment)
+        metadata['editable_hash'] = editable_hash
+        metadata['dev_mode_state'] = dev_mode_state
+        self._write(environment, metadata)
+
     def reset(self, environment: EnvironmentInterface) -> None:
         self._metadata_file(environment).unlink(missing_ok=True)
 
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import json
 import sys
-from functools import lru_cache
+from contextlib import contextmanager, suppress
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, Any, Literal
 
 from hatch.utils.fs import Path
 from hatch.utils.runner import ExecutionContext
 
 if TYPE_CHECKING:
-    from hatch.env.plugin.interface import EnvironmentInterface
+    from collections.abc import Generator
+    from subprocess import Popen
+
+    from hatch.env.plugin.interface import EnvironmentInterface, FileSystemContext
     from hatch.project.core import Project
 
 
@@ -19,11 +23,18 @@ class BuildFrontend:
         self.__env = env
         self.__scripts = StandardBuildFrontendScripts(self.__project, self.__env)
         self.__hatch = HatchBuildFrontend(self.__project, self.__env)
+        self.__hook_cache = HookResultCache(self.__project, self.__env)
+        self.__session: BuildFrontendSession | None = None
+        self.__session_enabled = False
 
     @property
     def scripts(self) -> StandardBuildFrontendScripts:
         return self.__scripts
 
+    @property
+    def hook_cache(self) -> HookResultCache:
+        return self.__hook_cache
+
     @property
     def hatch(self) -> HatchBuildFrontend:
         return self.__hatch
@@ -31,18 +42,7 @@ class BuildFrontend:
     def build_sdist(self, directory: Path) -> Path:
         with self.__env.fs_context() as fs_context:
             output_context = fs_context.join('output')
-            output_context.local_path.ensure_dir_exists()
-            script = self.scripts.build_sdist(project_root=self.__env.project_root, output_dir=output_context.env_path)
-
-            script_context = fs_context.join('build_sdist.py')
-            script_context.local_path.parent.ensure_dir_exists()
-            script_context.local_path.write_text(script)
-            script_context.sync_env()
-
-            context = ExecutionContext(self.__env)
-            context.add_shell_command(['python', '-u', script_context.env_path])
-            self.__env.app.execute_context(context)
-            output_context.sync_local()
+            self.__run_hook(fs_context, output_context, 'build_sdist')
 
             output_path = output_context.local_path / 'output.json'
             output = json.loads(output_path.read_text())
@@ -55,18 +55,7 @@ class BuildFrontend:
     def build_wheel(self, directory: Path) -> Path:
         with self.__env.fs_context() as fs_context:
             output_context = fs_context.join('output')
-            output_context.local_path.ensure_dir_exists()
-            script = self.scripts.build_wheel(project_root=self.__env.project_root, output_dir=output_context.env_path)
-
-            script_context = fs_context.join('build_wheel.py')
-            script_context.local_path.parent.ensure_dir_exists()
-            script_context.local_path.write_text(script)
-            script_context.sync_env()
-
-            context = ExecutionContext(self.__env)
-            context.add_shell_command(['python', '-u', script_context.env_path])
-            self.__env.app.execute_context(context)
-            output_context.sync_local()
+            self.__run_hook(fs_context, output_context, 'build_wheel')
 
             output_path = output_context.local_path / 'output.json'
             output = json.loads(output_path.read_text())
@@ -77,53 +66,128 @@ class BuildFrontend:
             return directory / artifact_path.name
 
     def get_requires(self, build: Literal['sdist', 'wheel', 'editable']) -> list[str]:
+        hook = f'get_requires_for_build_{build}'
+        if (cached_requires := self.hook_cache.get(hook)) is not None:
+            return cached_requires
+
         with self.__env.fs_context() as fs_context:
             output_context = fs_context.join('output')
-            output_context.local_path.ensure_dir_exists()
-            script = self.scripts.get_requires(
-                project_root=self.__env.project_root, output_dir=output_context.env_path, build=build
-            )
-
-            script_context = fs_context.join(f'get_requires_{build}.py')
-            script_context.local_path.parent.ensure_dir_exists()
-            script_context.local_path.write_text(script)
-            script_context.sync_env()
-
-            context = ExecutionContext(self.__env)
-            context.add_shell_command(['python', '-u', script_context.env_path])
-            self.__env.app.execute_context(context)
-            output_context.sync_local()
+            self.__run_hook(fs_context, output_context, hook)
 
             output_path = output_context.local_path / 'output.json'
             output = json.loads(output_path.read_text())
+            self.hook_cache.set(hook, output['return_val'])
             return output['return_val']
 
     def get_core_metadata(self, *, editable: bool = False) -> dict[str, Any]:
         from hatchling.metadata.spec import project_metadata_from_core_metadata
 
+        if (cached_metadata := self.get_cached_core_metadata(editable=editable)) is not None:
+            return cached_metadata
+
+        hook = self.__get_metadata_hook(editable)
         with self.__env.fs_context() as fs_context:
             output_context = fs_context.join('output')
-            output_context.local_path.ensure_dir_exists()
-            script = self.scripts.prepare_metadata(
-                project_root=self.__env.project_root, output_dir=output_context.env_path, editable=editable
-            )
-
-            script_context = fs_context.join('get_core_metadata.py')
-            script_context.local_path.parent.ensure_dir_exists()
-            script_context.local_path.write_text(script)
-            script_context.sync_env()
-
-            context = ExecutionContext(self.__env)
-            context.add_shell_command(['python', '-u', script_context.env_path])
-            self.__env.app.execute_context(context)
-            output_context.sync_local()
+            self.__run_hook(fs_context, output_context, hook)
 
             output_path = output_context.local_path / 'output.json'
             output = json.loads(output_path.read_text())
 
             work_dir = output_context.local_path / 'work'
             metadata_file = Path(work_dir) / output['return_val'] / 'METADATA'
-            return project_metadata_from_core_metadata(metadata_file.read_text())
+            project_metadata = project_metadata_from_core_metadata(metadata_file.read_text())
+
+        self.hook_cache.set(hook, project_metadata, **self.__get_metadata_inputs())
+        return project_metadata
+
+    @contextmanager
+    def session(self) -> Generator[None, None, None]:
+        """
+        Hooks called while this is active are sent to a single process that imports the backend only once.
+        This only applies to environments that run commands locally, others always use a process per hook.
+        """
+        if self.__session_enabled or not self.supports_session():
+            yield
+            return
+
+        self.__session_enabled = True
+        try:
+            yield
+        finally:
+            self.__session_enabled = False
+            self.close_session()
+
+    def close_session(self) -> None:
+        """
+        Ends the current hook process, if any, such that the next hook starts a new one. This must be called
+        whenever the dependencies of the build environment change.
+        """
+        if self.__session is not None:
+            self.__session.close()
+            self.__session = None
+
+    def supports_session(self) -> bool:
+        from hatch.env.plugin.interface import EnvironmentInterface
+
+        # Requests and results are exchanged through the local file system and the standard streams of
+        # a process that is started directly
+        env_type = type(self.__env)
+        return (
+            env_type.fs_context is EnvironmentInterface.fs_context
+            and env_type.run_shell_command is EnvironmentInterface.run_shell_command
+        )
+
+    def __run_hook(self, fs_context: FileSystemContext, output_context: FileSystemContext, hook: str) -> None:
+        output_context.local_path.ensure_dir_exists()
+        if self.__session_enabled:
+            if self.__session is None:
+                self.__session = BuildFrontendSession(
+                    self.__env, self.scripts.get_session_script(project_root=self.__env.project_root)
+                )
+
+            self.__session.call(output_dir=output_context.env_path, hook=hook, kwargs=get_hook_kwargs(hook))
+            return
+
+        script = self.scripts.get_runner_script(
+            project_root=self.__env.project_root,
+            output_dir=output_context.env_path,
+            hook=hook,
+            kwargs=get_hook_kwargs(hook),
+        )
+
+        script_context = fs_context.join(f'{hook}.py')
+        script_context.local_path.parent.ensure_dir_exists()
+        script_context.local_path.write_text(script)
+        script_context.sync_env()
+
+        context = ExecutionContext(self.__env)
+        context.add_shell_command(['python', '-u', script_context.env_path])
+        self.__env.app.execute_context(context)
+        output_context.sync_local()
+
+    def get_cached_core_metadata(self, *, editable: bool = False) -> dict[str, Any] | None:
+        return self.hook_cache.get(self.__get_metadata_hook(editable), **self.__get_metadata_inputs())
+
+    @staticmethod
+    def __get_metadata_hook(editable: bool) -> str:  # noqa: FBT001
+        return 'prepare_metadata_for_build_editable' if editable else 'prepare_metadata_for_build_wheel'
+
+    def __get_metadata_inputs(self) -> dict[str, Any]:
+        # Dynamic fields may be resolved from any file, otherwise only files referenced by the static fields
+        # are read
+        if 'project' not in self.__project.metadata.config or self.__project.metadata.dynamic:
+            return {'sources': True}
+
+        files: list[str] = []
+        project_config = self.__project.metadata.config['project']
+        for field in ('readme', 'license'):
+            value = project_config.get(field)
+            if isinstance(value, str) and field == 'readme':
+                files.append(value)
+            elif isinstance(value, dict) and isinstance(value.get('file'), str):
+                files.append(value['file'])
+
+        return {'files': files}
 
 
 class HatchBuildFrontend:
@@ -131,12 +195,23 @@ class HatchBuildFrontend:
         self.__project = project
         self.__env = env
         self.__scripts = HatchBuildFrontendScripts(self.__project, self.__env)
+        self.__metadata_cache = CoreMetadataCache(self.__project, self.__env)
+        self.__hook_cache = HookResultCache(self.__project, self.__env)
 
     @property
     def scripts(self) -> HatchBuildFrontendScripts:
         return self.__scripts
 
+    @property
+    def metadata_cache(self) -> CoreMetadataCache:
+        return self.__metadata_cache
+
     def get_build_deps(self, targets: list[str]) -> list[str]:
+        hook = f'build_deps_{"_".join(targets)}'
+        custom_hook_files = self.__get_custom_hook_files(targets)
+        if (cached_dependencies := self.__hook_cache.get(hook, files=custom_hook_files)) is not None:
+            return cached_dependencies
+
         with self.__env.fs_context() as fs_context:
             output_context = fs_context.join('output')
             output_context.local_path.ensure_dir_exists()
@@ -156,7 +231,22 @@ class HatchBuildFrontend:
 
             output_path = output_context.local_path / 'output.json'
             output: list[str] = json.loads(output_path.read_text())
-            return output
+
+        self.__hook_cache.set(hook, output, files=custom_hook_files)
+        return output
+
+    def __get_custom_hook_files(self, targets: list[str]) -> list[str]:
+        from hatchling.builders.hooks.custom import CustomBuildHook
+        from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT
+
+        # Custom hooks may define dependencies dynamically based on their own code
+        files: set[str] = set()
+        for target in targets:
+            hook_config = self.__project.config.build.target(target).hook_config
+            if isinstance(custom_config := hook_config.get(CustomBuildHook.PLUGIN_NAME), dict):
+                files.add(custom_config.get('path') or DEFAULT_BUILD_SCRIPT)
+
+        return sorted(files)
 
     def get_core_metadata(self) -> dict[str, Any]:
         with self.__env.fs_context() as fs_context:
@@ -178,8 +268,43 @@ class HatchBuildFrontend:
 
             output_path = output_context.local_path / 'output.json'
             output: dict[str, Any] = json.loads(output_path.read_text())
+
+            cache_inputs_path = output_context.local_path / 'cache_inputs.json'
+            if cache_inputs_path.is_file():
+                self.metadata_cache.set(output, json.loads(cache_inputs_path.read_text()))
+
             return output
 
+    def get_build_options(self) -> list[str]:
+        """
+        The parameters of the `build` command of the version of Hatchling installed in the build environment,
+        which may not support every option that Hatch is able to pass.
+        """
+        hook = 'build_options'
+        if (cached_options := self.__hook_cache.get(hook)) is not None:
+            return cached_options
+
+        with self.__env.fs_context() as fs_context:
+            output_context = fs_context.join('output')
+            output_context.local_path.ensure_dir_exists()
+            script = self.scripts.get_build_options(output_dir=output_context.env_path)
+
+            script_context = fs_context.join('get_build_options.py')
+            script_context.local_path.parent.ensure_dir_exists()
+            script_context.local_path.write_text(script)
+            script_context.sync_env()
+
+            context = ExecutionContext(self.__env)
+            context.add_shell_command(['python', '-u', script_context.env_path])
+            self.__env.app.execute_context(context)
+            output_context.sync_local()
+
+            output_path = output_context.local_path / 'output.json'
+            output: list[str] = json.loads(output_path.read_text())
+
+        self.__hook_cache.set(hook, output)
+        return output
+
     def get_required_build_deps(self, targets: list[str]) -> list[str]:
         target_dependencies: list[str] = []
         hooks: set[str] = set()
@@ -202,6 +327,250 @@ class HatchBuildFrontend:
         return target_dependencies
 
 
+class CoreMetadataCache:
+    """
+    Core metadata resolved by Hatchling, stored along with the state of the inputs that determined it:
+    the configuration files plus any files and environment variables declared by the version source
+    and metadata hooks.
+    """
+
+    def __init__(self, project: Project, env: EnvironmentInterface) -> None:
+        self.__project = project
+        self.__env = env
+
+    def get(self) -> dict[str, Any] | None:
+        cache_file = self._cache_file
+        if cache_file is None or not cache_file.is_file():
+            return None
+
+        try:
+            entry = json.loads(cache_file.read_text())
+        except ValueError:
+            return None
+
+        if entry.get('key') != self._key or entry.get('state') != self._get_state(entry['inputs']):
+            return None
+
+        return entry['metadata']
+
+    def set(self, metadata: dict[str, Any], inputs: dict[str, list[str]] | None) -> None:
+        cache_file = self._cache_file
+        if cache_file is None:
+            return
+
+        if inputs is None:
+            cache_file.unlink(missing_ok=True)
+            return
+
+        entry = {'key': self._key, 'inputs': inputs, 'state': self._get_state(inputs), 'metadata': metadata}
+        cache_file.ensure_parent_dir_exists()
+        cache_file.write_atomic(json.dumps(entry), 'w', encoding='utf-8')
+
+    def _get_state(self, inputs: dict[str, list[str]]) -> dict[str, dict[str, str | None]]:
+        import os
+        from hashlib import sha256
+
+        files: dict[str, str | None] = {}
+        for relative_path in inputs.get('files', []):
+            path = self.__project.location / relative_path
+            files[relative_path] = sha256(path.read_bytes()).hexdigest() if path.is_file() else None
+
+        # Only digests are stored in case the values are sensitive
+        env_vars: dict[str, str | None] = {}
+        for env_var in inputs.get('env-vars', []):
+            value = os.environ.get(env_var)
+            env_vars[env_var] = None if value is None else sha256(value.encode('utf-8')).hexdigest()
+
+        return {'files': files, 'env-vars': env_vars}
+
+    @cached_property
+    def _key(self) -> str:
+        # Different build environments may have different versions of the backend and plugins
+        return f'{self.__env.name}:{self.__env.dependency_hash()}'
+
+    @cached_property
+    def _cache_file(self) -> Path | None:
+        cache_dir = self.__env.app.cache_dir
+        if cache_dir is None:
+            return None
+
+        return cache_dir / 'metadata' / self.__project.location.id / f'{self.__env.name}.json'
+
+
+class HookResultCache:
+    """
+    The results of build backend hooks, stored along with the state of the inputs that determined them:
+    the build backend and the dependencies of the build environment, the build configuration files, any
+    other files read by the hook, the environment variables that enable or disable build hooks and, for
+    hooks that may read any file, the state of the Git working tree.
+    """
+
+    CONFIG_FILES = ('pyproject.toml', 'hatch.toml', 'setup.py', 'setup.cfg')
+
+    def __init__(self, project: Project, env: EnvironmentInterface) -> None:
+        self.__project = project
+        self.__env = env
+
+    def get(self, hook: str, *, files: list[str] | None = None, sources: bool = False) -> Any | None:
+        entry = self._load().get(hook)
+        if not isinstance(entry, dict) or entry.get('key') != self._key:
+            return None
+
+        state = self._get_state(files or [], sources=sources)
+        if state is None or entry.get('state') != state:
+            return None
+
+        return entry.get('result')
+
+    def set(self, hook: str, result: Any, *, files: list[str] | None = None, sources: bool = False) -> None:
+        cache_file = self._cache_file
+        if cache_file is None:
+            return
+
+        entries = self._load()
+        state = self._get_state(files or [], sources=sources)
+        if state is None:
+            entries.pop(hook, None)
+        else:
+            entries[hook] = {'key': self._key, 'state': state, 'result': result}
+
+        cache_file.ensure_parent_dir_exists()
+        cache_file.write_atomic(json.dumps(entries), 'w', encoding='utf-8')
+
+    def _load(self) -> dict[str, Any]:
+        cache_file = self._cache_file
+        if cache_file is None or not cache_file.is_file():
+            return {}
+
+        try:
+            entries = json.loads(cache_file.read_text())
+        except ValueError:
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def _get_state(self, files: list[str], *, sources: bool) -> dict[str, Any] | None:
+        from hashlib import sha256
+
+        file_digests: dict[str, str | None] = {}
+        for relative_path in (*self.CONFIG_FILES, *files):
+            path = self.__project.location / relative_path
+            file_digests[relative_path] = sha256(path.read_bytes()).hexdigest() if path.is_file() else None
+
+        state: dict[str, Any] = {'files': file_digests, 'env_vars': self._get_env_var_state()}
+        if sources:
+            from hatch.utils.git import get_worktree_state
+
+            # Without version control, reading every file would not be much faster than running the hook
+            if (worktree_state := get_worktree_state(self.__env.platform, self.__project.location)) is None:
+                return None
+
+            state['worktree'] = worktree_state
+
+        return state
+
+    def _get_env_var_state(self) -> dict[str, str]:
+        from hatch.project.constants import BuildEnvVars
+
+        # Hooks are run with the variables of the build environment applied
+        env_vars = self.__env.get_env_vars()
+        return {
+            env_var: value
+            for env_var, value in sorted(env_vars.items())
+            if env_var in {BuildEnvVars.NO_HOOKS, BuildEnvVars.HOOKS_ENABLE}
+            or env_var.startswith(BuildEnvVars.HOOK_ENABLE_PREFIX)
+        }
+
+    @cached_property
+    def _key(self) -> str:
+        build_config = self.__project.metadata.build
+        return ':'.join((
+            self.__env.name,
+            self.__env.dependency_hash(),
+            build_config.build_backend,
+            self.__env.pathsep.join(build_config.backend_path),
+        ))
+
+    @cached_property
+    def _cache_file(self) -> Path | None:
+        cache_dir = self.__env.app.cache_dir
+        if cache_dir is None:
+            return None
+
+        return cache_dir / 'build-hooks' / self.__project.location.id / f'{self.__env.name}.json'
+
+
+class BuildFrontendSession:
+    """
+    A process in the build environment that calls every hook it receives, so that the backend is only
+    imported once. Requests are written to its standard input and, after the outputs of each hook are
+    written to the requested directory, the exit code is written to its standard output.
+    """
+
+    def __init__(self, env: EnvironmentInterface, script: str) -> None:
+        self.__env = env
+        self.__script = script
+        self.__process: Popen | None = None
+        self.__temp_dir: Path | None = None
+
+    def call(self, *, output_dir: str, hook: str, kwargs: dict[str, Any]) -> None:
+        process = self.__start()
+        request = {'output_dir': output_dir, 'hook': hook, 'kwargs': kwargs}
+        try:
+            process.stdin.write(f'{json.dumps(request)}\n')  # type: ignore[union-attr]
+            process.stdin.flush()  # type: ignore[union-attr]
+            response = process.stdout.readline()  # type: ignore[union-attr]
+        except OSError:
+            response = ''
+
+        if not response:
+            self.close()
+            self.__env.app.abort(code=process.returncode or 1)
+
+        code = json.loads(response)['code']
+        if code:
+            self.__env.app.abort(code=code)
+
+    def close(self) -> None:
+        if self.__process is not None:
+            process, self.__process = self.__process, None
+            with suppress(OSError):
+                process.stdin.close()  # type: ignore[union-attr]
+
+            process.wait()
+            process.stdout.close()  # type: ignore[union-attr]
+
+        if self.__temp_dir is not None:
+            import shutil
+
+            shutil.rmtree(self.__temp_dir, ignore_errors=True)
+            self.__temp_dir = None
+
+    def __start(self) -> Popen:
+        if self.__process is not None:
+            return self.__process
+
+        import tempfile
+
+        self.__temp_dir = Path(tempfile.mkdtemp())
+        script_path = self.__temp_dir / 'session.py'
+        script_path.write_text(self.__script)
+
+        kwargs: dict[str, Any] = {}
+        platform = self.__env.platform
+        with self.__env.command_context():
+            platform.populate_default_popen_kwargs(kwargs, shell=False)
+            self.__process = platform.modules.subprocess.Popen(
+                platform.format_for_subprocess(['python', '-u', str(script_path)], shell=False),
+                stdin=platform.modules.subprocess.PIPE,
+                stdout=platform.modules.subprocess.PIPE,
+                encoding='utf-8',
+                **kwargs,
+            )
+
+        return self.__process
+
+
 class BuildFrontendScripts:
     def __init__(self, project: Project, env: EnvironmentInterface) -> None:
         self._project = project
@@ -214,6 +583,14 @@ class BuildFrontendScripts:
 
 
 class StandardBuildFrontendScripts(BuildFrontendScripts):
+    def get_runner_data(self, *, project_root: str) -> dict[str, Any]:
+        return {
+            'project_root': project_root,
+            'backend': self._project.metadata.build.build_backend,
+            'backend_path': self._env.pathsep.join(self._project.metadata.build.backend_path),
+            'hook_caller_script': hook_caller_script(),
+        }
+
     def get_runner_script(
         self,
         *,
@@ -222,18 +599,12 @@ class StandardBuildFrontendScripts(BuildFrontendScripts):
         hook: str,
         kwargs: dict[str, Any],
     ) -> str:
-        return self.inject_data(
-            runner_script(),
-            {
-                'project_root': project_root,
-                'output_dir': output_dir,
-                'hook': hook,
-                'kwargs': kwargs,
-                'backend': self._project.metadata.build.build_backend,
-                'backend_path': self._env.pathsep.join(self._project.metadata.build.backend_path),
-                'hook_caller_script': hook_caller_script(),
-            },
-        )
+        data = self.get_runner_data(project_root=project_root)
+        data.update(output_dir=output_dir, hook=hook, kwargs=kwargs)
+        return self.inject_data(runner_script(), data)
+
+    def get_session_script(self, *, project_root: str) -> str:
+        return self.inject_data(session_script(), self.get_runner_data(project_root=project_root))
 
     def get_requires(
         self,
@@ -242,35 +613,26 @@ class StandardBuildFrontendScripts(BuildFrontendScripts):
         output_dir: str,
         build: Literal['sdist', 'wheel', 'editable'],
     ) -> str:
+        hook = f'get_requires_for_build_{build}'
         return self.get_runner_script(
-            project_root=project_root,
-            output_dir=output_dir,
-            hook=f'get_requires_for_build_{build}',
-            kwargs={'config_settings': None},
+            project_root=project_root, output_dir=output_dir, hook=hook, kwargs=get_hook_kwargs(hook)
         )
 
     def prepare_metadata(self, *, output_dir: str, project_root: str, editable: bool = False) -> str:
+        hook = 'prepare_metadata_for_build_editable' if editable else 'prepare_metadata_for_build_wheel'
         return self.get_runner_script(
-            project_root=project_root,
-            output_dir=output_dir,
-            hook='prepare_metadata_for_build_editable' if editable else 'prepare_metadata_for_build_wheel',
-            kwargs={'work_dir': 'metadata_directory', 'config_settings': None, '_allow_fallback': True},
+            project_root=project_root, output_dir=output_dir, hook=hook, kwargs=get_hook_kwargs(hook)
         )
 
     def build_wheel(self, *, output_dir: str, project_root: str, editable: bool = False) -> str:
+        hook = 'build_editable' if editable else 'build_wheel'
         return self.get_runner_script(
-            project_root=project_root,
-            output_dir=output_dir,
-            hook='build_editable' if editable else 'build_wheel',
-            kwargs={'work_dir': 'wheel_directory', 'config_settings': None, 'metadata_directory': None},
+            project_root=project_root, output_dir=output_dir, hook=hook, kwargs=get_hook_kwargs(hook)
         )
 
     def build_sdist(self, *, output_dir: str, project_root: str) -> str:
         return self.get_runner_script(
-            project_root=project_root,
-            output_dir=output_dir,
-            hook='build_sdist',
-            kwargs={'work_dir': 'sdist_directory', 'config_settings': None},
+            project_root=project_root, output_dir=output_dir, hook='build_sdist', kwargs=get_hook_kwargs('build_sdist')
         )
 
 
@@ -294,6 +656,23 @@ class HatchBuildFrontendScripts(BuildFrontendScripts):
             },
         )
 
+    def get_build_options(self, *, output_dir: str) -> str:
+        return self.inject_data(hatch_build_options_script(), {'output_dir': output_dir})
+
+
+def get_hook_kwargs(hook: str) -> dict[str, Any]:
+    # The `work_dir` option names the argument that receives a temporary directory for the outputs
+    if hook.startswith('get_requires_for_build_'):
+        return {'config_settings': None}
+
+    if hook.startswith('prepare_metadata_for_build_'):
+        return {'work_dir': 'metadata_directory', 'config_settings': None, '_allow_fallback': True}
+
+    if hook == 'build_sdist':
+        return {'work_dir': 'sdist_directory', 'config_settings': None}
+
+    return {'work_dir': 'wheel_directory', 'config_settings': None, 'metadata_directory': None}
+
 
 if sys.version_info[:2] >= (3, 9):
 
@@ -311,6 +690,13 @@ if sys.version_info[:2] >= (3, 9):
         script = files('hatch.project.frontend.scripts') / 'standard.py'
         return script.read_text(encoding='utf-8')
 
+    @lru_cache(maxsize=None)
+    def session_script() -> str:
+        from importlib.resources import files
+
+        script = files('hatch.project.frontend.scripts') / 'session.py'
+        return script.read_text(encoding='utf-8')
+
     @lru_cache(maxsize=None)
     def hatch_build_deps_script() -> str:
         from importlib.resources import files
@@ -325,6 +711,13 @@ if sys.version_info[:2] >= (3, 9):
         script = files('hatch.project.frontend.scripts') / 'core_metadata.py'
         return script.read_text(encoding='utf-8')
 
+    @lru_cache(maxsize=None)
+    def hatch_build_options_script() -> str:
+        from importlib.resources import files
+
+        script = files('hatch.project.frontend.scripts') / 'build_options.py'
+        return script.read_text(encoding='utf-8')
+
 else:
 
     @lru_cache(maxsize=None)
@@ -339,6 +732,12 @@ else:
 
         return read_text('hatch.project.frontend.scripts', 'standard.py')
 
+    @lru_cache(maxsize=None)
+    def session_script() -> str:
+        from importlib.resources import read_text
+
+        return read_text('hatch.project.frontend.scripts', 'session.py')
+
     @lru_cache(maxsize=None)
     def hatch_build_deps_script() -> str:
         from importlib.resources import read_text
@@ -350,3 +749,9 @@ else:
         from importlib.resources import read_text
 
         return read_text('hatch.project.frontend.scripts', 'core_metadata.py')
+
+    @lru_cache(maxsize=None)
+    def hatch_build_options_script() -> str:
+        from importlib.resources import read_text
+
+        return read_text('hatch.project.frontend.scripts', 'build_options.py')
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import inspect
+import json
+import os
+
+from hatchling.cli.build import build_impl
+
+RUNNER: dict = {}
+
+
+def main() -> None:
+    output_dir: str = RUNNER['output_dir']
+
+    # Older versions of Hatchling do not support every option of the build command
+    output = json.dumps(list(inspect.signature(build_impl).parameters))
+    with open(os.path.join(output_dir, 'output.json'), 'w', encoding='utf-8') as f:
+        f.write(output)
+
+
+if __name__ == '__main__':
+    main()
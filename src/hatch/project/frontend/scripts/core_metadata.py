@@ -24,6 +24,12 @@ def main() -> None:
     with open(os.path.join(output_dir, 'output.json'), 'w', encoding='utf-8') as f:
         f.write(output)
 
+    # Older versions of Hatchling do not support caching
+    get_cache_inputs = getattr(project_metadata, 'get_cache_inputs', None)
+    cache_inputs = get_cache_inputs() if get_cache_inputs is not None else None
+    with open(os.path.join(output_dir, 'cache_inputs.json'), 'w', encoding='utf-8') as f:
+        f.write(json.dumps(cache_inputs))
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import shutil
+import sys
+import traceback
+import types
+import warnings
+from tempfile import TemporaryDirectory
+
+RUNNER: dict = {}
+
+
+def call_hook(hooks: types.ModuleType, request: dict) -> int:
+    output_dir: str = request['output_dir']
+    hook: str = request['hook']
+    kwargs: dict[str, str] = request['kwargs']
+
+    with TemporaryDirectory() as d:
+        temp_dir = os.path.realpath(d)
+        if 'work_dir' in kwargs:
+            work_dir = os.path.join(temp_dir, 'work')
+            os.mkdir(work_dir)
+            kwargs[kwargs.pop('work_dir')] = work_dir
+        else:
+            work_dir = ''
+
+        # Backends may change the working directory and previous hooks may have created modules
+        os.chdir(RUNNER['project_root'])
+        importlib.invalidate_caches()
+
+        output = {'unsupported': False, 'return_val': None}
+        with warnings.catch_warnings():
+            try:
+                output['return_val'] = getattr(hooks, hook)(**kwargs)
+            except hooks.BackendUnavailable as e:
+                sys.stderr.write(f'{e.traceback}\n{getattr(e, "message", "")}\n')
+                return 1
+            except hooks.GotUnsupportedOperation as e:
+                sys.stderr.write(e.traceback)
+                return 1
+            except hooks.HookMissing as e:
+                sys.stderr.write(f'Build backend API `{RUNNER["backend"]}` is missing hook: {e.hook_name or hook}\n')
+                return 1
+            except Exception:  # noqa: BLE001
+                traceback.print_exc()
+                return 1
+
+        with open(os.path.join(output_dir, 'output.json'), 'w', encoding='utf-8') as f:
+            f.write(json.dumps(output))
+
+        if work_dir:
+            shutil.move(work_dir, output_dir)
+
+    return 0
+
+
+def main() -> int:
+    os.environ['_PYPROJECT_HOOKS_BUILD_BACKEND'] = RUNNER['backend']
+    if RUNNER['backend_path']:
+        os.environ['_PYPROJECT_HOOKS_BACKEND_PATH'] = RUNNER['backend_path']
+
+    # Avoid polluting the import namespace of the backend with the directory of this script
+    script_dir = os.path.normcase(os.path.realpath(os.path.dirname(os.path.abspath(sys.argv[0]))))
+    sys.path[:] = [path for path in sys.path if os.path.normcase(os.path.realpath(path or os.curdir)) != script_dir]
+
+    # The hooks are imported once and keep the backend loaded for every call
+    hooks = types.ModuleType('_in_process')
+    exec(compile(RUNNER['hook_caller_script'], '_in_process.py', 'exec'), hooks.__dict__)  # noqa: S102
+
+    # Replies are written to the original standard output while anything the backend writes goes to
+    # standard error so that it is displayed
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8')
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    for line in sys.stdin:
+        code = call_hook(hooks, json.loads(line))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        replies.write(f'{json.dumps({"code": code})}\n')
+        replies.flush()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
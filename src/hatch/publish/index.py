@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
 from hatch.publish.plugin.interface import PublisherInterface
 from hatch.utils.fs import Path
 from hatchling.metadata.utils import normalize_project_name
 
+if TYPE_CHECKING:
+    from hatch.index.core import PackageIndex
+
+DEFAULT_JOBS = 4
+
 
 class IndexPublisher(PublisherInterface):
     PLUGIN_NAME = 'index'
@@ -47,7 +52,11 @@ class IndexPublisher(PublisherInterface):
         https://warehouse.readthedocs.io/api-reference/legacy.html#upload-api
         """
         from collections import defaultdict
+        from concurrent.futures import Future, ThreadPoolExecutor
 
+        from packaging.utils import canonicalize_version
+
+        from hatch.index.checksums import ChecksumManifest
         from hatch.index.core import PackageIndex
         from hatch.index.publish import get_sdist_form_data, get_wheel_form_data
         from hatch.publish.auth import AuthenticationCredentials
@@ -59,7 +68,7 @@ class IndexPublisher(PublisherInterface):
 
         repo = options['repo'] if 'repo' in options else self.plugin_config.get('repo', 'main')
         repos = self.get_repos()
-        repo_config: dict[str, str] = repos[repo] if repo in repos else {'url': repo}
+        repo_config: dict[str, Any] = repos[repo] if repo in repos else {'url': repo}
         credentials = AuthenticationCredentials(
             app=self.app,
             cache_dir=self.cache_dir,
@@ -68,6 +77,10 @@ class IndexPublisher(PublisherInterface):
             repo_config=repo_config,
         )
 
+        trailing_digests = repo_config.get('trailing-digests', self.plugin_config.get('trailing-digests', False))
+        if not isinstance(trailing_digests, bool):
+            self.app.abort('Hatch config field `publish.index.trailing-digests` must be a boolean')
+
         index = PackageIndex(
             repo_config['url'],
             user=credentials.username,
@@ -75,14 +88,14 @@ class IndexPublisher(PublisherInterface):
             ca_cert=options.get('ca_cert', repo_config.get('ca-cert')),
             client_cert=options.get('client_cert', repo_config.get('client-cert')),
             client_key=options.get('client_key', repo_config.get('client-key')),
+            trailing_digests=trailing_digests,
         )
 
-        existing_artifacts: dict[str, set[str]] = {}
+        jobs = options.get('jobs', repo_config.get('jobs', self.plugin_config.get('jobs', DEFAULT_JOBS)))
+        if not isinstance(jobs, int) or isinstance(jobs, bool) or jobs < 1:
+            self.app.abort('Hatch config field `publish.index.jobs` must be a positive integer')
 
-        # Use as an ordered set
-        project_versions: dict[str, dict[str, None]] = defaultdict(dict)
-
-        artifacts_found = False
+        uploads: list[tuple[Path, dict]] = []
         for artifact in recurse_artifacts(artifacts, self.root):
             if artifact.name.endswith('.whl'):
                 data = get_wheel_form_data(artifact)
@@ -91,46 +104,100 @@ class IndexPublisher(PublisherInterface):
             else:
                 continue
 
-            artifacts_found = True
-
             for field in ('name', 'version'):
                 if field not in data:
                     self.app.abort(f'Missing required field `{field}` in artifact: {artifact}')
 
-            try:
-                displayed_path = str(artifact.relative_to(self.root))
-            except ValueError:
-                displayed_path = str(artifact)
+            uploads.append((artifact, data))
 
-            self.app.display_info(f'{displayed_path} ...', end=' ')
+        if options.get('verify') and uploads:
+            self.app.verify_artifacts([artifact for artifact, _ in uploads], jobs=jobs)
 
-            project_name = normalize_project_name(data['name'])
-            if project_name not in existing_artifacts:
-                try:
-                    response = index.get_simple_api(project_name)
-                    response.raise_for_status()
-                except Exception:  # no cov  # noqa: BLE001
-                    existing_artifacts[project_name] = set()
+        # Reuse the digests recorded by previous verification rather than computing them during upload
+        manifests: dict[Path, ChecksumManifest] = {}
+        for artifact, _ in uploads:
+            if artifact.parent not in manifests:
+                manifests[artifact.parent] = ChecksumManifest(artifact.parent)
+
+        # Use as an ordered set
+        project_versions: dict[str, dict[str, None]] = defaultdict(dict)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # Fetch every project's existing artifacts up front rather than before each project's first upload
+            project_names = list({normalize_project_name(data['name']): None for _, data in uploads})
+            existing_artifacts = dict(
+                zip(project_names, executor.map(lambda name: get_existing_artifacts(index, name), project_names))
+            )
+
+            # Concurrent first uploads of a project or release race with its creation by the index, so those
+            # are uploaded on their own before the rest
+            phases: tuple[list[int], list[int], list[int]] = ([], [], [])
+            existing: set[int] = set()
+            new_projects = {name for name, project_artifacts in existing_artifacts.items() if not project_artifacts}
+            released_versions = {name: get_released_versions(names) for name, names in existing_artifacts.items()}
+            for i, (artifact, data) in enumerate(uploads):
+                project_name = normalize_project_name(data['name'])
+                project_artifacts = existing_artifacts[project_name]
+                if artifact.name in project_artifacts:
+                    existing.add(i)
+                    continue
+
+                project_artifacts.add(artifact.name)
+                version = canonicalize_version(data['version'])
+                if project_name in new_projects:
+                    new_projects.remove(project_name)
+                    released_versions[project_name].add(version)
+                    phases[0].append(i)
+                elif version not in released_versions[project_name]:
+                    released_versions[project_name].add(version)
+                    phases[1].append(i)
                 else:
-                    existing_artifacts[project_name] = set(parse_artifacts(response.text))
+                    phases[2].append(i)
+
+            futures: dict[int, Future] = {}
+            for phase_number, phase in enumerate(phases, 1):
+                for i in phase:
+                    artifact, data = uploads[i]
+                    futures[i] = executor.submit(
+                        index.upload_artifact, artifact, data, digests=manifests[artifact.parent].get(artifact)
+                    )
+
+                # Later uploads wait for the previous phase and are skipped after a failure
+                if phase_number < len(phases) and any(futures[i].exception() is not None for i in phase):
+                    break
+
+            # Uploads happen concurrently but the results are displayed in order
+            for i, (artifact, data) in enumerate(uploads):
+                try:
+                    displayed_path = str(artifact.relative_to(self.root))
+                except ValueError:
+                    displayed_path = str(artifact)
 
-            if artifact.name in existing_artifacts[project_name]:
-                self.app.display_warning('already exists')
-                continue
+                self.app.display_info(f'{displayed_path} ...', end=' ')
 
-            try:
-                index.upload_artifact(artifact, data)
-            except Exception as e:  # noqa: BLE001
-                self.app.display_error('failed')
-                self.app.abort(f'Error uploading to repository: {index.repo} - {e}'.replace(index.auth, '*****'))
-            else:
-                self.app.display_success('success')
+                if i in existing:
+                    self.app.display_warning('already exists')
+                    continue
+
+                if i not in futures:
+                    self.app.display_warning('skipped')
+                    continue
+
+                try:
+                    futures[i].result()
+                except Exception as e:  # noqa: BLE001
+                    for pending in futures.values():
+                        pending.cancel()
 
-                existing_artifacts[project_name].add(artifact.name)
-                project_versions[project_name][data['version']] = None
+                    self.app.display_error('failed')
+                    self.app.abort(f'Error uploading to repository: {index.repo} - {e}'.replace(index.auth, '*****'))
+                else:
+                    self.app.display_success('success')
+
+                    project_versions[normalize_project_name(data['name'])][data['version']] = None
 
         if not options['initialize_auth']:
-            if not artifacts_found:
+            if not uploads:
                 self.app.abort('No artifacts found')
             elif not project_versions:
                 self.app.abort(code=0)
@@ -156,6 +223,40 @@ def recurse_artifacts(artifacts: list, root) -> Iterable[Path]:
             yield from artifact.iterdir()
 
 
+def get_existing_artifacts(index: PackageIndex, project_name: str) -> set[str]:
+    try:
+        response = index.get_simple_api(project_name)
+        response.raise_for_status()
+    except Exception:  # no cov  # noqa: BLE001
+        return set()
+
+    return set(parse_artifacts(response.text))
+
+
+def get_released_versions(artifact_names: Iterable[str]) -> set[str]:
+    from packaging.utils import (
+        InvalidSdistFilename,
+        InvalidWheelFilename,
+        canonicalize_version,
+        parse_sdist_filename,
+        parse_wheel_filename,
+    )
+
+    versions: set[str] = set()
+    for artifact_name in artifact_names:
+        try:
+            if artifact_name.endswith('.whl'):
+                version = parse_wheel_filename(artifact_name)[1]
+            else:
+                version = parse_sdist_filename(artifact_name)[1]
+        except (InvalidSdistFilename, InvalidWheelFilename):
+            continue
+
+        versions.add(canonicalize_version(version))
+
+    return versions
+
+
 def parse_artifacts(artifact_payload):
     for match in re.finditer(r'<a [^>]+>([^<]+)</a>', artifact_payload):
         yield match.group(1)
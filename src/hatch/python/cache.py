@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager, suppress
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from hatch.utils.fs import Path
+
+DEFAULT_MAX_SIZE = 1024**3
+# Staged archives that have not been written to for this long were abandoned by interrupted downloads
+STAGING_EXPIRY = 24 * 60 * 60
+
+
+class CachedArchive:
+    def __init__(self, path: Path, url: str, sha256: str, size: int) -> None:
+        self.__path = path
+        self.__url = url
+        self.__sha256 = sha256
+        self.__size = size
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def name(self) -> str:
+        return self.__url.rsplit('/', 1)[-1]
+
+    @property
+    def sha256(self) -> str:
+        return self.__sha256
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @cached_property
+    def last_used(self) -> float:
+        try:
+            return self.__path.stat().st_mtime
+        except OSError:
+            return 0
+
+    def verify(self) -> bool:
+        from hashlib import sha256
+
+        from hatch.utils.network import DEFAULT_CHUNK_SIZE
+
+        hasher = sha256()
+        try:
+            with self.__path.open('rb') as f:
+                while chunk := f.read(DEFAULT_CHUNK_SIZE):
+                    hasher.update(chunk)
+        except OSError:
+            return False
+
+        return hasher.hexdigest() == self.__sha256
+
+
+class ArchiveCache:
+    """
+    A content-addressed store of distribution archives. Each source URL maps to an entry that records
+    the SHA-256 digest of the archive, which names the stored file. The modification time of an archive
+    records when it was last used so that the least recently used archives are evicted first.
+
+    Changes are serialized across threads and, with a lock file, across processes. Archives are read
+    without locking, so an archive that vanishes after being looked up is treated as a miss.
+    """
+
+    # Distributions may be installed concurrently and pruning must not observe a partially added entry
+    _lock = threading.RLock()
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.__directory = directory
+        self.__max_size = max_size
+
+    @property
+    def directory(self) -> Path:
+        return self.__directory
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def archive_directory(self) -> Path:
+        return self.directory / 'archives'
+
+    @property
+    def entry_directory(self) -> Path:
+        return self.directory / 'entries'
+
+    @property
+    def staging_directory(self) -> Path:
+        return self.directory / 'staging'
+
+    def get(self, url: str) -> CachedArchive | None:
+        entry = self.__read_entry(self.__entry_path(url))
+        if entry is None:
+            return None
+
+        if not entry.path.is_file():
+            self.remove(url)
+            return None
+
+        # Other processes may evict the archive at any time, which verification then reports
+        with suppress(OSError):
+            os.utime(entry.path)
+
+        return entry
+
+    def new_archive_path(self) -> Path:
+        """
+        Returns a temporary path on the same file system as the stored archives so that they may be
+        added with an atomic rename. Callers are responsible for the file if it is not added.
+        """
+        from uuid import uuid4
+
+        self.staging_directory.ensure_dir_exists()
+        return self.staging_directory / uuid4().hex
+
+    def add(self, url: str, archive: Path, sha256: str) -> CachedArchive:
+        import json
+
+        archive_path = self.archive_directory / sha256
+        entry_path = self.__entry_path(url)
+        with self.__locked():
+            archive_path.parent.ensure_dir_exists()
+            archive.replace(archive_path)
+
+            entry_path.parent.ensure_dir_exists()
+            entry_path.write_atomic(json.dumps({'url': url, 'sha256': sha256}), 'w', encoding='utf-8')
+
+            entry = CachedArchive(archive_path, url, sha256, archive_path.stat().st_size)
+            self.__prune(self.max_size)
+
+        return entry
+
+    def remove(self, url: str) -> None:
+        entry_path = self.__entry_path(url)
+        with self.__locked():
+            entry = self.__read_entry(entry_path)
+            entry_path.unlink(missing_ok=True)
+
+            if entry is not None and not any(e.sha256 == entry.sha256 for e in self.entries()):
+                entry.path.unlink(missing_ok=True)
+
+    def entries(self) -> list[CachedArchive]:
+        """
+        Returns all stored archives, most recently used first.
+        """
+        if not self.entry_directory.is_dir():
+            return []
+
+        entries = []
+        for entry_path in self.entry_directory.iterdir():
+            entry = self.__read_entry(entry_path)
+            if entry is not None and entry.path.is_file():
+                entries.append(entry)
+
+        entries.sort(key=lambda e: e.last_used, reverse=True)
+        return entries
+
+    def prune(self, max_size: int | None = None) -> list[CachedArchive]:
+        """
+        Evicts the least recently used archives until the total size is at most `max_size`, defaulting
+        to the configured maximum. Malformed entries, entries for missing archives, unreferenced archives
+        and abandoned staged archives are always removed. The evicted archives are returned.
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        with self.__locked():
+            return self.__prune(max_size)
+
+    @contextmanager
+    def __locked(self) -> Generator[None, None, None]:
+        from hatch.utils.fs import exclusive_lock
+
+        with self._lock, exclusive_lock(self.directory / '.lock'):
+            yield
+
+    def __prune(self, max_size: int) -> list[CachedArchive]:
+        referenced: dict[str, list[CachedArchive]] = {}
+        if self.entry_directory.is_dir():
+            for entry_path in self.entry_directory.iterdir():
+                entry = self.__read_entry(entry_path)
+                if entry is None or not entry.path.is_file():
+                    entry_path.unlink(missing_ok=True)
+                else:
+                    referenced.setdefault(entry.sha256, []).append(entry)
+
+        if self.archive_directory.is_dir():
+            for archive_path in self.archive_directory.iterdir():
+                if archive_path.name not in referenced:
+                    archive_path.unlink(missing_ok=True)
+
+        if self.staging_directory.is_dir():
+            import time
+
+            expiration = time.time() - STAGING_EXPIRY
+            for staged_path in self.staging_directory.iterdir():
+                try:
+                    if staged_path.stat().st_mtime < expiration:
+                        staged_path.unlink()
+                except OSError:
+                    continue
+
+        evicted: list[CachedArchive] = []
+        total_size = sum(entries[0].size for entries in referenced.values())
+        for entries in sorted(referenced.values(), key=lambda entries: entries[0].last_used):
+            if total_size <= max_size:
+                break
+
+            for entry in entries:
+                self.__entry_path(entry.url).unlink(missing_ok=True)
+                evicted.append(entry)
+
+            entries[0].path.unlink(missing_ok=True)
+            total_size -= entries[0].size
+
+        return evicted
+
+    def __entry_path(self, url: str) -> Path:
+        from hashlib import sha256
+
+        return self.entry_directory / f'{sha256(url.encode("utf-8")).hexdigest()}.json'
+
+    def __read_entry(self, entry_path: Path) -> CachedArchive | None:
+        import json
+
+        try:
+            contents = entry_path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+        try:
+            data = json.loads(contents)
+            url, digest = data['url'], data['sha256']
+        except (ValueError, KeyError, TypeError):
+            url = digest = None
+
+        # Malformed entries are treated as missing, and the digest names a file so it must be hexadecimal
+        if not (isinstance(url, str) and isinstance(digest, str) and is_sha256(digest)):
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        archive_path = self.archive_directory / digest
+        try:
+            size = archive_path.stat().st_size
+        except OSError:
+            size = 0
+
+        return CachedArchive(archive_path, url, digest, size)
+
+
+def is_sha256(digest: str) -> bool:
+    import re
+
+    return re.fullmatch(r'[0-9a-f]{64}', digest) is not None
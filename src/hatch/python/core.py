@@ -7,6 +7,7 @@ from hatch.python.resolve import get_distribution
 from hatch.utils.fs import temp_directory
 
 if TYPE_CHECKING:
+    from hatch.python.cache import ArchiveCache
     from hatch.python.resolve import Distribution
     from hatch.utils.fs import Path
 
@@ -47,22 +48,83 @@ class InstalledDistribution:
 
 
 class PythonManager:
-    def __init__(self, directory: Path) -> None:
+    def __init__(self, directory: Path, archive_cache: ArchiveCache | None = None) -> None:
         self.__directory = directory
+        self.__archive_cache = archive_cache
 
     @property
     def directory(self) -> Path:
         return self.__directory
 
+    @property
+    def archive_cache(self) -> ArchiveCache | None:
+        return self.__archive_cache
+
+    @property
+    def inventory_file(self) -> Path:
+        # Writes within a subdirectory do not change the modification time of the installation directory
+        return self.directory / '.hatch' / 'inventory.json'
+
     def get_installed(self) -> dict[str, InstalledDistribution]:
         if not self.directory.is_dir():
             return {}
 
+        inventory = self._read_inventory()
+        if inventory is None:
+            inventory = self._update_inventory()
+
+        installed_distributions = [
+            InstalledDistribution(
+                self.directory / name, get_distribution(name, source=metadata.get('source', '')), metadata
+            )
+            for name, metadata in inventory.items()
+        ]
+        installed_distributions.sort(key=lambda d: ORDERED_DISTRIBUTIONS.index(d.name))
+        return {dist.name: dist for dist in installed_distributions}
+
+    def _read_inventory(self) -> dict[str, dict[str, Any]] | None:
+        """
+        Returns the recorded metadata of every installed distribution, or `None` if the inventory is missing
+        or the installation directory changed since it was written, such as by manual removal.
+        """
         import json
+        import os
+
+        try:
+            inventory = json.loads(self.inventory_file.read_text(encoding='utf-8'))
+            mtime_ns = self.directory.stat().st_mtime_ns
+        except (OSError, ValueError):
+            return None
 
-        installed_distributions: list[InstalledDistribution] = []
-        for path in self.directory.iterdir():
-            if not (path.name in DISTRIBUTIONS and path.is_dir()):
+        if not isinstance(inventory, dict) or inventory.get('mtime_ns') != mtime_ns:
+            return None
+
+        # Timestamps have a coarse granularity on some file systems so entries that were added or removed
+        # immediately after the inventory was written may not change the modification time
+        if inventory.get('entries') != sorted(os.listdir(self.directory)):
+            return None
+
+        distributions = inventory.get('distributions')
+        return distributions if isinstance(distributions, dict) else None
+
+    def _update_inventory(self) -> dict[str, dict[str, Any]]:
+        import json
+        import os
+        import shutil
+        from contextlib import suppress
+
+        inventory_file = self.inventory_file
+        with suppress(OSError):
+            inventory_file.parent.ensure_dir_exists()
+
+        # Any change made during the scan will invalidate the inventory
+        mtime_ns = self.directory.stat().st_mtime_ns
+        entries = sorted(os.listdir(self.directory))
+
+        distributions: dict[str, dict[str, Any]] = {}
+        for name in entries:
+            path = self.directory / name
+            if not (name in DISTRIBUTIONS and path.is_dir()):
                 continue
 
             metadata_file = path / InstalledDistribution.metadata_filename()
@@ -70,29 +132,45 @@ class PythonManager:
                 continue
 
             metadata = json.loads(metadata_file.read_text())
-            distribution = get_distribution(path.name, source=metadata.get('source', ''))
+            distribution = get_distribution(name, source=metadata.get('source', ''))
             if not (path / distribution.python_path).is_file():
                 continue
 
-            installed_distributions.append(InstalledDistribution(path, distribution, metadata))
+            distributions[name] = metadata
 
-        installed_distributions.sort(key=lambda d: ORDERED_DISTRIBUTIONS.index(d.name))
-        return {dist.name: dist for dist in installed_distributions}
+        with suppress(OSError):
+            # Nothing is left behind once every distribution has been removed
+            if not distributions:
+                shutil.rmtree(inventory_file.parent, ignore_errors=True)
+            else:
+                inventory = {'mtime_ns': mtime_ns, 'entries': entries, 'distributions': distributions}
+                inventory_file.write_atomic(json.dumps(inventory, indent=2), 'w', encoding='utf-8')
+
+                # Discard the inventory if the directory changed while it was being written
+                if self.directory.stat().st_mtime_ns != mtime_ns:
+                    inventory_file.unlink()
+
+        return distributions
 
     def install(self, identifier: str) -> InstalledDistribution:
         import json
-
-        from hatch.utils.network import download_file
+        import shutil
 
         dist = get_distribution(identifier)
         path = self.directory / identifier
         self.directory.ensure_dir_exists()
 
         with temp_directory() as temp_dir:
-            archive_path = temp_dir / dist.archive_name
             unpack_path = temp_dir / identifier
-            download_file(archive_path, dist.source, follow_redirects=True)
-            dist.unpack(archive_path, unpack_path)
+            digest = self._unpack_cached(dist, unpack_path)
+            if digest is None:
+                digest = self._download(dist, temp_dir, unpack_path)
+
+            # The metadata is written before the distribution is moved into place so that it is never
+            # observed without it
+            metadata = {'source': dist.source, 'python_path': dist.python_path, 'sha256': digest}
+            metadata_file = unpack_path / InstalledDistribution.metadata_filename()
+            metadata_file.write_text(json.dumps(metadata, indent=2))
 
             backup_path = path.with_suffix('.bak')
             if backup_path.is_dir():
@@ -104,8 +182,6 @@ class PythonManager:
             try:
                 unpack_path.replace(path)
             except OSError:
-                import shutil
-
                 try:
                     shutil.move(str(unpack_path), str(path))
                 except OSError:
@@ -115,12 +191,58 @@ class PythonManager:
 
                     raise
 
-        metadata = {'source': dist.source, 'python_path': dist.python_path}
-        metadata_file = path / InstalledDistribution.metadata_filename()
-        metadata_file.write_text(json.dumps(metadata, indent=2))
-
+        self._update_inventory()
         return InstalledDistribution(path, dist, metadata)
 
-    @staticmethod
-    def remove(dist: InstalledDistribution) -> None:
+    def _unpack_cached(self, dist: Distribution, directory: Path) -> str | None:
+        if self.archive_cache is None:
+            return None
+
+        cached = self.archive_cache.get(dist.source)
+        if cached is None:
+            return None
+
+        if not cached.verify():
+            self.archive_cache.remove(dist.source)
+            return None
+
+        dist.unpack(cached.path, directory)
+        return cached.sha256
+
+    def _download(self, dist: Distribution, temp_dir: Path, directory: Path) -> str:
+        from contextlib import ExitStack
+
+        from hatch.utils.network import DownloadStream
+
+        # The archive is only written to disk if it will be cached or cannot be extracted as a stream
+        archive_path: Path | None = None
+        if self.archive_cache is not None:
+            archive_path = self.archive_cache.new_archive_path()
+        elif not dist.streamable:
+            archive_path = temp_dir / dist.archive_name
+
+        try:
+            with ExitStack() as stack:
+                sink = None if archive_path is None else stack.enter_context(archive_path.open(mode='wb'))
+                stream = stack.enter_context(DownloadStream(dist.source, sink=sink, follow_redirects=True))
+                if dist.streamable:
+                    dist.unpack_stream(stream, directory)
+
+                stream.exhaust()
+
+            if archive_path is not None:
+                if not dist.streamable:
+                    dist.unpack(archive_path, directory)
+
+                if self.archive_cache is not None:
+                    self.archive_cache.add(dist.source, archive_path, stream.hexdigest)
+        finally:
+            # Staged archives are moved when added to the cache
+            if archive_path is not None:
+                archive_path.unlink(missing_ok=True)
+
+        return stream.hexdigest
+
+    def remove(self, dist: InstalledDistribution) -> None:
         dist.path.wait_for_dir_removed()
+        self._update_inventory()
@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import os
+import re
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from virtualenv.discovery.py_info import PythonInfo
+    from virtualenv.discovery.py_spec import PythonSpec
+
+    from hatch.utils.fs import Path
+
+# The names of executables on the search path that may be interpreters, such as `python3.12` or `pypy3`
+CANDIDATE_PATTERN = re.compile(r'(?:python|pypy|graalpy)(?:\d+(?:\.\d+)*)?t?(?:\.exe)?', re.IGNORECASE)
+
+
+class Interpreter:
+    """
+    The information of an interpreter that is required to select it, which is all that the registry
+    stores. This does not depend on the internals of virtualenv so that upgrading it never invalidates
+    the registry.
+    """
+
+    def __init__(
+        self,
+        executable: str,
+        *,
+        implementation: str,
+        version: tuple[int, int, int],
+        architecture: int,
+        free_threaded: bool = False,
+    ) -> None:
+        self.executable = executable
+        self.implementation = implementation
+        self.version = version
+        self.architecture = architecture
+        self.free_threaded = free_threaded
+
+    @property
+    def version_str(self) -> str:
+        return '.'.join(map(str, self.version))
+
+    def satisfies(self, spec: PythonSpec) -> bool:
+        if spec.implementation is not None and spec.implementation.lower() != self.implementation.lower():
+            return False
+
+        if spec.architecture is not None and spec.architecture != self.architecture:
+            return False
+
+        # Newer versions of virtualenv support specifiers such as `3.13t`
+        free_threaded = getattr(spec, 'free_threaded', None)
+        if free_threaded is not None and free_threaded != self.free_threaded:
+            return False
+
+        return all(
+            required is None or required == actual
+            for actual, required in zip(self.version, (spec.major, spec.minor, spec.micro))
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'implementation': self.implementation,
+            'version': list(self.version),
+            'architecture': self.architecture,
+            'free_threaded': self.free_threaded,
+        }
+
+    @classmethod
+    def from_dict(cls, executable: str, data: dict[str, Any]) -> Interpreter:
+        major, minor, micro = data['version']
+        return cls(
+            executable,
+            implementation=str(data['implementation']),
+            version=(int(major), int(minor), int(micro)),
+            architecture=int(data['architecture']),
+            free_threaded=bool(data['free_threaded']),
+        )
+
+    @classmethod
+    def current(cls) -> Interpreter:
+        import platform
+        import sysconfig
+
+        return cls(
+            sys.executable,
+            implementation=platform.python_implementation(),
+            version=(sys.version_info.major, sys.version_info.minor, sys.version_info.micro),
+            architecture=64 if sys.maxsize > 2**32 else 32,
+            free_threaded=bool(sysconfig.get_config_var('Py_GIL_DISABLED')),
+        )
+
+    @classmethod
+    def from_python_info(cls, executable: str, python_info: PythonInfo) -> Interpreter:
+        major, minor, micro = python_info.version_info[:3]
+        return cls(
+            executable,
+            implementation=python_info.implementation,
+            version=(major, minor, micro),
+            architecture=python_info.architecture,
+            free_threaded=bool(getattr(python_info, 'free_threaded', False)),
+        )
+
+
+class InterpreterRegistry:
+    """
+    The information of every interpreter found during discovery, keyed by executable path and recorded
+    along with the identity of the executable (device, inode, size and modification time). Entries are
+    revalidated with a single `stat` call rather than by running the interpreter again, and executables
+    that are not interpreters are remembered as such.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.__path = path
+        self.__entries: dict[str, dict[str, Any]] | None = None
+        self.__modified = False
+
+    @property
+    def path(self) -> Path | None:
+        return self.__path
+
+    @property
+    def entries(self) -> dict[str, dict[str, Any]]:
+        if self.__entries is None:
+            import json
+
+            entries: Any = {}
+            if self.__path is not None:
+                try:
+                    entries = json.loads(self.__path.read_text(encoding='utf-8'))
+                except (OSError, ValueError):
+                    entries = {}
+
+            self.__entries = entries if isinstance(entries, dict) else {}
+
+        return self.__entries
+
+    def get_cached(self, executable: str) -> tuple[bool, Interpreter | None]:
+        """
+        Returns whether the executable has a valid entry, without running it, and the recorded interpreter.
+        """
+        identity = get_identity(executable)
+        if identity is None:
+            return True, None
+
+        with self._lock:
+            entry = self.entries.get(executable)
+
+        # Entries written in any other format are queried again
+        if not isinstance(entry, dict) or entry.get('identity') != identity or 'interpreter' not in entry:
+            return False, None
+
+        data = entry['interpreter']
+        if data is None:
+            return True, None
+
+        try:
+            return True, Interpreter.from_dict(executable, data)
+        except (KeyError, TypeError, ValueError):
+            return False, None
+
+    def get(self, executable: str, env: Mapping[str, str] | None = None) -> Interpreter | None:
+        from virtualenv.discovery.py_info import PythonInfo
+
+        cached, interpreter = self.get_cached(executable)
+        if cached:
+            return interpreter
+
+        identity = get_identity(executable)
+        python_info = PythonInfo.from_exe(executable, raise_on_error=False, env=env)
+        interpreter = None if python_info is None else Interpreter.from_python_info(executable, python_info)
+        with self._lock:
+            # Shims, such as those of pyenv or asdf, select an interpreter dynamically so their identity
+            # does not reflect the interpreter that runs
+            if python_info is not None and is_shim(executable, python_info):
+                self.entries.pop(executable, None)
+            else:
+                self.entries[executable] = {
+                    'identity': identity,
+                    'interpreter': None if interpreter is None else interpreter.to_dict(),
+                }
+
+            self.__modified = True
+
+        return interpreter
+
+    def refresh(self, env: Mapping[str, str] | None = None) -> list[Interpreter]:
+        """
+        Discards every entry and queries all interpreters found on the search path.
+        """
+        with self._lock:
+            self.__entries = {}
+            self.__modified = True
+
+        discovery = InterpreterDiscovery(self, env=env)
+        executables = list(iter_path_candidates(env))
+        interpreters = [interpreter for interpreter in discovery.probe(executables) if interpreter is not None]
+
+        self.save()
+        return interpreters
+
+    def save(self) -> None:
+        if self.__path is None or not self.__modified:
+            return
+
+        import json
+
+        with self._lock:
+            # Entries of removed executables are pruned
+            entries = {
+                executable: entry for executable, entry in sorted(self.entries.items()) if os.path.exists(executable)
+            }
+            self.__modified = False
+
+        try:
+            self.__path.parent.ensure_dir_exists()
+            self.__path.write_atomic(json.dumps(entries, indent=2), 'w', encoding='utf-8')
+        except OSError:
+            pass
+
+
+class InterpreterDiscovery:
+    """
+    Answers any number of interpreter queries by selecting an interpreter that satisfies each one. The
+    current interpreter and those with valid entries in the registry are considered first, in the order
+    of the search path, as that does not require running anything. Only then are the other candidates
+    queried, concurrently but in the order of the search path, until one is accepted. Every executable
+    is queried at most once. Queries for paths, and any query on Windows where interpreters may also be
+    registered elsewhere, that no candidate satisfies are answered by virtualenv's `get_interpreter`.
+    """
+
+    def __init__(
+        self,
+        registry: InterpreterRegistry,
+        *,
+        env: Mapping[str, str] | None = None,
+        predicate: Callable[[Interpreter], bool] | None = None,
+    ) -> None:
+        self.__registry = registry
+        self.__env = os.environ if env is None else env
+        self.__predicate = predicate
+        self.__results: dict[str, Interpreter | None] = {sys.executable: Interpreter.current()}
+
+    @property
+    def registry(self) -> InterpreterRegistry:
+        return self.__registry
+
+    def get(self, executable: str) -> Interpreter | None:
+        if executable not in self.__results:
+            self.__results[executable] = self.__registry.get(executable, self.__env)
+
+        return self.__results[executable]
+
+    def probe(self, executables: list[str]) -> list[Interpreter | None]:
+        from concurrent.futures import ThreadPoolExecutor
+
+        pending = list(dict.fromkeys(executable for executable in executables if executable not in self.__results))
+        if len(pending) > 1:
+            # Interpreters are queried in subprocesses
+            with ThreadPoolExecutor() as executor:
+                for executable, interpreter in zip(
+                    pending, executor.map(lambda e: self.__registry.get(e, self.__env), pending)
+                ):
+                    self.__results[executable] = interpreter
+
+        return [self.get(executable) for executable in executables]
+
+    def find(self, python_version: str = '') -> Interpreter | None:
+        from virtualenv.discovery.py_spec import PythonSpec
+
+        spec = PythonSpec.from_string_spec(python_version)
+        try:
+            if spec.path is None:
+                uncached: list[str] = []
+                for executable in dict.fromkeys((sys.executable, *iter_path_candidates(self.__env))):
+                    if executable not in self.__results:
+                        cached, interpreter = self.__registry.get_cached(executable)
+                        if not cached:
+                            uncached.append(executable)
+                            continue
+
+                        self.__results[executable] = interpreter
+
+                    interpreter = self.__results[executable]
+                    if interpreter is not None and self.__accepts(interpreter, spec):
+                        return interpreter
+
+                if (interpreter := self.__probe_until_accepted(uncached, spec)) is not None:
+                    return interpreter
+
+                if sys.platform != 'win32':
+                    return None
+        finally:
+            self.__registry.save()
+
+        return self.__find_with_virtualenv(python_version)
+
+    def __probe_until_accepted(self, executables: list[str], spec: PythonSpec) -> Interpreter | None:
+        from collections import deque
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        # Match the default number of workers of newer versions of Python
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+        remaining = iter(executables)
+        pending: deque[tuple[str, Future]] = deque()
+        with ThreadPoolExecutor(max_workers) as executor:
+
+            def submit_next() -> None:
+                for executable in remaining:
+                    pending.append((executable, executor.submit(self.__registry.get, executable, self.__env)))
+                    return
+
+            for _ in range(max_workers):
+                submit_next()
+
+            try:
+                # Results are considered in the order of the search path as they complete
+                while pending:
+                    executable, future = pending.popleft()
+                    interpreter = self.__results[executable] = future.result()
+                    if interpreter is not None and self.__accepts(interpreter, spec):
+                        return interpreter
+
+                    submit_next()
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+        return None
+
+    def __accepts(self, interpreter: Interpreter, spec: PythonSpec) -> bool:
+        return interpreter.satisfies(spec) and self.__is_allowed(interpreter)
+
+    def __find_with_virtualenv(self, python_version: str) -> Interpreter | None:
+        from virtualenv.discovery.builtin import get_interpreter
+
+        python_info = get_interpreter(python_version, (), env=self.__env)
+        if python_info is None:
+            return None
+
+        interpreter = Interpreter.from_python_info(str(python_info.executable), python_info)
+        return interpreter if self.__is_allowed(interpreter) else None
+
+    def __is_allowed(self, interpreter: Interpreter) -> bool:
+        return self.__predicate is None or bool(self.__predicate(interpreter))
+
+
+def find_interpreter(
+    python_version: str,
+    registry: InterpreterRegistry,
+    *,
+    env: Mapping[str, str] | None = None,
+    predicate: Callable[[Interpreter], bool] | None = None,
+) -> Interpreter | None:
+    """
+    Finds the first interpreter that satisfies the version and is accepted by the predicate, querying
+    interpreters through the registry.
+    """
+    return InterpreterDiscovery(registry, env=env, predicate=predicate).find(python_version)
+
+
+def iter_path_candidates(env: Mapping[str, str] | None = None) -> Iterator[str]:
+    env = os.environ if env is None else env
+    search_path = env.get('PATH')
+    if search_path is None:
+        search_path = os.defpath
+
+    for directory in dict.fromkeys(search_path.split(os.pathsep)):
+        if not directory:
+            continue
+
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            continue
+
+        for name in names:
+            if not CANDIDATE_PATTERN.fullmatch(name):
+                continue
+
+            executable = os.path.join(directory, name)
+            if os.path.isfile(executable) and os.access(executable, os.X_OK):
+                yield executable
+
+
+def is_shim(executable: str, python_info: PythonInfo) -> bool:
+    """
+    Whether the executable runs an interpreter other than itself. The reported `executable` is always the
+    queried path so only the interpreter's own paths are compared, and executables within the prefix of the
+    interpreter, such as those copied into virtual environments, are never shims.
+    """
+    real_path = os.path.realpath(executable)
+    if python_info.prefix and real_path.startswith(os.path.join(os.path.realpath(python_info.prefix), '')):
+        return False
+
+    return all(
+        os.path.realpath(path) != real_path
+        for path in (python_info.system_executable, python_info.original_executable)
+        if path is not None
+    )
+
+
+def get_identity(executable: str) -> list[int] | None:
+    try:
+        stat = os.stat(executable)
+    except OSError:
+        return None
+
+    return [stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns]
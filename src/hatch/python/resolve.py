@@ -5,7 +5,7 @@ import platform
 import sys
 from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from hatch.config.constants import PythonEnvVars
 from hatch.errors import PythonDistributionResolutionError, PythonDistributionUnknownError
@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 # Use an artificially high epoch to ensure that custom distributions are always considered newer
 CUSTOM_DISTRIBUTION_VERSION_EPOCH = 100
 
+STREAMABLE_ARCHIVE_EXTENSIONS = ('.tar.gz', '.tgz', '.tar.bz2', '.bz2', '.tar.zst', '.tar.zstd')
+
 
 def custom_env_var(prefix: str, name: str) -> str:
     return f'{prefix}{name.upper().replace(".", "_")}'
@@ -54,42 +56,40 @@ class Distribution(ABC):
     def archive_name(self) -> str:
         return self.source.rsplit('/', 1)[-1]
 
+    @cached_property
+    def streamable(self) -> bool:
+        """
+        Whether the archive may be extracted from a stream as it is being downloaded. ZIP files cannot
+        because the central directory is at the end.
+        """
+        return self.source.endswith(STREAMABLE_ARCHIVE_EXTENSIONS)
+
     def unpack(self, archive: Path, directory: Path) -> None:
         if self.source.endswith('.zip'):
             import zipfile
 
             with zipfile.ZipFile(archive, 'r') as zf:
                 zf.extractall(directory)
-        elif self.source.endswith(('.tar.gz', '.tgz')):
-            import tarfile
-
-            with tarfile.open(archive, 'r:gz') as tf:
-                if sys.version_info[:2] >= (3, 12):
-                    tf.extractall(directory, filter='data')
-                else:
-                    tf.extractall(directory)  # noqa: S202
-        elif self.source.endswith(('.tar.bz2', '.bz2')):
-            import tarfile
+        elif self.streamable:
+            with open(archive, 'rb') as f:
+                self.unpack_stream(f, directory)
+        else:
+            message = f'Unknown archive type: {archive}'
+            raise ValueError(message)
 
-            with tarfile.open(archive, 'r:bz2') as tf:
-                if sys.version_info[:2] >= (3, 12):
-                    tf.extractall(directory, filter='data')
-                else:
-                    tf.extractall(directory)  # noqa: S202
+    def unpack_stream(self, stream: BinaryIO, directory: Path) -> None:
+        if self.source.endswith(('.tar.gz', '.tgz')):
+            _extract_tar_stream(stream, 'r|gz', directory)
+        elif self.source.endswith(('.tar.bz2', '.bz2')):
+            _extract_tar_stream(stream, 'r|bz2', directory)
         elif self.source.endswith(('.tar.zst', '.tar.zstd')):
-            import tarfile
-
             import zstandard
 
-            with open(archive, 'rb') as ifh:
-                dctx = zstandard.ZstdDecompressor()
-                with dctx.stream_reader(ifh) as reader, tarfile.open(mode='r|', fileobj=reader) as tf:
-                    if sys.version_info[:2] >= (3, 12):
-                        tf.extractall(directory, filter='data')
-                    else:
-                        tf.extractall(directory)  # noqa: S202
+            dctx = zstandard.ZstdDecompressor()
+            with dctx.stream_reader(stream) as reader:
+                _extract_tar_stream(reader, 'r|', directory)
         else:
-            message = f'Unknown archive type: {archive}'
+            message = f'Archive type cannot be streamed: {self.archive_name}'
             raise ValueError(message)
 
     @property
@@ -279,6 +279,16 @@ def _get_default_variant_gil() -> str:
     return os.environ.get('HATCH_PYTHON_VARIANT_GIL', '').lower()
 
 
+def _extract_tar_stream(stream: BinaryIO, mode: str, directory: Path) -> None:
+    import tarfile
+
+    with tarfile.open(mode=mode, fileobj=stream) as tf:
+        if sys.version_info[:2] >= (3, 12):
+            tf.extractall(directory, filter='data')
+        else:
+            tf.extractall(directory)  # noqa: S202
+
+
 def _get_distribution_class(source: str) -> type[Distribution]:
     if source.startswith('https://github.com/indygreg/python-build-standalone/releases/download/'):
         return CPythonStandaloneDistribution
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from tempfile import TemporaryFile
+from typing import TYPE_CHECKING, Any, Generator
+
+from hatch.project.core import Project
+
+if TYPE_CHECKING:
+    from hatch.cli.application import Application
+    from hatch.env.plugin.interface import EnvironmentInterface
+    from hatch.utils.fs import Path
+
+# Only commands that are safe to answer repeatedly from resident state are exposed
+SUPPORTED_COMMANDS: dict[str, tuple[str, ...]] = {
+    'dep.hash': ('dep', 'hash'),
+    'dep.show.requirements': ('dep', 'show', 'requirements'),
+    'dep.show.table': ('dep', 'show', 'table'),
+    'env.find': ('env', 'find'),
+    'env.show': ('env', 'show'),
+    'project.metadata': ('project', 'metadata'),
+    'run': ('run',),
+    'status': ('status',),
+    'version': ('version',),
+}
+
+# The maximum number of seconds before the server observes a shutdown request
+POLL_INTERVAL = 0.5
+
+# https://www.jsonrpc.org/specification#error_object
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+
+class ResidentProject(Project):
+    """
+    A project that keeps environment instances alive between requests.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.__environments: dict[str, EnvironmentInterface] = {}
+
+    def get_environment(self, env_name: str | None = None) -> EnvironmentInterface:
+        if env_name is None:
+            env_name = self.app.env
+
+        if env_name not in self.__environments:
+            self.__environments[env_name] = super().get_environment(env_name)
+
+        return self.__environments[env_name]
+
+
+class ProjectServer:
+    """
+    Answers JSON-RPC 2.0 requests for a single project while keeping the application, project,
+    configuration and environment objects in memory. Messages are newline-delimited.
+
+    Each connection is handled by its own thread so that a client is never blocked by another that
+    stays connected, and `server.*` methods are always answered immediately. Commands are run one at
+    a time, whichever connection they come from, because they change process-wide state such as the
+    working directory, environment variables and standard streams.
+    """
+
+    def __init__(self, app: Application, socket_path: Path) -> None:
+        self.parent_app = app
+        self.socket_path = socket_path
+
+        self.running = False
+        self._app: Application | None = None
+        self._watched: dict[str, int | None] = {}
+        self._command_lock = threading.Lock()
+        self._connection_lock = threading.Lock()
+        self._connections = 0
+        self._last_activity = time.monotonic()
+
+    @property
+    def app(self) -> Application:
+        if self._app is None or self._watched != self._snapshot():
+            self._app = self._create_app()
+            self._watched = self._snapshot()
+
+        return self._app
+
+    @property
+    def watched_paths(self) -> list[Path]:
+        location = self.parent_app.project.location
+        return [location / 'pyproject.toml', location / 'hatch.toml', self.parent_app.config_file.path]
+
+    def serve(self, *, idle_timeout: float | None = None) -> None:
+        import socketserver
+
+        server_instance = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                with server_instance.connection():
+                    for line in self.rfile:
+                        if not line.strip():
+                            continue
+
+                        response = server_instance.handle_message(line)
+                        if response is not None:
+                            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+                            self.wfile.flush()
+
+                        if not server_instance.running:
+                            break
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            # Connections that remain open must not prevent the server from exiting
+            daemon_threads = True
+            block_on_close = False
+
+        self.socket_path.parent.ensure_dir_exists()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        # The first request should not pay for loading the project
+        self._app = self._create_app()
+        self._watched = self._snapshot()
+
+        self.running = True
+        self._last_activity = time.monotonic()
+        with Server(str(self.socket_path), RequestHandler) as server:
+            # Wait for connections in short intervals to observe shutdown requests from other threads
+            server.timeout = POLL_INTERVAL if idle_timeout is None else min(idle_timeout, POLL_INTERVAL)
+            try:
+                while self.running:
+                    server.handle_request()
+                    if idle_timeout is not None and self.idle_time() >= idle_timeout:
+                        break
+            finally:
+                self.running = False
+                self.socket_path.unlink(missing_ok=True)
+
+    @contextmanager
+    def connection(self) -> Generator[None, None, None]:
+        with self._connection_lock:
+            self._connections += 1
+
+        try:
+            yield
+        finally:
+            with self._connection_lock:
+                self._connections -= 1
+                self._last_activity = time.monotonic()
+
+    def idle_time(self) -> float:
+        """
+        The number of seconds since the last connection closed, or zero while any connection is open.
+        """
+        with self._connection_lock:
+            return 0 if self._connections else time.monotonic() - self._last_activity
+
+    def handle_message(self, message: bytes) -> dict[str, Any] | None:
+        try:
+            request = json.loads(message)
+        except ValueError as e:
+            return construct_error(None, PARSE_ERROR, str(e))
+
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return construct_error(None, INVALID_REQUEST, 'Invalid request')
+
+        request_id = request.get('id')
+        method = request['method']
+        params = request.get('params', {})
+        if not isinstance(params, dict):
+            return construct_error(request_id, INVALID_PARAMS, 'Parameters must be an object')
+
+        if method == 'server.ping':
+            result: Any = {'pid': os.getpid()}
+        elif method == 'server.shutdown':
+            self.running = False
+            result = None
+        elif method in SUPPORTED_COMMANDS:
+            args = params.get('args', [])
+            if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+                return construct_error(request_id, INVALID_PARAMS, 'Parameter `args` must be an array of strings')
+
+            env_name = params.get('env')
+            if env_name is not None and not isinstance(env_name, str):
+                return construct_error(request_id, INVALID_PARAMS, 'Parameter `env` must be a string')
+
+            result = self.invoke(SUPPORTED_COMMANDS[method], args, env_name=env_name)
+        else:
+            return construct_error(request_id, METHOD_NOT_FOUND, f'Unknown method: {method}')
+
+        # Notifications do not receive responses
+        if 'id' not in request:
+            return None
+
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    def invoke(self, command_path: tuple[str, ...], args: list[str], *, env_name: str | None = None) -> dict[str, Any]:
+        with self._command_lock:
+            return self._invoke(command_path, args, env_name=env_name)
+
+    def _invoke(self, command_path: tuple[str, ...], args: list[str], *, env_name: str | None = None) -> dict[str, Any]:
+        import click
+
+        from hatch.cli import hatch
+
+        app = self.app
+        app.env = env_name or self.parent_app.env
+
+        exit_code = 0
+        with capture_output() as output:
+            try:
+                ctx = click.Context(hatch, info_name='hatch', obj=app)
+                command: click.Command = hatch
+                for name in command_path[:-1]:
+                    command = command.get_command(ctx, name)  # type: ignore[attr-defined]
+                    ctx = click.Context(command, info_name=name, parent=ctx)
+
+                command = command.get_command(ctx, command_path[-1])  # type: ignore[attr-defined]
+                ctx = command.make_context(command_path[-1], list(args), parent=ctx)
+
+                with app.project.location.as_cwd(), ctx:
+                    command.invoke(ctx)
+            except click.exceptions.Exit as e:
+                exit_code = e.exit_code
+            except click.ClickException as e:
+                e.show()
+                exit_code = e.exit_code
+            except Exception as e:  # noqa: BLE001
+                app.display_error(f'{type(e).__name__}: {e}')
+                exit_code = 1
+
+        return {'exit_code': exit_code, **output}
+
+    def _create_app(self) -> Application:
+        from hatch.cli.application import Application
+
+        def exit_func(code: int) -> None:
+            import click
+
+            raise click.exceptions.Exit(code)
+
+        parent_app = self.parent_app
+        app = Application(exit_func, verbosity=parent_app.verbosity, enable_color=False, interactive=False)
+        app.config_file.path = parent_app.config_file.path
+        app.config_file.load()
+        app.config.terminal.styles.parse_fields()
+        app.initialize_styles(app.config.terminal.styles.raw_data)
+
+        app.data_dir = parent_app.data_dir
+        app.cache_dir = parent_app.cache_dir
+        app.env = parent_app.env
+        app.env_active = parent_app.env_active
+
+        app.project = ResidentProject(parent_app.project.location, name=parent_app.project.chosen_name)
+        app.project.set_app(app)
+
+        return app
+
+    def _snapshot(self) -> dict[str, int | None]:
+        snapshot: dict[str, int | None] = {}
+        for path in self.watched_paths:
+            try:
+                snapshot[str(path)] = path.stat().st_mtime_ns
+            except OSError:
+                snapshot[str(path)] = None
+
+        return snapshot
+
+
+def construct_error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+@contextmanager
+def capture_output() -> Generator[dict[str, str], None, None]:
+    # Redirect at the file descriptor level so that the output of subprocesses is also captured
+    from io import TextIOWrapper
+
+    output: dict[str, str] = {}
+    with TemporaryFile() as stdout, TemporaryFile() as stderr:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        original_streams = (sys.stdout, sys.stderr)
+        original_stdout = os.dup(1)
+        original_stderr = os.dup(2)
+        os.dup2(stdout.fileno(), 1)
+        os.dup2(stderr.fileno(), 2)
+        sys.stdout = TextIOWrapper(open(os.dup(1), 'wb'), encoding='utf-8', write_through=True)  # noqa: SIM115
+        sys.stderr = TextIOWrapper(open(os.dup(2), 'wb'), encoding='utf-8', write_through=True)  # noqa: SIM115
+        try:
+            yield output
+        finally:
+            sys.stdout.close()
+            sys.stderr.close()
+            sys.stdout, sys.stderr = original_streams
+            os.dup2(original_stdout, 1)
+            os.dup2(original_stderr, 2)
+            os.close(original_stdout)
+            os.close(original_stderr)
+
+            for name, f in (('stdout', stdout), ('stderr', stderr)):
+                f.seek(0)
+                output[name] = f.read().decode('utf-8', errors='replace')
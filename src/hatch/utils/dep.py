@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from hatchling.metadata.utils import get_normalized_dependency
+from hatchling.metadata.utils import get_normalized_dependency, parse_requirement
 
 if TYPE_CHECKING:
     from packaging.requirements import Requirement
@@ -13,8 +14,13 @@ def normalize_marker_quoting(text: str) -> str:
     return text.replace('"', "'")
 
 
+@lru_cache(maxsize=4096)
+def normalize_dependency(dependency: str) -> str:
+    return get_normalized_dependency(parse_requirement(dependency))
+
+
 def get_normalized_dependencies(requirements: list[Requirement]) -> list[str]:
-    normalized_dependencies = {get_normalized_dependency(requirement) for requirement in requirements}
+    normalized_dependencies = {normalize_dependency(str(requirement)) for requirement in requirements}
     return sorted(normalized_dependencies)
 
 
@@ -25,7 +31,7 @@ def hash_dependencies(requirements: list[Requirement]) -> str:
         sorted(
             # Internal spacing is ignored by PEP 440
             normalized_dependency.replace(' ', '')
-            for normalized_dependency in {get_normalized_dependency(req) for req in requirements}
+            for normalized_dependency in {normalize_dependency(str(req)) for req in requirements}
         )
     ).encode('utf-8')
 
@@ -33,22 +39,18 @@ def hash_dependencies(requirements: list[Requirement]) -> str:
 
 
 def get_complex_dependencies(dependencies: list[str]) -> dict[str, Requirement]:
-    from packaging.requirements import Requirement
-
     dependencies_complex = {}
     for dependency in dependencies:
-        dependencies_complex[dependency] = Requirement(dependency)
+        dependencies_complex[dependency] = parse_requirement(dependency)
 
     return dependencies_complex
 
 
 def get_complex_features(features: dict[str, list[str]]) -> dict[str, dict[str, Requirement]]:
-    from packaging.requirements import Requirement
-
     optional_dependencies_complex = {}
     for feature, optional_dependencies in features.items():
         optional_dependencies_complex[feature] = {
-            optional_dependency: Requirement(optional_dependency) for optional_dependency in optional_dependencies
+            optional_dependency: parse_requirement(optional_dependency) for optional_dependency in optional_dependencies
         }
 
     return optional_dependencies_complex
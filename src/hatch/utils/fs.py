@@ -148,3 +148,41 @@ def temp_directory() -> Generator[Path, None, None]:
 def temp_chdir(env_vars: dict[str, str] | None = None) -> Generator[Path, None, None]:
     with temp_directory() as d, d.as_cwd(env_vars=env_vars):
         yield d
+
+
+@contextmanager
+def exclusive_lock(path: Path) -> Generator[None, None, None]:
+    """
+    Holds an exclusive lock of the file at `path`, which is created if necessary, until exiting. The lock
+    is shared with other processes but not with other threads of the same process, which must coordinate
+    by other means.
+    """
+    path.ensure_parent_dir_exists()
+    with open(path, 'a+b') as f:
+        if sys.platform == 'win32':
+            import msvcrt
+
+            # Locks apply to a byte range starting at the current position
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                except OSError:
+                    # The attempt is abandoned after 10 seconds
+                    continue
+
+                break
+
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
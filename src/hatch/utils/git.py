@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hatch.utils.fs import Path
+    from hatch.utils.platform import Platform
+
+
+def get_changed_files(platform: Platform, root: Path, ref: str, *, include_deleted: bool = False) -> list[str]:
+    """
+    Returns the paths, relative to the root, of files within it that differ from the point at which the
+    Git reference and the commit checked out diverged, or are untracked and not ignored. Changes made to
+    the reference since then, such as new commits to the branch being compared with, are not included.
+    """
+    import subprocess
+
+    with root.as_cwd():
+        if ref != 'HEAD':
+            ref = platform.check_command_output(['git', 'merge-base', ref, 'HEAD'], stderr=subprocess.PIPE).strip()
+
+        diff_command = ['git', 'diff', '--name-only', '--relative', '-z', ref, '--']
+        if not include_deleted:
+            diff_command.insert(-2, '--diff-filter=d')
+
+        modified = platform.check_command_output(diff_command, stderr=subprocess.PIPE)
+        untracked = platform.check_command_output(
+            ['git', 'ls-files', '--others', '--exclude-standard', '-z'],
+            stderr=subprocess.PIPE,
+        )
+
+    return sorted({path for path in f'{modified}\0{untracked}'.split('\0') if path})
+
+
+def get_worktree_state(platform: Platform, root: Path) -> str | None:
+    """
+    Returns a digest of the commit checked out in the root and the contents of every file within it that
+    differs from that commit, or `None` if the root is not within a Git repository.
+    """
+    import hashlib
+
+    commands = (
+        ['git', 'rev-parse', 'HEAD'],
+        ['git', 'diff', '--name-only', '--relative', '-z', 'HEAD', '--'],
+        ['git', 'ls-files', '--others', '--exclude-standard', '-z'],
+    )
+    outputs: list[str] = []
+    try:
+        with root.as_cwd():
+            for command in commands:
+                process = platform.run_command(command, capture_output=True)
+                if process.returncode:
+                    return None
+
+                outputs.append(process.stdout.decode('utf-8'))
+    except OSError:
+        return None
+
+    head, modified, untracked = outputs
+    if not (head := head.strip()):
+        return None
+
+    hasher = hashlib.sha256(head.encode('utf-8'))
+    for path in sorted({path for path in f'{modified}\0{untracked}'.split('\0') if path}):
+        hasher.update(f'\0{path}\0'.encode())
+        try:
+            hasher.update(hashlib.sha256((root / path).read_bytes()).digest())
+        except OSError:
+            hasher.update(b'missing')
+
+    return hasher.hexdigest()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import threading
 import time
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Generator
+from io import RawIOBase
+from typing import TYPE_CHECKING, Any, BinaryIO, Generator
 
 if TYPE_CHECKING:
     import httpx
@@ -15,34 +16,265 @@ MAXIMUM_SLEEP = 20
 # which is the default TCP packet retransmission window. See:
 # https://tools.ietf.org/html/rfc2988
 DEFAULT_TIMEOUT = 10
+DEFAULT_CHUNK_SIZE = 65536
+# Idle connections are kept open long enough to be reused across the requests of a single command
+KEEPALIVE_EXPIRY = 30
 
+_clients: dict[tuple[Any, Any, bool], httpx.Client] = {}
+_clients_lock = threading.Lock()
 
-@contextmanager
-def streaming_response(*args: Any, **kwargs: Any) -> Generator[httpx.Response, None, None]:
+
+def get_client(*, verify: Any = True, cert: Any = None) -> httpx.Client:
+    """
+    Returns a client shared by every caller with the same TLS settings, creating it on first use. Sharing
+    a client allows connections to be reused rather than establishing a new one for each request. HTTP/2
+    is used if the `HATCH_HTTP2` environment variable is enabled, which requires the `h2` package.
+    """
+    import os
+
+    from hatch.config.constants import AppEnvVars
+
+    http2 = os.environ.get(AppEnvVars.HTTP2, '').lower() in {'1', 'true'}
+    key = (verify, cert, http2)
+    with _clients_lock:
+        if key not in _clients:
+            import atexit
+
+            import httpx
+
+            if not _clients:
+                atexit.register(close_clients)
+
+            transport_options = {
+                'retries': 3,
+                'verify': verify,
+                'cert': cert,
+                'http2': http2,
+                'limits': httpx.Limits(keepalive_expiry=KEEPALIVE_EXPIRY),
+            }
+            # Proxies from the environment are only mounted by default when no transport is given
+            mounts: dict[str, httpx.HTTPTransport | None] = {}
+            for pattern, proxy in get_environment_proxies().items():
+                mounts[pattern] = (
+                    None if proxy is None else httpx.HTTPTransport(proxy=httpx.Proxy(proxy), **transport_options)
+                )
+
+            _clients[key] = httpx.Client(
+                transport=httpx.HTTPTransport(**transport_options),
+                mounts=mounts,
+                timeout=DEFAULT_TIMEOUT,
+            )
+
+        return _clients[key]
+
+
+def get_environment_proxies() -> dict[str, str | None]:
+    """
+    Returns the proxy to use for each URL pattern, as configured by the `HTTP_PROXY`, `HTTPS_PROXY`,
+    `ALL_PROXY` and `NO_PROXY` environment variables, in the same way as HTTPX does for clients that
+    are not given a transport. Patterns that map to `None` are not proxied.
+    """
+    from ipaddress import IPv6Address, ip_address
+    from urllib.request import getproxies
+
+    proxy_info = getproxies()
+    proxies: dict[str, str | None] = {}
+    for scheme in ('http', 'https', 'all'):
+        if proxy := proxy_info.get(scheme):
+            proxies[f'{scheme}://'] = proxy if '://' in proxy else f'http://{proxy}'
+
+    for entry in proxy_info.get('no', '').split(','):
+        host = entry.strip()
+        if host == '*':
+            return {}
+
+        if not host:
+            continue
+
+        if '://' in host:
+            proxies[host] = None
+            continue
+
+        try:
+            address = ip_address(host.split('/')[0])
+        except ValueError:
+            proxies[f'all://{host}' if host.lower() == 'localhost' else f'all://*{host}'] = None
+        else:
+            proxies[f'all://[{host}]' if isinstance(address, IPv6Address) else f'all://{host}'] = None
+
+    return proxies
+
+
+def close_clients() -> None:
+    with _clients_lock:
+        while _clients:
+            _, client = _clients.popitem()
+            client.close()
+
+
+def iter_download(url: str, **kwargs: Any) -> Generator[bytes, None, None]:
+    """
+    Yields the body of a GET request. Interrupted transfers resume from the last byte received using range
+    requests, guarded by the validator of the first response so that content is never mixed between versions
+    of a resource. Servers that ignore ranges are supported by discarding the bytes that were already received.
+    Transfers of resources without a strong validator cannot be resumed, so interrupting them is an error.
+    """
     from secrets import choice
 
     import httpx
 
+    from hatch.errors import DownloadError
+
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    base_headers = dict(kwargs.pop('headers', None) or {})
+    # Byte ranges must refer to the content as it is received
+    base_headers.setdefault('Accept-Encoding', 'identity')
+
+    offset = 0
+    validator: str | None = None
     attempts = 0
     while True:
-        attempts += 1
+        headers = dict(base_headers)
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+            if validator is not None:
+                headers['If-Range'] = validator
+
         try:
-            with httpx.stream(*args, **kwargs) as response:
+            with get_client().stream('GET', url, headers=headers, **kwargs) as response:
                 response.raise_for_status()
-                yield response
 
-            break
-        except httpx.HTTPError:
+                current_validator = get_strong_validator(response)
+                if not offset:
+                    validator = current_validator
+                elif current_validator != validator:
+                    message = f'Resource changed while downloading: {url}'
+                    raise DownloadError(message)
+
+                if response.status_code == httpx.codes.PARTIAL_CONTENT:
+                    range_start = get_content_range_start(response)
+                    if range_start != offset:
+                        message = f'Expected content starting at byte {offset} but received {range_start}: {url}'
+                        raise DownloadError(message)
+
+                    skip = 0
+                else:
+                    skip = offset
+
+                # Chunks are not buffered to a fixed size so that nothing received is lost on failure
+                for chunk in response.iter_bytes():
+                    if skip:
+                        if len(chunk) <= skip:
+                            skip -= len(chunk)
+                            continue
+
+                        chunk = chunk[skip:]  # noqa: PLW2901
+                        skip = 0
+
+                    if chunk:
+                        offset += len(chunk)
+                        # Only consecutive failures without progress count towards giving up
+                        attempts = 0
+                        yield chunk
+        except httpx.HTTPError as e:
+            # Without a validator, ranges could mix content between versions of the resource
+            if offset and validator is None:
+                message = f'Download interrupted and cannot be resumed without a strong validator: {url}'
+                raise DownloadError(message) from e
+
+            attempts += 1
             sleep = min(MAXIMUM_SLEEP, MINIMUM_SLEEP * 2**attempts)
             if sleep == MAXIMUM_SLEEP:
                 raise
 
             time.sleep(choice(range(sleep + 1)))
+        else:
+            return
 
 
-def download_file(path: Path, *args: Any, **kwargs: Any) -> None:
-    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+def download_file(path: Path, url: str, **kwargs: Any) -> None:
+    """
+    Downloads `url` to `path`, resuming after interruptions. The file is only moved into place once complete.
+    """
+    partial_path = path.with_name(f'{path.name}.part')
+    try:
+        with partial_path.open(mode='wb', buffering=0) as f:
+            for chunk in iter_download(url, **kwargs):
+                f.write(chunk)
+
+        partial_path.replace(path)
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+
+def get_strong_validator(response: httpx.Response) -> str | None:
+    # Weak entity tags cannot be used with `If-Range`
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+
+    return response.headers.get('Last-Modified')
+
+
+def get_content_range_start(response: httpx.Response) -> int | None:
+    # bytes 100-199/1000
+    unit, _, content_range = response.headers.get('Content-Range', '').partition(' ')
+    if unit != 'bytes':
+        return None
+
+    range_start, _, _ = content_range.partition('-')
+    return int(range_start) if range_start.isdigit() else None
+
+
+class DownloadStream(RawIOBase):
+    """
+    A read-only file object over a download so that consumers like `tarfile` may process content as it
+    arrives, resuming after interruptions. Every byte that is received updates a SHA-256 digest and,
+    if a sink is given, is also written to it.
+    """
+
+    def __init__(self, url: str, *, sink: BinaryIO | None = None, **kwargs: Any) -> None:
+        from hashlib import sha256
+
+        super().__init__()
+
+        self.__chunks = iter_download(url, **kwargs)
+        self.__pending = memoryview(b'')
+        self.__hasher = sha256()
+        self.__sink = sink
+
+    @property
+    def hexdigest(self) -> str:
+        return self.__hasher.hexdigest()
+
+    def readable(self) -> bool:  # noqa: PLR6301
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self.__pending:
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                return 0
+
+            self.__receive(chunk)
+            self.__pending = memoryview(chunk)
+
+        size = min(len(buffer), len(self.__pending))
+        buffer[:size] = self.__pending[:size]
+        self.__pending = self.__pending[size:]
+        return size
+
+    def close(self) -> None:
+        self.__chunks.close()
+        super().close()
+
+    def exhaust(self) -> None:
+        # Archive readers may stop before trailing padding so consume the rest for an accurate digest
+        self.__pending = memoryview(b'')
+        for chunk in self.__chunks:
+            self.__receive(chunk)
 
-    with path.open(mode='wb', buffering=0) as f, streaming_response('GET', *args, **kwargs) as response:
-        for chunk in response.iter_bytes(16384):
-            f.write(chunk)
+    def __receive(self, chunk: bytes) -> None:
+        self.__hasher.update(chunk)
+        if self.__sink is not None:
+            self.__sink.write(chunk)
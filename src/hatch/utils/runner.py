@@ -25,10 +25,24 @@ class ExecutionContext:
         self.show_code_on_error = show_code_on_error
         self.hide_commands = hide_commands
         self.source = source
+        # Prepended to the module search path after the environment's own variables are applied
+        self.module_search_paths: list[str] = []
 
     def add_shell_command(self, command: str | list[str]) -> None:
         self.shell_commands.append(command if isinstance(command, str) else self.env.join_command_args(command))
 
+    def get_module_search_path_env_vars(self) -> dict[str, str]:
+        import os
+
+        if not self.module_search_paths:
+            return {}
+
+        search_paths = list(self.module_search_paths)
+        if search_path := os.environ.get('PYTHONPATH'):
+            search_paths.append(search_path)
+
+        return {'PYTHONPATH': os.pathsep.join(search_paths)}
+
 
 def parse_matrix_variables(specs: tuple[str, ...]) -> dict[str, set[str]]:
     variables: dict[str, set[str]] = {}
@@ -10,6 +10,17 @@ from hatchling.metadata.spec import DEFAULT_METADATA_VERSION, get_core_metadata_
 from hatchling.utils.constants import DEFAULT_BUILD_SCRIPT, DEFAULT_CONFIG_FILE
 
 
+def read_files(directory):
+    files = {}
+    for root, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            path = os.path.join(root, file_name)
+            with open(path, 'rb') as f:
+                files[os.path.relpath(path, directory)] = f.read()
+
+    return files
+
+
 def test_class():
     assert issubclass(SdistBuilder, BuilderInterface)
 
@@ -705,6 +716,86 @@ class TestBuildStandard:
         stat = os.stat(str(extraction_directory / builder.project_id / 'PKG-INFO'))
         assert stat.st_mtime == get_reproducible_timestamp()
 
+    def test_metadata_first(self, hatch, helpers, temp_dir, config_file):
+        config_file.model.template.plugins['default']['src-layout'] = False
+        config_file.save()
+
+        project_name = 'My.App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        config = {
+            'project': {'name': project_name, 'dynamic': ['version']},
+            'tool': {
+                'hatch': {
+                    'version': {'path': 'my_app/__about__.py'},
+                    'build': {'targets': {'sdist': {'versions': ['standard']}}},
+                },
+            },
+        }
+        builder = SdistBuilder(str(project_path), config=config)
+
+        with project_path.as_cwd():
+            artifacts = list(builder.build(directory=str(temp_dir / 'dist')))
+
+        extraction_directory = temp_dir / '_archive'
+        with tarfile.open(artifacts[0], 'r:gz') as tar_archive:
+            assert tar_archive.getnames()[0] == f'{builder.project_id}/PKG-INFO'
+            tar_archive.extractall(str(extraction_directory), **helpers.tarfile_extraction_compat_options())
+
+        # Rebuilding from the source distribution does not duplicate the metadata file
+        rebuild_path = extraction_directory / builder.project_id
+        builder = SdistBuilder(str(rebuild_path), config=config)
+
+        with rebuild_path.as_cwd():
+            artifacts = list(builder.build(directory=str(temp_dir / 'rebuild')))
+
+        with tarfile.open(artifacts[0], 'r:gz') as tar_archive:
+            names = tar_archive.getnames()
+
+        assert names[0] == f'{builder.project_id}/PKG-INFO'
+        assert names.count(f'{builder.project_id}/PKG-INFO') == 1
+
+    def test_staged(self, hatch, helpers, temp_dir, config_file):
+        config_file.model.template.plugins['default']['src-layout'] = False
+        config_file.save()
+
+        project_name = 'My.App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        config = {
+            'project': {'name': project_name, 'dynamic': ['version']},
+            'tool': {
+                'hatch': {
+                    'version': {'path': 'my_app/__about__.py'},
+                    'build': {'targets': {'sdist': {'versions': ['standard']}}},
+                },
+            },
+        }
+        builder = SdistBuilder(str(project_path), config=config)
+
+        with project_path.as_cwd(), builder.staged() as staged_root:
+            artifacts = list(builder.build(directory=str(temp_dir / 'dist')))
+
+            extraction_directory = temp_dir / '_archive'
+            with tarfile.open(artifacts[0], 'r:gz') as tar_archive:
+                tar_archive.extractall(str(extraction_directory), **helpers.tarfile_extraction_compat_options())
+
+            # The staging directory has the same contents as the extracted archive
+            assert os.path.basename(staged_root) == builder.project_id
+            assert read_files(staged_root) == read_files(str(extraction_directory / builder.project_id))
+
+        assert not os.path.exists(staged_root)
+
     def test_default_no_reproducible(self, hatch, helpers, temp_dir, config_file):
         config_file.model.template.plugins['default']['src-layout'] = False
         config_file.save()
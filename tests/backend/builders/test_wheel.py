@@ -730,6 +730,62 @@ class TestConstructEntryPointsFile:
         )
 
 
+class TestEditableFiles:
+    @fixed_pathlib_resolution
+    def test_detection(self, hatch, temp_dir):
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        config = {'project': {'name': 'My.App', 'version': '0.0.1'}}
+        builder = WheelBuilder(str(project_path), config=config)
+
+        with project_path.as_cwd():
+            assert builder.get_exposed_packages() == {'my_app': str(project_path / 'src' / 'my_app')}
+            assert builder.get_editable_files() == [('_my_app.pth', str(project_path / 'src'))]
+
+    @fixed_pathlib_resolution
+    def test_detection_new_top_level_module(self, hatch, temp_dir):
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        (project_path / 'lib').mkdir()
+        (project_path / 'lib' / 'foo.py').touch()
+        config = {
+            'project': {'name': 'My.App', 'version': '0.0.1'},
+            'tool': {'hatch': {'build': {'targets': {'wheel': {'packages': ['src/my_app', 'lib/foo.py']}}}}},
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        with project_path.as_cwd():
+            assert builder.get_editable_files() == [
+                ('_my_app.pth', f'{project_path / "lib"}\n{project_path / "src"}'),
+            ]
+
+    def test_dev_mode_dirs(self, hatch, temp_dir):
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        config = {
+            'project': {'name': 'My.App', 'version': '0.0.1'},
+            'tool': {'hatch': {'build': {'dev-mode-dirs': ['src', '.']}}},
+        }
+        builder = WheelBuilder(str(project_path), config=config)
+
+        with project_path.as_cwd():
+            assert builder.get_editable_files() == [
+                ('_my_app.pth', '\n'.join(sorted([str(project_path), str(project_path / 'src')]))),
+            ]
+
+
 class TestBuildStandard:
     def test_default_auto_detection(self, hatch, helpers, temp_dir, config_file):
         config_file.model.template.plugins['default']['src-layout'] = False
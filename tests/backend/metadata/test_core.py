@@ -1499,6 +1499,120 @@ class TestHook:
             _ = metadata.core
 
 
+class TestCacheInputs:
+    def test_static(self, isolation):
+        metadata = ProjectMetadata(str(isolation), PluginManager(), {'project': {'name': 'foo', 'version': '0.0.1'}})
+
+        assert metadata.get_cache_inputs() == {'files': ['pyproject.toml', 'hatch.toml', 'PKG-INFO'], 'env-vars': []}
+
+    def test_version_source(self, isolation):
+        metadata = ProjectMetadata(
+            str(isolation),
+            PluginManager(),
+            {'project': {'name': 'foo', 'dynamic': ['version']}, 'tool': {'hatch': {'version': {'path': 'a/b'}}}},
+        )
+
+        assert metadata.get_cache_inputs() == {
+            'files': ['pyproject.toml', 'hatch.toml', 'PKG-INFO', 'a/b'],
+            'env-vars': [],
+        }
+
+    def test_version_source_env_var(self, isolation):
+        metadata = ProjectMetadata(
+            str(isolation),
+            PluginManager(),
+            {
+                'project': {'name': 'foo', 'dynamic': ['version']},
+                'tool': {'hatch': {'version': {'source': 'env', 'variable': 'FOO_VERSION'}}},
+            },
+        )
+
+        assert metadata.get_cache_inputs() == {
+            'files': ['pyproject.toml', 'hatch.toml', 'PKG-INFO'],
+            'env-vars': ['FOO_VERSION'],
+        }
+
+    def test_version_source_not_cacheable(self, isolation):
+        metadata = ProjectMetadata(
+            str(isolation),
+            PluginManager(),
+            {
+                'project': {'name': 'foo', 'dynamic': ['version']},
+                'tool': {'hatch': {'version': {'source': 'code', 'path': 'a/b', 'search-paths': ['c']}}},
+            },
+        )
+
+        assert metadata.get_cache_inputs() is None
+
+    def test_context_formatting(self, isolation):
+        metadata = ProjectMetadata(
+            str(isolation),
+            PluginManager(),
+            {'project': {'name': 'foo', 'version': '0.0.1', 'dependencies': ['bar @ {env:BAR_URL:https://x.y}']}},
+        )
+
+        assert metadata.get_cache_inputs() == {
+            'files': ['pyproject.toml', 'hatch.toml', 'PKG-INFO'],
+            'env-vars': ['BAR_URL'],
+        }
+
+    def test_custom_hook_default(self, temp_dir, helpers):
+        metadata = ProjectMetadata(
+            str(temp_dir),
+            PluginManager(),
+            {
+                'project': {'name': 'foo', 'version': '0.0.1', 'dynamic': ['description']},
+                'tool': {'hatch': {'metadata': {'hooks': {'custom': {}}}}},
+            },
+        )
+
+        file_path = temp_dir / DEFAULT_BUILD_SCRIPT
+        file_path.write_text(
+            helpers.dedent(
+                """
+                from hatchling.metadata.plugin.interface import MetadataHookInterface
+
+                class CustomHook(MetadataHookInterface):
+                    def update(self, metadata):
+                        metadata['description'] = 'bar'
+                """
+            )
+        )
+
+        assert metadata.get_cache_inputs() is None
+
+    def test_custom_hook_declared(self, temp_dir, helpers):
+        metadata = ProjectMetadata(
+            str(temp_dir),
+            PluginManager(),
+            {
+                'project': {'name': 'foo', 'version': '0.0.1', 'dynamic': ['description']},
+                'tool': {'hatch': {'metadata': {'hooks': {'custom': {}}}}},
+            },
+        )
+
+        file_path = temp_dir / DEFAULT_BUILD_SCRIPT
+        file_path.write_text(
+            helpers.dedent(
+                """
+                from hatchling.metadata.plugin.interface import MetadataHookInterface
+
+                class CustomHook(MetadataHookInterface):
+                    def update(self, metadata):
+                        metadata['description'] = 'bar'
+
+                    def get_cache_inputs(self):
+                        return {'files': ['README.md'], 'env-vars': ['BAR']}
+                """
+            )
+        )
+
+        assert metadata.get_cache_inputs() == {
+            'files': ['pyproject.toml', 'hatch.toml', 'PKG-INFO', 'README.md', DEFAULT_BUILD_SCRIPT],
+            'env-vars': ['BAR'],
+        }
+
+
 class TestHatchPersonalProjectConfigFile:
     def test_correct(self, temp_dir, helpers):
         metadata = ProjectMetadata(
@@ -0,0 +1,28 @@
+from hatchling.metadata.utils import get_normalized_dependency, parse_requirement
+
+
+class TestParseRequirement:
+    def test_equivalent(self):
+        requirement = parse_requirement("Foo_Bar[Baz]>=1.0; python_version < '3.10'")
+
+        assert requirement.name == 'Foo_Bar'
+        assert requirement.extras == {'Baz'}
+        assert str(requirement.specifier) == '>=1.0'
+        assert str(requirement.marker) == 'python_version < "3.10"'
+
+    def test_new_object(self):
+        first = parse_requirement('foo[bar]>=1')
+        second = parse_requirement('foo[bar]>=1')
+
+        assert first == second
+        assert first is not second
+        assert first.extras is not second.extras
+
+    def test_normalization_isolated(self):
+        dependency = 'Foo_Bar[Baz]>=1.0RC1'
+        assert get_normalized_dependency(parse_requirement(dependency)) == 'foo-bar[baz]>=1.0rc1'
+
+        requirement = parse_requirement(dependency)
+        assert requirement.name == 'Foo_Bar'
+        assert requirement.extras == {'Baz'}
+        assert str(requirement.specifier) == '>=1.0RC1'
@@ -0,0 +1,97 @@
+import sys
+
+import pytest
+
+from hatch.utils.structures import EnvVars
+from hatchling.builders.constants import BuildEnvVars
+from hatchling.plugin.manager import PluginManager
+
+
+@pytest.fixture
+def plugin_distribution(temp_dir, monkeypatch):
+    site_packages = temp_dir / 'site-packages'
+    site_packages.mkdir()
+
+    dist_info = site_packages / 'hatch_foo-1.0.0.dist-info'
+    dist_info.mkdir()
+    (dist_info / 'METADATA').write_text('Metadata-Version: 2.1\nName: hatch-foo\nVersion: 1.0.0\n')
+    (dist_info / 'entry_points.txt').write_text('[hatch]\nfoo = hatch_foo_plugin\n')
+    (site_packages / 'hatch_foo_plugin.py').write_text(
+        """\
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+from hatchling.plugin import hookimpl
+
+
+class FooBuildHook(BuildHookInterface):
+    PLUGIN_NAME = 'foo'
+
+
+@hookimpl
+def hatch_register_build_hook():
+    return FooBuildHook
+"""
+    )
+
+    monkeypatch.syspath_prepend(str(site_packages))
+    yield site_packages
+    sys.modules.pop('hatch_foo_plugin', None)
+
+
+@pytest.mark.usefixtures('plugin_distribution')
+class TestIndex:
+    def test_disabled_by_default(self):
+        plugin_manager = PluginManager()
+
+        assert plugin_manager.build_hook.get('foo').__name__ == 'FooBuildHook'
+        assert plugin_manager.third_party_plugins.loaded
+        assert plugin_manager.third_party_plugins.index_path is None
+
+    def test_written_after_load(self, temp_dir):
+        index_directory = temp_dir / 'index'
+        plugin_manager = PluginManager(index_directory=str(index_directory))
+        plugin_manager.build_hook.collect()
+
+        index = plugin_manager.third_party_plugins.index
+        assert index is not None
+        assert index['entry_points'] == {'foo': 'hatch_foo_plugin'}
+        assert index['plugins'] == {'hatch_register_build_hook': {'foo': ['foo']}}
+        assert len(list(index_directory.iterdir())) == 1
+
+    def test_directory_from_environment(self, temp_dir):
+        index_directory = temp_dir / 'index'
+        with EnvVars({BuildEnvVars.PLUGIN_INDEX_DIR: str(index_directory)}):
+            plugin_manager = PluginManager()
+            plugin_manager.build_hook.collect()
+
+        assert plugin_manager.third_party_plugins.index_path is not None
+        assert len(list(index_directory.iterdir())) == 1
+
+    def test_lazy_load(self, temp_dir):
+        index_directory = str(temp_dir / 'index')
+        PluginManager(index_directory=index_directory).build_hook.collect()
+        sys.modules.pop('hatch_foo_plugin', None)
+
+        plugin_manager = PluginManager(index_directory=index_directory)
+        assert plugin_manager.build_hook.get('foo').__name__ == 'FooBuildHook'
+        assert not plugin_manager.third_party_plugins.loaded
+
+    def test_lazy_unknown(self, temp_dir):
+        index_directory = str(temp_dir / 'index')
+        PluginManager(index_directory=index_directory).build_hook.collect()
+        sys.modules.pop('hatch_foo_plugin', None)
+
+        plugin_manager = PluginManager(index_directory=index_directory)
+        assert plugin_manager.build_hook.get('bar') is None
+        assert not plugin_manager.third_party_plugins.loaded
+        assert 'hatch_foo_plugin' not in sys.modules
+
+    def test_invalidated_by_site_packages_change(self, temp_dir, plugin_distribution):
+        index_directory = str(temp_dir / 'index')
+        PluginManager(index_directory=index_directory).build_hook.collect()
+
+        (plugin_distribution / 'other-1.0.0.dist-info').mkdir()
+
+        plugin_manager = PluginManager(index_directory=index_directory)
+        assert plugin_manager.third_party_plugins.index is None
+        assert plugin_manager.build_hook.get('foo').__name__ == 'FooBuildHook'
+        assert plugin_manager.third_party_plugins.loaded
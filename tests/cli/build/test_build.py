@@ -1,5 +1,8 @@
+import hashlib
+import json
 import os
 import re
+import zipfile
 
 import pytest
 
@@ -321,6 +324,237 @@ def test_default(hatch, temp_dir, helpers):
     )
 
 
+def test_verify(hatch, temp_dir, helpers):
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+
+    with path.as_cwd():
+        result = hatch('build', '--verify')
+        assert result.exit_code == 0, result.output
+
+    build_directory = path / 'dist'
+    sdist_path = next(build_directory.glob('*.tar.gz'))
+    wheel_path = next(build_directory.glob('*.whl'))
+
+    assert result.output.endswith(
+        helpers.dedent(
+            f"""
+            {sdist_path.relative_to(path)} ... verified
+            {wheel_path.relative_to(path)} ... verified
+            """
+        )
+    )
+
+    manifest = json.loads((build_directory / '.checksums.json').read_text())
+    assert sorted(manifest) == sorted([sdist_path.name, wheel_path.name])
+    assert manifest[wheel_path.name]['digests']['sha256_digest'] == hashlib.sha256(wheel_path.read_bytes()).hexdigest()
+
+
+@pytest.mark.parametrize('artifacts_file', [True, False], ids=['artifacts-file', 'output-directory'])
+def test_verify_built_artifacts_only(hatch, temp_dir, helpers, mocker, artifacts_file):
+    if not artifacts_file:
+        mocker.patch('hatch.project.frontend.core.HatchBuildFrontend.get_build_options', return_value=[])
+
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+    build_directory = path / 'dist'
+    build_directory.mkdir()
+    (build_directory / 'foo-1.0.tar.gz').write_bytes(b'foo')
+
+    with path.as_cwd():
+        result = hatch('build', '-t', 'wheel', '--verify')
+
+    assert result.exit_code == 0, result.output
+    wheel_path = next(build_directory.glob('*.whl'))
+    assert result.output.endswith(
+        helpers.dedent(
+            f"""
+            {wheel_path.relative_to(path)} ... verified
+            """
+        )
+    )
+
+
+@pytest.mark.parametrize('artifacts_file', [True, False], ids=['artifacts-file', 'output-directory'])
+def test_verify_configured_directory(hatch, temp_dir, helpers, mocker, artifacts_file):
+    if not artifacts_file:
+        mocker.patch('hatch.project.frontend.core.HatchBuildFrontend.get_build_options', return_value=[])
+
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+    project = Project(path)
+    config = dict(project.raw_config)
+    config['tool']['hatch']['build'] = {'directory': 'artifacts', 'targets': {'wheel': {'directory': 'wheels'}}}
+    project.save_config(config)
+
+    with path.as_cwd():
+        result = hatch('build', '--verify')
+
+    assert result.exit_code == 0, result.output
+    sdist_path = next((path / 'artifacts').glob('*.tar.gz'))
+    wheel_path = next((path / 'wheels').glob('*.whl'))
+    assert not (path / 'dist').exists()
+    assert result.output.endswith(
+        helpers.dedent(
+            f"""
+            {sdist_path.relative_to(path)} ... verified
+            {wheel_path.relative_to(path)} ... verified
+            """
+        )
+    )
+
+    manifest = json.loads((path / 'wheels' / '.checksums.json').read_text())
+    assert sorted(manifest) == [wheel_path.name]
+
+
+def test_wheel_from_sdist(hatch, temp_dir, helpers):
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+    project = Project(path)
+    config = dict(project.raw_config)
+    config['tool']['hatch']['build'] = {
+        'targets': {'sdist': {'exclude': ['tests']}, 'wheel': {'packages': ['src/my_app']}}
+    }
+    project.save_config(config)
+
+    with path.as_cwd():
+        result = hatch('build', '--wheel-from-sdist')
+        assert result.exit_code == 0, result.output
+
+    build_directory = path / 'dist'
+    sdist_path = next(build_directory.glob('*.tar.gz'))
+    wheel_path = next(build_directory.glob('*.whl'))
+    assert len(list(build_directory.iterdir())) == 2
+
+    assert result.output == helpers.dedent(
+        f"""
+        Creating environment: hatch-build
+        Checking dependencies
+        Syncing dependencies
+        Inspecting build dependencies
+        ──────────────────────────────── sdist -> wheel ────────────────────────────────
+        [sdist]
+        {sdist_path.relative_to(path)}
+
+        [wheel]
+        {wheel_path.relative_to(path)}
+        """
+    )
+
+
+def test_wheel_from_sdist_excluded_files(hatch, temp_dir):
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+    (path / 'src' / 'my_app' / 'extra.py').touch()
+    project = Project(path)
+    config = dict(project.raw_config)
+    config['tool']['hatch']['build'] = {'targets': {'sdist': {'exclude': ['extra.py']}}}
+    project.save_config(config)
+
+    with path.as_cwd():
+        result = hatch('build', '--wheel-from-sdist')
+        assert result.exit_code == 0, result.output
+
+    # Files missing from the source distribution are missing from the wheel
+    wheel_path = next((path / 'dist').glob('*.whl'))
+    with zipfile.ZipFile(str(wheel_path)) as zip_archive:
+        names = zip_archive.namelist()
+
+    assert 'my_app/__init__.py' in names
+    assert 'my_app/extra.py' not in names
+
+
+def test_wheel_from_sdist_unknown_targets(hatch, temp_dir, helpers):
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+
+    with path.as_cwd():
+        result = hatch('build', '-t', 'binary', '--wheel-from-sdist')
+
+    assert result.exit_code == 1, result.output
+    assert result.output == helpers.dedent(
+        """
+        Only the `sdist` and `wheel` targets may be built with --wheel-from-sdist
+        """
+    )
+
+
+def test_wheel_from_sdist_unsupported(hatch, temp_dir, helpers, mocker):
+    mocker.patch('hatch.project.frontend.core.HatchBuildFrontend.get_build_options', return_value=['directory'])
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+
+    with path.as_cwd():
+        result = hatch('build', '--wheel-from-sdist')
+
+    assert result.exit_code == 1, result.output
+    assert result.output.endswith(
+        helpers.dedent(
+            """
+            The version of Hatchling in the build environment does not support --wheel-from-sdist
+            """
+        )
+    )
+    assert not (path / 'dist').exists()
+
+
+@pytest.mark.parametrize('target', ['wheel:editable', 'wheel:standard,editable'])
+def test_wheel_from_sdist_editable(hatch, temp_dir, helpers, target):
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+
+    with path.as_cwd():
+        result = hatch('build', '-t', target, '--wheel-from-sdist')
+
+    assert result.exit_code == 1, result.output
+    assert result.output == helpers.dedent(
+        """
+        The `editable` wheel version cannot be built with --wheel-from-sdist
+        """
+    )
+    assert not (path / 'dist').exists()
+
+
 def test_explicit_targets(hatch, temp_dir, helpers):
     project_name = 'My.App'
 
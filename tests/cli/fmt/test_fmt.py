@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import subprocess
+
 import pytest
 
 from hatch.config.constants import ConfigEnvVars
@@ -478,6 +481,196 @@ extend = "{config_path}\""""
         )
 
 
+def git(path, *args):
+    subprocess.run(['git', '-c', 'user.name=foo', '-c', 'user.email=foo@bar.baz', *args], cwd=str(path), check=True)
+
+
+class TestChanged:
+    def test_changed(self, hatch, helpers, temp_dir, config_file, env_run, mocker, platform):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        config_dir = data_path / 'env' / '.internal' / 'hatch-static-analysis' / '.config' / project_path.id
+        user_config_path = platform.join_command_args([str(config_dir / 'pyproject.toml')])
+        get_changed_files = mocker.patch(
+            'hatch.cli.fmt.core.get_changed_files', return_value=['src/my_app/__init__.py', 'src/my_app/foo.py']
+        )
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('fmt', '--changed')
+
+        assert result.exit_code == 0, result.output
+        paths = 'src/my_app/__init__.py src/my_app/foo.py'
+        assert result.output == helpers.dedent(
+            f"""
+            cmd [1] | ruff check --config {user_config_path} --fix --force-exclude {paths}
+            cmd [2] | ruff format --config {user_config_path} --force-exclude {paths}
+            """
+        )
+
+        assert env_run.call_args_list == [
+            mocker.call(f'ruff check --config {user_config_path} --fix --force-exclude {paths}', shell=True),
+            mocker.call(f'ruff format --config {user_config_path} --force-exclude {paths}', shell=True),
+        ]
+        assert get_changed_files.call_args.args[1:] == (project_path, 'HEAD')
+
+    def test_since(self, hatch, temp_dir, config_file, env_run, mocker, platform):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        config_dir = data_path / 'env' / '.internal' / 'hatch-static-analysis' / '.config' / project_path.id
+        user_config_path = platform.join_command_args([str(config_dir / 'pyproject.toml')])
+        get_changed_files = mocker.patch('hatch.cli.fmt.core.get_changed_files', return_value=['src/my_app/foo.py'])
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('fmt', '--linter', '--since', 'main')
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        assert env_run.call_args_list == [
+            mocker.call(f'ruff check --config {user_config_path} --fix --force-exclude src/my_app/foo.py', shell=True),
+        ]
+        assert get_changed_files.call_args.args[1:] == (project_path, 'main')
+
+    def test_no_changes(self, hatch, helpers, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        mocker.patch('hatch.cli.fmt.core.get_changed_files', return_value=[])
+
+        with project_path.as_cwd():
+            result = hatch('fmt', '--changed')
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            """
+            No changed files to process
+            """
+        )
+        env_run.assert_not_called()
+
+    def test_both_flags(self, hatch, helpers, temp_dir):
+        with temp_dir.as_cwd():
+            result = hatch('fmt', '--changed', '--since', 'HEAD')
+
+        assert result.exit_code == 1, result.output
+        assert result.output == helpers.dedent(
+            """
+            Cannot specify both --changed and --since
+            """
+        )
+
+
+def test_get_changed_files(temp_dir, platform):
+    from hatch.cli.fmt.core import get_changed_files
+
+    project_path = temp_dir / 'project'
+    package_path = project_path / 'pkg'
+    package_path.ensure_dir_exists()
+    for name in ('a.py', 'b.py', 'c.py', 'd.py'):
+        (package_path / name).touch()
+    (temp_dir / 'outside.py').touch()
+    (project_path / '.gitignore').write_text('ignored.py\n')
+
+    git(temp_dir, 'init', '-q')
+    git(temp_dir, 'add', '.')
+    git(temp_dir, 'commit', '-q', '-m', 'first')
+
+    (package_path / 'a.py').write_text('x = 1\n')
+    git(temp_dir, 'commit', '-q', '-am', 'second')
+
+    (package_path / 'b.py').write_text('x = 1\n')
+    (package_path / 'c.py').unlink()
+    (package_path / 'new.pyi').touch()
+    (package_path / 'notes.txt').touch()
+    (package_path / 'ignored.py').touch()
+    (temp_dir / 'outside.py').write_text('x = 1\n')
+
+    assert get_changed_files(platform, project_path, 'HEAD') == ['pkg/b.py', 'pkg/new.pyi']
+    assert get_changed_files(platform, project_path, 'HEAD~1') == ['pkg/a.py', 'pkg/b.py', 'pkg/new.pyi']
+
+
+def test_get_changed_files_merge_base(temp_dir, platform):
+    from hatch.cli.fmt.core import get_changed_files
+
+    (temp_dir / 'a.py').touch()
+    git(temp_dir, 'init', '-q')
+    git(temp_dir, 'add', '.')
+    git(temp_dir, 'commit', '-q', '-m', 'first')
+    git(temp_dir, 'branch', 'base')
+
+    git(temp_dir, 'checkout', '-q', '-b', 'feature')
+    (temp_dir / 'b.py').touch()
+    git(temp_dir, 'add', '.')
+    git(temp_dir, 'commit', '-q', '-m', 'feature')
+
+    # Changes made to the reference after the branch diverged are not changes of the branch
+    git(temp_dir, 'checkout', '-q', 'base')
+    (temp_dir / 'c.py').touch()
+    git(temp_dir, 'add', '.')
+    git(temp_dir, 'commit', '-q', '-m', 'base')
+    git(temp_dir, 'checkout', '-q', 'feature')
+
+    (temp_dir / 'a.py').write_text('x = 1\n')
+
+    assert get_changed_files(platform, temp_dir, 'base') == ['a.py', 'b.py']
+
+
+def test_config_not_rewritten(hatch, temp_dir, config_file, env_run):
+    config_file.model.template.plugins['default']['tests'] = False
+    config_file.save()
+
+    with temp_dir.as_cwd():
+        result = hatch('new', 'My.App')
+
+    assert result.exit_code == 0, result.output
+
+    project_path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+
+    config_dir = data_path / 'env' / '.internal' / 'hatch-static-analysis' / '.config' / project_path.id
+    config_files = [config_dir / 'ruff_defaults.toml', config_dir / 'pyproject.toml']
+
+    with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch('fmt')
+        assert result.exit_code == 0, result.output
+
+        for path in config_files:
+            os.utime(path, ns=(0, 0))
+
+        result = hatch('fmt')
+        assert result.exit_code == 0, result.output
+
+    assert env_run.call_count == 4
+    assert [path.stat().st_mtime_ns for path in config_files] == [0, 0]
+
+
 class TestConfigPath:
     @pytest.mark.usefixtures('env_run')
     def test_sync_without_config(self, hatch, helpers, temp_dir, config_file):
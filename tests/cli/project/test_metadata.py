@@ -4,6 +4,7 @@ import pytest
 
 from hatch.config.constants import ConfigEnvVars
 from hatch.project.core import Project
+from hatch.utils.fs import Path
 from hatchling.utils.constants import DEFAULT_CONFIG_FILE
 
 pytestmark = [pytest.mark.usefixtures('mock_backend_process_output')]
@@ -207,6 +208,64 @@ def test_field_string(hatch, temp_dir, helpers):
     )
 
 
+def test_cached(hatch, temp_dir, helpers):
+    project_name = 'My.App'
+
+    with temp_dir.as_cwd():
+        result = hatch('new', project_name)
+        assert result.exit_code == 0, result.output
+
+    path = temp_dir / 'my-app'
+    data_path = temp_dir / 'data'
+    data_path.mkdir()
+
+    # Caching requires the local version of Hatchling
+    backend_path = Path(__file__).resolve().parent.parent.parent.parent / 'backend'
+    project = Project(path)
+    config = dict(project.raw_config)
+    config['build-system']['requires'] = [f'hatchling @ {backend_path.as_uri()}']
+    project.save_config(config)
+
+    with path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch('project', 'metadata', 'version')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Creating environment: hatch-build
+        Checking dependencies
+        Syncing dependencies
+        Inspecting build dependencies
+        0.0.1
+        """
+    )
+
+    with path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch('project', 'metadata', 'version')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        0.0.1
+        """
+    )
+
+    # Modifying a file read by the version source invalidates the cache
+    about_file = path / 'src' / 'my_app' / '__about__.py'
+    about_file.write_text(about_file.read_text().replace('0.0.1', '1.0.0'))
+
+    with path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+        result = hatch('project', 'metadata', 'version')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        """
+        Inspecting build dependencies
+        1.0.0
+        """
+    )
+
+
 def test_field_complex(hatch, temp_dir, helpers):
     project_name = 'My.App'
 
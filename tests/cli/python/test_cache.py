@@ -0,0 +1,63 @@
+from hashlib import sha256
+
+import pytest
+
+from hatch.config.constants import PythonEnvVars
+from hatch.python.cache import ArchiveCache
+from hatch.utils.structures import EnvVars
+
+
+def add_archive(temp_dir_cache, name, contents):
+    cache = ArchiveCache(temp_dir_cache / 'cache' / 'python-archives')
+    staged = temp_dir_cache / name
+    staged.write_bytes(contents)
+    cache.add(f'https://example.com/{name}', staged, sha256(contents).hexdigest())
+    return cache
+
+
+@pytest.mark.usefixtures('temp_dir_cache')
+def test_show_empty(hatch):
+    result = hatch('python', 'cache', 'show')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == 'The cache is empty\n'
+
+
+def test_show(hatch, temp_dir_cache):
+    add_archive(temp_dir_cache, 'foo.tar.gz', b'foo')
+
+    result = hatch('python', 'cache', 'show', '--ascii')
+
+    assert result.exit_code == 0, result.output
+    assert 'foo.tar.gz' in result.output
+    assert '3 B' in result.output
+    assert result.output.endswith('Total: 3 B / 1.0 GiB\n')
+
+
+def test_prune_max_size(hatch, temp_dir_cache):
+    cache = add_archive(temp_dir_cache, 'foo.tar.gz', b'foo')
+
+    result = hatch('python', 'cache', 'prune', '--max-size', '3')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == 'Removed 0 archives (0 B)\n'
+    assert len(cache.entries()) == 1
+
+
+def test_prune_all(hatch, temp_dir_cache):
+    cache = add_archive(temp_dir_cache, 'foo.tar.gz', b'foo')
+
+    result = hatch('python', 'cache', 'prune', '--all')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == 'Removed 1 archive (3 B)\n'
+    assert cache.entries() == []
+
+
+@pytest.mark.usefixtures('temp_dir_cache')
+def test_invalid_max_size(hatch):
+    with EnvVars({PythonEnvVars.CACHE_MAX_SIZE: 'foo'}):
+        result = hatch('python', 'cache', 'show')
+
+    assert result.exit_code == 1, result.output
+    assert result.output == 'Environment variable `HATCH_PYTHON_CACHE_MAX_SIZE` must be a number of bytes\n'
@@ -1,3 +1,12 @@
+import json
+import platform
+import sys
+
+import pytest
+
+from hatch.utils.structures import EnvVars
+
+
 def test_not_installed(hatch, helpers):
     name = '3.10'
     result = hatch('python', 'find', name)
@@ -36,3 +45,34 @@ def test_parent(hatch, helpers, temp_dir_data, dist_name):
         {dist.python_path.parent}
         """
     )
+
+
+@pytest.mark.requires_unix
+def test_refresh(hatch, helpers, temp_dir_data):
+    bin_dir = temp_dir_data / 'bin'
+    bin_dir.ensure_dir_exists()
+    interpreter = bin_dir / 'python3'
+    interpreter.symlink_to(sys.executable)
+
+    with EnvVars({'PATH': str(bin_dir)}):
+        result = hatch('python', 'find', '--refresh')
+
+    assert result.exit_code == 0, result.output
+    assert result.output == helpers.dedent(
+        f"""
+        Discovering Python interpreters
+        {interpreter} ({platform.python_implementation()} {'.'.join(map(str, sys.version_info[:3]))})
+        """
+    )
+    assert str(interpreter) in json.loads((temp_dir_data / 'data' / 'interpreters.json').read_text())
+
+
+def test_missing_name(hatch, helpers):
+    result = hatch('python', 'find')
+
+    assert result.exit_code == 1, result.output
+    assert result.output == helpers.dedent(
+        """
+        Missing argument `NAME`
+        """
+    )
@@ -3,6 +3,7 @@ import secrets
 
 import pytest
 
+from hatch.cli.terminal import BorrowedStatus
 from hatch.errors import PythonDistributionResolutionError
 from hatch.python.core import InstalledDistribution
 from hatch.python.distributions import ORDERED_DISTRIBUTIONS
@@ -258,33 +259,85 @@ def test_specific_location(hatch, helpers, temp_dir_data, path_append, dist_name
 
 
 def test_all(hatch, temp_dir_data, path_append, default_shells, mocker, compatible_python_distributions):
-    mocked_dists = []
+    mocked_dists = {}
     for name in compatible_python_distributions:
         dist_dir = temp_dir_data / 'data' / 'pythons' / name
         python_path = dist_dir / get_distribution(name).python_path
-        mocked_dists.append(mocker.MagicMock(path=dist_dir, python_path=python_path))
+        mocked_dists[name] = mocker.MagicMock(path=dist_dir, python_path=python_path)
 
-    install = mocker.patch('hatch.python.core.PythonManager.install', side_effect=mocked_dists)
+    install = mocker.patch('hatch.python.core.PythonManager.install', side_effect=mocked_dists.get)
 
     result = hatch('python', 'install', 'all')
 
     assert result.exit_code == 0, result.output
 
-    expected_lines = []
-    for dist in mocked_dists:
-        expected_lines.extend((f'Installing {dist.path.name}', f'Installed {dist.path.name} @ {dist.path}'))
+    # Distributions are installed concurrently so they may finish in any order
+    lines = result.output.splitlines()
+    assert lines[0] == f'Installing {len(mocked_dists)} distributions'
+    assert sorted(lines[1 : len(mocked_dists) + 1]) == sorted(
+        f'Installed {dist.path.name} @ {dist.path}' for dist in mocked_dists.values()
+    )
 
-    expected_lines.extend((
+    expected_lines = [
         '',
         'The following directories have been added to your PATH (pending a shell restart):',
         '',
-    ))
-    expected_lines.extend(str(dist.python_path.parent) for dist in mocked_dists)
-    expected_lines.append('')
-
-    assert result.output == '\n'.join(expected_lines)
+    ]
+    expected_lines.extend(str(dist.python_path.parent) for dist in mocked_dists.values())
+    assert lines[len(mocked_dists) + 1 :] == expected_lines
 
-    assert install.call_args_list == [mocker.call(name) for name in compatible_python_distributions]
+    assert sorted(install.call_args_list) == sorted(mocker.call(name) for name in compatible_python_distributions)
     assert path_append.call_args_list == [
-        mocker.call(str(dist.python_path.parent), shells=default_shells) for dist in mocked_dists
+        mocker.call(str(dist.python_path.parent), shells=default_shells) for dist in mocked_dists.values()
+    ]
+
+
+def test_partial_failure(hatch, helpers, temp_dir_data, path_append, default_shells, mocker):
+    dist_dir = temp_dir_data / 'data' / 'pythons' / '3.12'
+    python_path = dist_dir / get_distribution('3.12').python_path
+
+    def install(name):
+        if name == '3.11':
+            message = 'connection reset'
+            raise OSError(message)
+
+        return mocker.MagicMock(path=dist_dir, python_path=python_path)
+
+    mocker.patch('hatch.python.core.PythonManager.install', side_effect=install)
+
+    result = hatch('python', 'install', '-j', '1', '3.11', '3.12')
+
+    assert result.exit_code == 1, result.output
+    assert result.output == helpers.dedent(
+        f"""
+        Installing 2 distributions
+        Failed to install 3.11: connection reset
+        Installed 3.12 @ {dist_dir}
+
+        The following directory has been added to your PATH (pending a shell restart):
+
+        {python_path.parent}
+        Failed distributions: 3.11
+        """
+    )
+
+    path_append.assert_called_once_with(str(python_path.parent), shells=default_shells)
+
+
+@pytest.mark.usefixtures('path_append')
+def test_progress(hatch, temp_dir_data, mocker):
+    dist_dir = temp_dir_data / 'data' / 'pythons' / '3.12'
+    python_path = dist_dir / get_distribution('3.12').python_path
+    mocker.patch(
+        'hatch.python.core.PythonManager.install',
+        return_value=mocker.MagicMock(path=dist_dir, python_path=python_path),
+    )
+    update = mocker.spy(BorrowedStatus, 'update')
+
+    result = hatch('python', 'install', '3.11', '3.12')
+
+    assert result.exit_code == 0, result.output
+    assert [call.args[1] for call in update.call_args_list] == [
+        'Installing 2 distributions (1/2 done)',
+        'Installing 2 distributions (2/2 done)',
     ]
@@ -63,7 +63,7 @@ def test_specific_location(hatch, helpers, temp_dir_data, path_append, dist_name
 def test_all(hatch, helpers, temp_dir_data, path_append, mocker):
     installed_distributions = ('3.9', '3.10', '3.11')
 
-    mocked_dists = []
+    mocked_dists = {}
     for name in installed_distributions:
         install_dir = temp_dir_data / 'data' / 'pythons'
         helpers.write_distribution(install_dir, name)
@@ -71,20 +71,18 @@ def test_all(hatch, helpers, temp_dir_data, path_append, mocker):
         dist_dir = install_dir / name
         metadata = helpers.downgrade_distribution_metadata(dist_dir)
         python_path = dist_dir / metadata['python_path']
-        mocked_dists.append(mocker.MagicMock(path=dist_dir, python_path=python_path))
+        mocked_dists[name] = mocker.MagicMock(path=dist_dir, python_path=python_path)
 
-    install = mocker.patch('hatch.python.core.PythonManager.install', side_effect=mocked_dists)
+    install = mocker.patch('hatch.python.core.PythonManager.install', side_effect=mocked_dists.get)
 
     result = hatch('python', 'update', 'all')
 
     assert result.exit_code == 0, result.output
 
-    expected_lines = []
-    for dist in mocked_dists:
-        expected_lines.extend((f'Updating {dist.path.name}', f'Updated {dist.path.name} @ {dist.path}'))
-    expected_lines.append('')
+    # Distributions are updated concurrently so they may finish in any order
+    lines = result.output.splitlines()
+    assert lines[0] == f'Updating {len(mocked_dists)} distributions'
+    assert sorted(lines[1:]) == sorted(f'Updated {dist.path.name} @ {dist.path}' for dist in mocked_dists.values())
 
-    assert result.output == '\n'.join(expected_lines)
-
-    assert install.call_args_list == [mocker.call(name) for name in installed_distributions]
+    assert sorted(install.call_args_list) == sorted(mocker.call(name) for name in installed_distributions)
     path_append.assert_not_called()
@@ -0,0 +1,237 @@
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Unix sockets are required')
+
+
+class Client:
+    def __init__(self, path):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.socket.connect(str(path))
+        except OSError:
+            self.socket.close()
+            raise
+
+        self.reader = self.socket.makefile('rb')
+        self.request_id = 0
+
+    def send(self, message):
+        self.socket.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+    def request(self, method, **params):
+        self.request_id += 1
+        self.send({'jsonrpc': '2.0', 'id': self.request_id, 'method': method, 'params': params})
+        return json.loads(self.reader.readline())
+
+    def close(self):
+        self.reader.close()
+        self.socket.close()
+
+
+@pytest.fixture
+def project(temp_dir):
+    project_file = temp_dir / 'pyproject.toml'
+    project_file.write_text(
+        """\
+[project]
+name = "foo"
+version = "1.2.3"
+dependencies = ["Foo_Bar>=1"]
+"""
+    )
+    return temp_dir
+
+
+@pytest.fixture
+def server_client(hatch, project, tmp_path_factory):
+    socket_path = tmp_path_factory.mktemp('server') / 'hatch.sock'
+    results = []
+
+    def run_server():
+        with project.as_cwd():
+            results.append(hatch('server', '--socket', str(socket_path), '--idle-timeout', '30'))
+
+    thread = threading.Thread(target=run_server)
+    thread.start()
+
+    start = time.monotonic()
+    while True:
+        try:
+            client = Client(socket_path)
+        except OSError:
+            if time.monotonic() - start > 30 or not thread.is_alive():  # no cov
+                thread.join()
+                pytest.fail(f'Server did not start: {results}')
+
+            time.sleep(0.05)
+        else:
+            break
+
+    try:
+        yield client
+    finally:
+        client.request('server.shutdown')
+        client.close()
+        thread.join()
+
+    assert results[0].exit_code == 0, results[0].output
+    assert not socket_path.exists()
+
+
+def test_no_project(hatch, temp_dir):
+    with temp_dir.as_cwd():
+        result = hatch('server')
+
+    assert result.exit_code == 1, result.output
+    assert result.output == 'No project detected\n'
+
+
+def test_idle_timeout(hatch, project, tmp_path_factory):
+    socket_path = tmp_path_factory.mktemp('server') / 'hatch.sock'
+    results = []
+
+    def run_server():
+        with project.as_cwd():
+            results.append(hatch('server', '--socket', str(socket_path), '--idle-timeout', '0.5'))
+
+    thread = threading.Thread(target=run_server)
+    thread.start()
+    thread.join(30)
+
+    assert not thread.is_alive()
+    assert results[0].exit_code == 0, results[0].output
+    assert not socket_path.exists()
+
+
+def test_idle_timeout_open_connection(hatch, project, tmp_path_factory):
+    socket_path = tmp_path_factory.mktemp('server') / 'hatch.sock'
+    results = []
+
+    def run_server():
+        with project.as_cwd():
+            results.append(hatch('server', '--socket', str(socket_path), '--idle-timeout', '0.5'))
+
+    thread = threading.Thread(target=run_server)
+    thread.start()
+
+    start = time.monotonic()
+    while True:
+        try:
+            client = Client(socket_path)
+        except OSError:
+            if time.monotonic() - start > 30 or not thread.is_alive():  # no cov
+                thread.join()
+                pytest.fail(f'Server did not start: {results}')
+
+            time.sleep(0.05)
+        else:
+            break
+
+    try:
+        time.sleep(1.5)
+        assert client.request('server.ping')['result']['pid']
+    finally:
+        client.close()
+
+    thread.join(30)
+
+    assert not thread.is_alive()
+    assert results[0].exit_code == 0, results[0].output
+
+
+def test_ping(server_client):
+    response = server_client.request('server.ping')
+
+    assert response == {'jsonrpc': '2.0', 'id': 1, 'result': {'pid': response['result']['pid']}}
+
+
+def test_version(server_client):
+    response = server_client.request('version')
+
+    assert response['result'] == {'exit_code': 0, 'stdout': '1.2.3\n', 'stderr': ''}
+
+
+def test_invalidation(server_client, project):
+    assert server_client.request('version')['result']['stdout'] == '1.2.3\n'
+
+    project_file = project / 'pyproject.toml'
+    project_file.write_text(project_file.read_text().replace('1.2.3', '9000'))
+
+    assert server_client.request('version')['result']['stdout'] == '9000\n'
+
+
+def test_dependencies(server_client):
+    response = server_client.request('dep.show.requirements', args=['--project-only'])
+
+    assert response['result'] == {'exit_code': 0, 'stdout': 'foo-bar>=1\n', 'stderr': ''}
+
+
+def test_error_exit_code(server_client):
+    response = server_client.request('env.find', args=['missing'])
+
+    assert response['result'] == {
+        'exit_code': 1,
+        'stdout': '',
+        'stderr': 'Environment `missing` is not defined by project config\n',
+    }
+
+
+def test_subprocess_output(server_client):
+    response = server_client.request('run', args=['python', '-c', "print('bar')"], env='system')
+
+    assert response['result']['exit_code'] == 0, response
+    assert response['result']['stdout'].endswith('bar\n')
+
+
+def test_unknown_method(server_client):
+    response = server_client.request('build')
+
+    assert response == {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32601, 'message': 'Unknown method: build'}}
+
+
+def test_invalid_params(server_client):
+    response = server_client.request('version', args='1.0')
+
+    assert response['error'] == {'code': -32602, 'message': 'Parameter `args` must be an array of strings'}
+
+
+def test_parse_error(server_client):
+    server_client.socket.sendall(b'{\n')
+    response = json.loads(server_client.reader.readline())
+
+    assert response['id'] is None
+    assert response['error']['code'] == -32700
+
+
+def test_notification(server_client):
+    server_client.send({'jsonrpc': '2.0', 'method': 'server.ping'})
+
+    assert server_client.request('server.ping')['id'] == 1
+
+
+def test_concurrent_connections(server_client, temp_dir):
+    release_path = temp_dir / 'release'
+    script = f'import os, time\nwhile not os.path.exists({str(release_path)!r}):\n    time.sleep(0.05)'
+    responses = []
+    thread = threading.Thread(
+        target=lambda: responses.append(server_client.request('run', args=['python', '-c', script], env='system'))
+    )
+    thread.start()
+
+    other_client = Client(server_client.socket.getpeername())
+    other_client.socket.settimeout(10)
+    try:
+        # Answered while the command of the other connection is still running
+        assert other_client.request('server.ping')['result']['pid']
+        assert thread.is_alive()
+    finally:
+        release_path.touch()
+        other_client.close()
+        thread.join()
+
+    assert responses[0]['result']['exit_code'] == 0, responses
@@ -0,0 +1,220 @@
+import json
+
+import pytest
+
+from hatch.cli.test.pytest_plugin import load_impact_map, parse_shard, partition, select_affected
+
+pytest_plugins = ['pytester']
+
+TESTS = """
+import pytest
+
+@pytest.mark.parametrize('i', range(10))
+def test_foo(i):
+    pass
+"""
+
+
+class TestPartition:
+    def test_even_without_durations(self):
+        node_ids = [f'test_{i}' for i in range(10)]
+
+        assignments = partition(node_ids, 3, {})
+
+        assert sorted(assignments.count(shard) for shard in range(3)) == [3, 3, 4]
+
+    def test_order_independent(self):
+        node_ids = [f'test_{i}' for i in range(10)]
+        durations = {'test_1': 5.0, 'test_7': 2.5}
+
+        assignments = dict(zip(node_ids, partition(node_ids, 3, durations)))
+        reversed_assignments = dict(zip(node_ids[::-1], partition(node_ids[::-1], 3, durations)))
+
+        assert assignments == reversed_assignments
+
+    def test_balanced_by_durations(self):
+        durations = {'a': 10.0, 'b': 6.0, 'c': 5.0, 'd': 4.0, 'e': 1.0}
+
+        assignments = partition(list(durations), 2, durations)
+
+        loads = [
+            sum(durations[node_id] for node_id, shard in zip(durations, assignments) if shard == s) for s in (0, 1)
+        ]
+        assert loads == [14.0, 12.0]
+
+    def test_unknown_durations_average(self):
+        assignments = partition(['a', 'b', 'c', 'd'], 2, {'a': 3.0, 'b': 1.0})
+
+        assert assignments == [0, 0, 1, 1]
+
+
+@pytest.mark.parametrize('shard', ['0/2', '3/2', '1', 'a/2'])
+def test_parse_shard_invalid(shard):
+    with pytest.raises(pytest.UsageError, match='Invalid shard'):
+        parse_shard(shard)
+
+
+def test_shards_cover_all_tests(pytester):
+    pytester.makepyfile(TESTS)
+
+    passed = 0
+    for shard in ('1/3', '2/3', '3/3'):
+        result = pytester.runpytest('-p', 'hatch.cli.test.pytest_plugin', '--hatch-shard', shard)
+        outcomes = result.parseoutcomes()
+        passed += outcomes['passed']
+        assert outcomes['passed'] + outcomes['deselected'] == 10
+
+    assert passed == 10
+
+
+def test_empty_shard(pytester):
+    pytester.makepyfile(TESTS)
+
+    result = pytester.runpytest('-p', 'hatch.cli.test.pytest_plugin', '--hatch-shard', '11/11')
+
+    result.assert_outcomes(deselected=10)
+    assert result.ret == pytest.ExitCode.OK
+
+
+def test_durations_recorded(pytester):
+    pytester.makepyfile(TESTS)
+    durations_file = pytester.path / 'data' / 'durations.json'
+    args = ['-p', 'hatch.cli.test.pytest_plugin', '--hatch-durations', str(durations_file)]
+
+    # Durations are only used once every shard has run so that all shards partition tests identically
+    selected = set()
+    for shard in ('1/2', '2/2'):
+        result = pytester.runpytest(*args, '--hatch-shard', shard, '-v')
+        result.assert_outcomes(passed=5, deselected=5)
+        selected.update(line.split()[0] for line in result.outlines if ' PASSED' in line)
+        assert not durations_file.exists()
+
+    assert len(selected) == 10
+
+    # Shards are now balanced by duration rather than count
+    result = pytester.runpytest(*args, '--hatch-shard', '1/2')
+    outcomes = result.parseoutcomes()
+    assert outcomes['passed'] + outcomes.get('deselected', 0) == 10
+
+    durations = json.loads(durations_file.read_text())
+    assert len(durations) == 10
+    assert all(isinstance(duration, float) for duration in durations.values())
+    assert [path.name for path in durations_file.parent.iterdir() if path != durations_file] == [
+        'durations.json.1-of-2'
+    ]
+
+
+def test_durations_shared(pytester):
+    pytester.makepyfile(TESTS)
+    durations_file = pytester.path / 'durations.json'
+    durations_file.write_text(json.dumps({'test_removed.py::test_removed': 1.0}))
+    args = ['-p', 'hatch.cli.test.pytest_plugin', '--hatch-durations', str(durations_file), '--hatch-durations-shared']
+
+    result = pytester.runpytest(*args, '--hatch-shard', '1/2')
+    result.assert_outcomes(passed=5, deselected=5)
+
+    # Durations are merged into the file immediately rather than once every shard has run
+    durations = json.loads(durations_file.read_text())
+    assert len(durations) == 6
+    assert durations['test_removed.py::test_removed'] == 1.0
+    assert [path.name for path in pytester.path.iterdir() if path.name.startswith('durations')] == ['durations.json']
+
+
+IMPACT_MAP = {
+    'tests': ['test_a.py::test_a', 'test_b.py::test_b', 'test_c.py::test_c'],
+    'files': {'pkg/a.py': [0, 2], 'pkg/b.py': [1]},
+    'global': ['pkg/constants.py'],
+}
+
+
+class TestSelectAffected:
+    def test_covered_files(self):
+        node_ids = ['test_a.py::test_a', 'test_b.py::test_b', 'test_c.py::test_c']
+
+        assert select_affected(node_ids, IMPACT_MAP, ['pkg/a.py']) == [True, False, True]
+        assert select_affected(node_ids, IMPACT_MAP, ['pkg/b.py']) == [False, True, False]
+        assert select_affected(node_ids, IMPACT_MAP, ['README.md']) == [False, False, False]
+
+    def test_test_file_changed(self):
+        node_ids = ['test_a.py::test_a', 'test_b.py::test_b[1]']
+
+        assert select_affected(node_ids, IMPACT_MAP, ['test_b.py']) == [False, True]
+
+    def test_unknown_tests(self):
+        node_ids = ['test_a.py::test_a', 'test_a.py::test_new']
+
+        assert select_affected(node_ids, IMPACT_MAP, ['pkg/b.py']) == [False, True]
+
+    def test_global_files(self):
+        node_ids = ['test_a.py::test_a', 'test_b.py::test_b']
+
+        assert select_affected(node_ids, IMPACT_MAP, ['pkg/constants.py']) == [True, True]
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        [],
+        {'tests': [], 'files': {}},
+        {'tests': ['test_a.py::test_a'], 'files': {'pkg/a.py': [1]}, 'global': []},
+        {'tests': ['test_a.py::test_a'], 'files': {'pkg/a.py': ['0']}, 'global': []},
+    ],
+)
+def test_load_impact_map_invalid(tmp_path, data):
+    path = tmp_path / 'impact.json'
+    path.write_text(json.dumps(data))
+
+    assert load_impact_map(str(path)) is None
+
+
+def run_affected(pytester, changed_files, *args):
+    impact_map_file = pytester.path / 'impact.json'
+    impact_map_file.write_text(
+        json.dumps({
+            'tests': [f'test_affected.py::test_foo[{i}]' for i in range(10)],
+            'files': {'pkg/a.py': [0, 1], 'pkg/b.py': [2]},
+            'global': [],
+        })
+    )
+    changed_files_file = pytester.path / 'changed.json'
+    changed_files_file.write_text(json.dumps(changed_files))
+
+    return pytester.runpytest(
+        '-p',
+        'hatch.cli.test.pytest_plugin',
+        '--hatch-impact-map',
+        str(impact_map_file),
+        '--hatch-changed-files',
+        str(changed_files_file),
+        *args,
+    )
+
+
+def test_affected_tests_run(pytester):
+    pytester.makepyfile(test_affected=TESTS)
+
+    result = run_affected(pytester, ['pkg/a.py', 'pkg/b.py'])
+
+    result.assert_outcomes(passed=3, deselected=7)
+
+
+def test_no_tests_affected(pytester):
+    pytester.makepyfile(test_affected=TESTS)
+
+    result = run_affected(pytester, ['README.md'])
+
+    result.assert_outcomes(deselected=10)
+    assert result.ret == pytest.ExitCode.OK
+
+
+def test_affected_shards(pytester):
+    pytester.makepyfile(test_affected=TESTS)
+
+    passed = 0
+    for shard in ('1/2', '2/2'):
+        result = run_affected(pytester, ['pkg/a.py'], '--hatch-shard', shard)
+        outcomes = result.parseoutcomes()
+        passed += outcomes['passed']
+        assert outcomes['passed'] + outcomes['deselected'] == 10
+
+    assert passed == 2
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import json
+import os
+import shlex
+import sqlite3
+import subprocess
 import sys
+from contextlib import closing
 
 import pytest
 
-from hatch.config.constants import ConfigEnvVars
+from hatch.cli.test import pytest_plugin
+from hatch.cli.test.core import CoverageCombiner, ImpactMap, PatchedCoverageConfig, read_coverage_contexts
+from hatch.config.constants import AppEnvVars, ConfigEnvVars
+from hatch.env.plugin.interface import EnvironmentInterface
 from hatch.env.utils import get_env_var
 from hatch.project.core import Project
+from hatch.utils.fs import Path
 from hatch.utils.structures import EnvVars
 
 
@@ -731,6 +741,538 @@ class TestRetryDelay:
         assert not (data_path / '.config' / 'coverage').exists()
 
 
+class TestShard:
+    def test_flag(self, hatch, temp_dir, config_file, env_run, mocker, platform):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        project_name = 'My.App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', '--shard', '2/3')
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        durations_path = platform.join_command_args([str(data_path / 'tests' / project_path.id / 'durations.json')])
+        assert env_run.call_args_list == [
+            mocker.call(
+                f'pytest -p no:randomly -p hatch_test_plugin --hatch-shard 2/3 --hatch-durations {durations_path} tests',
+                shell=True,
+            ),
+        ]
+
+        plugin_path = data_path / '.config' / 'pytest' / 'hatch_test_plugin.py'
+        assert plugin_path.read_text() == Path(pytest_plugin.__file__).read_text()
+
+    @pytest.mark.parametrize('from_env_var', [False, True])
+    def test_durations_file(self, hatch, temp_dir, config_file, env_run, mocker, platform, from_env_var):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        project_name = 'My.App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        env_vars = {ConfigEnvVars.DATA: str(data_path)}
+        args = ['test', '--shard', '2/3']
+        if from_env_var:
+            env_vars[AppEnvVars.TEST_DURATIONS_FILE] = 'durations.json'
+        else:
+            args.extend(('--durations-file', 'durations.json'))
+
+        with project_path.as_cwd(env_vars=env_vars):
+            result = hatch(*args)
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        durations_path = platform.join_command_args([str(project_path / 'durations.json')])
+        assert env_run.call_args_list == [
+            mocker.call(
+                'pytest -p no:randomly -p hatch_test_plugin --hatch-shard 2/3 '
+                f'--hatch-durations {durations_path} --hatch-durations-shared tests',
+                shell=True,
+            ),
+        ]
+
+    def test_configured_module_search_path(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        project_name = 'My.App'
+
+        with temp_dir.as_cwd():
+            result = hatch('new', project_name)
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        project = Project(project_path)
+        config = dict(project.raw_config)
+        config['tool']['hatch']['envs'] = {'hatch-test': {'env-vars': {'PYTHONPATH': 'foo'}}}
+        project.save_config(config)
+
+        # Apply the variables of the environment, like the default implementation
+        mocker.patch('hatch.env.virtual.VirtualEnvironment.command_context', EnvironmentInterface.command_context)
+        search_paths = []
+        env_run.side_effect = lambda *_, **__: search_paths.append(os.environ.get('PYTHONPATH')) or env_run.return_value
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', '--shard', '1/2')
+
+        assert result.exit_code == 0, result.output
+        assert search_paths == [os.pathsep.join([str(data_path / '.config' / 'pytest'), 'foo'])]
+
+    @pytest.mark.usefixtures('env_run')
+    @pytest.mark.parametrize('shard', ['0/3', '4/3', '1', 'a/b'])
+    def test_invalid(self, hatch, temp_dir, config_file, shard):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        with (temp_dir / 'my-app').as_cwd():
+            result = hatch('test', '--shard', shard)
+
+        assert result.exit_code == 1, result.output
+        assert result.output == (f'Invalid shard `{shard}`, must be of the form INDEX/TOTAL with 1 <= INDEX <= TOTAL\n')
+
+
+def create_coverage_data(path, measurements):
+    # https://coverage.readthedocs.io/en/7.4.4/dbschema.html
+    with closing(sqlite3.connect(str(path))) as connection, connection:
+        connection.executescript(
+            """
+            CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT, UNIQUE (path));
+            CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT, UNIQUE (context));
+            CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);
+            CREATE TABLE arc (file_id INTEGER, context_id INTEGER, fromno INTEGER, tono INTEGER);
+            """
+        )
+        for context, paths in measurements.items():
+            context_id = connection.execute('INSERT INTO context (context) VALUES (?)', (context,)).lastrowid
+            for i, file_path in enumerate(paths):
+                connection.execute('INSERT OR IGNORE INTO file (path) VALUES (?)', (file_path,))
+                (file_id,) = connection.execute('SELECT id FROM file WHERE path = ?', (file_path,)).fetchone()
+                # Branch coverage is recorded as arcs rather than lines
+                if i % 2:
+                    connection.execute('INSERT INTO arc VALUES (?, ?, 1, 2)', (file_id, context_id))
+                else:
+                    connection.execute('INSERT INTO line_bits VALUES (?, ?, ?)', (file_id, context_id, b'\x01'))
+
+
+class TestImpactMap:
+    def test_read_coverage_contexts(self, temp_dir):
+        data_file = temp_dir / '.coverage'
+        create_coverage_data(
+            data_file,
+            {
+                '': [str(temp_dir / 'src' / 'pkg' / '__init__.py'), str(temp_dir.parent / 'site-packages' / 'dep.py')],
+                'tests/test_a.py::test_a': ['src/pkg/a.py', str(temp_dir / 'src' / 'pkg' / 'b.py')],
+            },
+        )
+
+        assert read_coverage_contexts(data_file, temp_dir) == {
+            '': {'src/pkg/__init__.py'},
+            'tests/test_a.py::test_a': {'src/pkg/a.py', 'src/pkg/b.py'},
+        }
+
+    def test_update(self, temp_dir):
+        project_path = temp_dir / 'project'
+        (project_path / 'tests').ensure_dir_exists()
+        for name in ('test_a.py', 'test_b.py'):
+            (project_path / 'tests' / name).touch()
+
+        impact_map = ImpactMap(project_path, temp_dir / 'data')
+        data_file = project_path / '.coverage'
+        create_coverage_data(
+            data_file,
+            {
+                '': ['src/pkg/__init__.py', 'src/pkg/constants.py'],
+                'tests/test_a.py::test_a': ['src/pkg/__init__.py', 'src/pkg/a.py'],
+                'tests/test_b.py::test_b': ['src/pkg/b.py'],
+                'tests/test_c.py::test_c': ['src/pkg/c.py'],
+            },
+        )
+
+        assert impact_map.update(data_file)
+
+        # Tests of removed files are pruned and files covered by tests are not global
+        assert json.loads(impact_map.path.read_text()) == {
+            'tests': ['tests/test_a.py::test_a', 'tests/test_b.py::test_b'],
+            'files': {'src/pkg/__init__.py': [0], 'src/pkg/a.py': [0], 'src/pkg/b.py': [1]},
+            'global': ['src/pkg/constants.py'],
+        }
+
+        # Only the tests that ran are replaced
+        data_file.unlink()
+        create_coverage_data(data_file, {'tests/test_b.py::test_b': ['src/pkg/a.py']})
+
+        assert impact_map.update(data_file)
+        assert json.loads(impact_map.path.read_text()) == {
+            'tests': ['tests/test_a.py::test_a', 'tests/test_b.py::test_b'],
+            'files': {'src/pkg/__init__.py': [0], 'src/pkg/a.py': [0, 1]},
+            'global': ['src/pkg/constants.py'],
+        }
+
+    def test_update_missing_data(self, temp_dir):
+        impact_map = ImpactMap(temp_dir, temp_dir / 'data')
+
+        assert not impact_map.update(temp_dir / '.coverage')
+        assert not impact_map.exists()
+
+
+class TestAffected:
+    def test_not_recorded(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        get_changed_files = mocker.patch('hatch.utils.git.get_changed_files')
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', '--affected')
+
+        assert result.exit_code == 0, result.output
+        assert result.output == 'No test impact has been recorded, use --cover to record it\n'
+
+        get_changed_files.assert_not_called()
+        assert env_run.call_args_list == [
+            mocker.call('pytest -p no:randomly -p hatch_test_plugin tests', shell=True),
+        ]
+
+    @pytest.mark.parametrize(('options', 'ref'), [(['--affected'], 'HEAD'), (['--since', 'main'], 'main')])
+    def test_selection(self, hatch, temp_dir, config_file, env_run, mocker, platform, options, ref):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        impact_map = ImpactMap(project_path, data_path)
+        impact_map.save({'tests/test_a.py::test_a': {'src/my_app/a.py'}}, set())
+
+        get_changed_files = mocker.patch('hatch.utils.git.get_changed_files', return_value=['src/my_app/a.py'])
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', *options)
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        assert get_changed_files.call_args.args[1:] == (project_path, ref)
+        assert get_changed_files.call_args.kwargs == {'include_deleted': True}
+        assert json.loads(impact_map.changed_files_path.read_text()) == ['src/my_app/a.py']
+
+        arguments = platform.join_command_args([
+            '--hatch-impact-map',
+            str(impact_map.path),
+            '--hatch-changed-files',
+            str(impact_map.changed_files_path),
+        ])
+        assert env_run.call_args_list == [
+            mocker.call(f'pytest -p no:randomly -p hatch_test_plugin {arguments} tests', shell=True),
+        ]
+
+    def test_no_changes(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        ImpactMap(project_path, data_path).save({}, set())
+
+        mocker.patch('hatch.utils.git.get_changed_files', return_value=[])
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', '--affected')
+
+        assert result.exit_code == 0, result.output
+        assert result.output == 'No changed files, no tests are affected\n'
+
+        env_run.assert_not_called()
+
+    def test_record(self, hatch, temp_dir, config_file, env_run, mocker):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+        (project_path / 'tests').ensure_dir_exists()
+        (project_path / 'tests' / 'test_a.py').touch()
+
+        def run(command, **_kwargs):
+            if command == 'coverage combine':
+                create_coverage_data(project_path / '.coverage', {'tests/test_a.py::test_a': ['src/my_app/a.py']})
+
+            return env_run.return_value
+
+        env_run.side_effect = run
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', '--cover-quiet', '--affected')
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        assert env_run.call_args_list == [
+            mocker.call(
+                'coverage run -m pytest -p no:randomly -p hatch_test_plugin --hatch-contexts tests', shell=True
+            ),
+            mocker.call('coverage combine', shell=True),
+        ]
+
+        assert json.loads(ImpactMap(project_path, data_path).path.read_text()) == {
+            'tests': ['tests/test_a.py::test_a'],
+            'files': {'src/my_app/a.py': [0]},
+            'global': [],
+        }
+
+    def test_record_failed(self, hatch, temp_dir, config_file, env_run):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', '--cover-quiet', '--affected')
+
+        assert result.exit_code == 0, result.output
+        assert result.output == 'Unable to record test impact from the coverage data\n'
+        assert env_run.call_count == 2
+
+    @pytest.mark.usefixtures('env_run')
+    def test_affected_and_since(self, hatch, temp_dir, config_file):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        with (temp_dir / 'my-app').as_cwd():
+            result = hatch('test', '--affected', '--since', 'main')
+
+        assert result.exit_code == 1, result.output
+        assert result.output == 'Cannot specify both --affected and --since\n'
+
+
+def merge_data_files(command, env):
+    # Mimic `coverage combine` by concatenating the data files and removing them
+    data_files = [Path(path) for path in shlex.split(command)[2:]]
+    contents = b''.join(sorted(data_file.read_bytes() for data_file in data_files))
+    Path(env['COVERAGE_FILE']).write_bytes(contents)
+    for data_file in data_files:
+        data_file.unlink()
+
+
+class CombineEnvironment:
+    def __init__(self, returncode=0):
+        self.returncode = returncode
+        self.commands = []
+
+    @staticmethod
+    def join_command_args(args):
+        return shlex.join(args)
+
+    def run_shell_command(self, command, *, env, **_kwargs):
+        self.commands.append(command)
+        if not self.returncode:
+            merge_data_files(command, env)
+
+        return subprocess.CompletedProcess(command, self.returncode, stdout=b'error')
+
+
+class TestCoverageCombiner:
+    @staticmethod
+    def create_data_files(project_path, count):
+        data_files = []
+        for i in range(count):
+            data_file = project_path / f'.coverage.env{i:02}'
+            data_file.write_bytes(f'{i:02}'.encode())
+            data_files.append(data_file)
+
+        return data_files
+
+    def test_tree(self, temp_dir):
+        combiner = CoverageCombiner(PatchedCoverageConfig(temp_dir, temp_dir / 'data'), temp_dir / 'cache', jobs=2)
+        data_files = self.create_data_files(temp_dir, 10)
+        environment = CombineEnvironment()
+
+        assert combiner.find_data_files() == data_files
+        assert combiner.combine(environment, data_files) is None
+
+        # Two groups of five followed by the merge of both results
+        assert [len(shlex.split(command)) - 2 for command in environment.commands] == [5, 5, 2]
+        assert (temp_dir / '.coverage').read_bytes() == b''.join(sorted(f'{i:02}'.encode() for i in range(10)))
+        assert not combiner.find_data_files()
+        assert len(list((temp_dir / 'cache').iterdir())) == 3
+
+    def test_cached(self, temp_dir):
+        combiner = CoverageCombiner(PatchedCoverageConfig(temp_dir, temp_dir / 'data'), temp_dir / 'cache', jobs=2)
+        environment = CombineEnvironment()
+        assert combiner.combine(environment, self.create_data_files(temp_dir, 10)) is None
+        expected = (temp_dir / '.coverage').read_bytes()
+        (temp_dir / '.coverage').unlink()
+
+        # Only the group with different data is merged again
+        data_files = self.create_data_files(temp_dir, 10)
+        data_files[-1].write_bytes(b'10')
+        combiner = CoverageCombiner(PatchedCoverageConfig(temp_dir, temp_dir / 'data'), temp_dir / 'cache', jobs=2)
+        environment = CombineEnvironment()
+
+        assert combiner.combine(environment, data_files) is None
+        assert [len(shlex.split(command)) - 2 for command in environment.commands] == [5, 2]
+        assert (temp_dir / '.coverage').read_bytes() == expected.replace(b'09', b'') + b'10'
+        assert not combiner.find_data_files()
+
+        # Entries that were not used are pruned
+        assert len(list((temp_dir / 'cache').iterdir())) == 3
+
+    def test_config_changed(self, temp_dir):
+        combiner = CoverageCombiner(PatchedCoverageConfig(temp_dir, temp_dir / 'data'), temp_dir / 'cache')
+        assert combiner.combine(CombineEnvironment(), self.create_data_files(temp_dir, 2)) is None
+
+        (temp_dir / '.coveragerc').write_text('[paths]\nsource = src\n')
+        combiner = CoverageCombiner(PatchedCoverageConfig(temp_dir, temp_dir / 'data'), temp_dir / 'cache')
+        environment = CombineEnvironment()
+
+        assert combiner.combine(environment, self.create_data_files(temp_dir, 2)) is None
+        assert len(environment.commands) == 1
+
+    def test_failure(self, temp_dir):
+        combiner = CoverageCombiner(PatchedCoverageConfig(temp_dir, temp_dir / 'data'), temp_dir / 'cache')
+        data_files = self.create_data_files(temp_dir, 2)
+
+        process = combiner.combine(CombineEnvironment(returncode=2), data_files)
+
+        assert process.returncode == 2
+        assert not (temp_dir / '.coverage').exists()
+        assert combiner.find_data_files() == data_files
+
+
+class TestCombine:
+    def test_parallel(self, hatch, temp_dir, config_file, env_run):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+
+        def run(command, **kwargs):
+            if command.startswith('coverage run'):
+                for i in range(3):
+                    (project_path / f'.coverage.env{i}').write_bytes(str(i).encode())
+            elif command.startswith('coverage combine '):
+                merge_data_files(command, kwargs['env'])
+
+            return env_run.return_value
+
+        env_run.side_effect = run
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', '--cover-quiet')
+
+        assert result.exit_code == 0, result.output
+        assert not result.output
+
+        assert [call.args[0] for call in env_run.call_args_list] == [
+            'coverage run -m pytest -p no:randomly tests',
+            shlex.join([
+                'coverage',
+                'combine',
+                str(project_path / '.coverage.env0'),
+                str(project_path / '.coverage.env1'),
+                str(project_path / '.coverage.env2'),
+            ]),
+        ]
+        assert (project_path / '.coverage').read_bytes() == b'012'
+        assert sorted(path.name for path in project_path.glob('.coverage*')) == ['.coverage']
+
+    def test_failure(self, hatch, temp_dir, config_file, env_run):
+        config_file.model.template.plugins['default']['tests'] = False
+        config_file.save()
+
+        with temp_dir.as_cwd():
+            result = hatch('new', 'My.App')
+
+        assert result.exit_code == 0, result.output
+
+        project_path = temp_dir / 'my-app'
+        data_path = temp_dir / 'data'
+        data_path.mkdir()
+        (project_path / '.coverage.env0').write_bytes(b'0')
+
+        env_run.side_effect = [
+            env_run.return_value,
+            subprocess.CompletedProcess([], 1, stdout=b"Couldn't combine data file"),
+        ]
+        with project_path.as_cwd(env_vars={ConfigEnvVars.DATA: str(data_path)}):
+            result = hatch('test', '--cover-quiet')
+
+        assert result.exit_code == 1, result.output
+        assert result.output == "Couldn't combine data file\n"
+
+
 class TestCustomScripts:
     def test_basic(self, hatch, temp_dir, config_file, env_run, mocker):
         config_file.model.template.plugins['default']['tests'] = False
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 import json
 import os
 import shutil
@@ -21,10 +22,12 @@ from hatch.env.internal import get_internal_env_config
 from hatch.env.utils import get_env_var
 from hatch.utils.ci import running_in_ci
 from hatch.utils.fs import Path, temp_directory
+from hatch.utils.network import close_clients
 from hatch.utils.platform import Platform
 from hatch.utils.structures import EnvVars
 from hatch.venv.core import TempVirtualEnv
 from hatchling.cli import hatchling
+from hatchling.cli.build import build_impl
 
 from .helpers.templates.licenses import MIT, Apache_2_0
 
@@ -178,6 +181,13 @@ def config_file(tmp_path) -> ConfigFile:
     return config
 
 
+@pytest.fixture(autouse=True)
+def shared_http_clients():
+    # Clients are shared for the life of the process, which would leak mocked transports between tests
+    yield
+    close_clients()
+
+
 @pytest.fixture(scope='session')
 def default_virtualenv_installed_requirements(helpers):
     # PyPy installs extra packages by default
@@ -346,6 +356,14 @@ def is_hatchling_command(command: list[str] | str) -> bool:
     return command[command.index('-m') + 1] == 'hatchling'
 
 
+def mock_build_options(mocker):
+    # The backend process runs this version of Hatchling rather than the one in the build environment
+    mocker.patch(
+        'hatch.project.frontend.core.HatchBuildFrontend.get_build_options',
+        return_value=list(inspect.signature(build_impl).parameters),
+    )
+
+
 @pytest.fixture
 def mock_backend_process(request, mocker):
     if 'allow_backend_process' in request.keywords:
@@ -381,6 +399,7 @@ def mock_backend_process(request, mocker):
         return mock_process
 
     mocker.patch('hatch.utils.platform.Platform.run_command', side_effect=mock_process_api(PLATFORM.run_command))
+    mock_build_options(mocker)
 
     yield True
 
@@ -424,6 +443,7 @@ def mock_backend_process_output(request, mocker):
         return mock_process
 
     mocker.patch('subprocess.run', side_effect=mock_process_api(subprocess.run))
+    mock_build_options(mocker)
     mocker.patch('hatchling.bridge.app._display', side_effect=lambda cmd, **_: output_queue.append(f'{cmd}\n'))
 
     yield True
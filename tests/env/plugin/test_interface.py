@@ -2,6 +2,7 @@ import pytest
 
 from hatch.config.constants import AppEnvVars
 from hatch.env.plugin.interface import EnvironmentInterface
+from hatch.project.constants import BuildEnvVars
 from hatch.project.core import Project
 from hatch.utils.structures import EnvVars
 
@@ -612,6 +613,32 @@ class TestBuilder:
 
         assert environment.builder is True
 
+    def test_plugin_index_directory(self, isolation, isolated_data_dir, platform, global_application, monkeypatch):
+        config = {
+            'project': {'name': 'my_app', 'version': '0.0.1'},
+            'tool': {'hatch': {'envs': {'default': {'builder': True}}}},
+        }
+        project = Project(isolation, config=config)
+        monkeypatch.setattr(global_application, 'cache_dir', isolated_data_dir / 'cache')
+        environment = MockEnvironment(
+            isolation,
+            project.metadata,
+            'default',
+            project.config.envs['default'],
+            {},
+            isolated_data_dir,
+            isolated_data_dir,
+            platform,
+            0,
+            global_application,
+        )
+
+        with EnvVars(exclude=[BuildEnvVars.PLUGIN_INDEX_DIR]):
+            assert environment.env_vars == {
+                AppEnvVars.ENV_ACTIVE: 'default',
+                BuildEnvVars.PLUGIN_INDEX_DIR: str(isolated_data_dir / 'cache' / 'plugins'),
+            }
+
 
 class TestFeatures:
     def test_default(self, isolation, isolated_data_dir, platform, global_application):
@@ -0,0 +1,73 @@
+import hashlib
+import json
+from base64 import urlsafe_b64encode
+
+import pytest
+
+from hatch.env.utils import replace_editable_files
+
+GENERATOR = 'hatchling 1.0.0'
+
+
+def get_record_hash(contents):
+    digest = urlsafe_b64encode(hashlib.sha256(contents.encode('utf-8')).digest()).rstrip(b'=').decode('ascii')
+    return f'sha256={digest}'
+
+
+@pytest.fixture
+def site_packages(temp_dir):
+    site_packages = temp_dir / 'site-packages'
+    dist_info = site_packages / 'foo-1.0.dist-info'
+    dist_info.ensure_dir_exists()
+    (dist_info / 'METADATA').write_text('Metadata-Version: 2.1\nName: foo\nVersion: 1.0\n')
+    (dist_info / 'direct_url.json').write_text(
+        json.dumps({'url': (temp_dir / 'foo').as_uri(), 'dir_info': {'editable': True}})
+    )
+    (dist_info / 'WHEEL').write_text('Wheel-Version: 1.0\nGenerator: hatchling 1.0.0\nRoot-Is-Purelib: true\n')
+    (site_packages / '_foo.pth').write_text('/old')
+    (dist_info / 'RECORD').write_text(
+        f'_foo.pth,{get_record_hash("/old")},4\n'
+        'foo-1.0.dist-info/METADATA,,\n'
+        'foo-1.0.dist-info/WHEEL,,\n'
+        'foo-1.0.dist-info/direct_url.json,,\n'
+        'foo-1.0.dist-info/RECORD,,\n'
+    )
+
+    return site_packages
+
+
+class TestReplaceEditableFiles:
+    def test_replaced(self, site_packages):
+        contents = '/new/src\n/new/lib'
+        assert replace_editable_files([str(site_packages)], 'foo', [('_foo.pth', contents)], generator=GENERATOR)
+
+        assert (site_packages / '_foo.pth').read_text() == contents
+        assert (site_packages / 'foo-1.0.dist-info' / 'RECORD').read_text() == (
+            f'_foo.pth,{get_record_hash(contents)},17\n'
+            'foo-1.0.dist-info/METADATA,,\n'
+            'foo-1.0.dist-info/WHEEL,,\n'
+            'foo-1.0.dist-info/direct_url.json,,\n'
+            'foo-1.0.dist-info/RECORD,,\n'
+        )
+
+    def test_not_installed(self, site_packages):
+        assert not replace_editable_files([str(site_packages)], 'bar', [('_bar.pth', '/new')], generator=GENERATOR)
+
+    def test_not_editable(self, site_packages):
+        (site_packages / 'foo-1.0.dist-info' / 'direct_url.json').write_text(
+            json.dumps({'url': 'file:///foo', 'dir_info': {}})
+        )
+
+        assert not replace_editable_files([str(site_packages)], 'foo', [('_foo.pth', '/new')], generator=GENERATOR)
+        assert (site_packages / '_foo.pth').read_text() == '/old'
+
+    def test_new_file(self, site_packages):
+        assert not replace_editable_files([str(site_packages)], 'foo', [('_foo_new.pth', '/new')], generator=GENERATOR)
+        assert (site_packages / '_foo.pth').read_text() == '/old'
+        assert not (site_packages / '_foo_new.pth').exists()
+
+    def test_other_generator(self, site_packages):
+        assert not replace_editable_files(
+            [str(site_packages)], 'foo', [('_foo.pth', '/new')], generator='hatchling 2.0.0'
+        )
+        assert (site_packages / '_foo.pth').read_text() == '/old'
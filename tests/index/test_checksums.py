@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import tarfile
+import zipfile
+from base64 import urlsafe_b64encode
+from io import BytesIO
+
+import pytest
+
+from hatch.index.checksums import (
+    MANIFEST_FILE_NAME,
+    ChecksumManifest,
+    find_artifacts,
+    update_manifests,
+    verify_artifact,
+    verify_artifacts,
+)
+
+
+def record_hash(contents):
+    return f'sha256={urlsafe_b64encode(hashlib.sha256(contents).digest()).rstrip(b"=").decode()}'
+
+
+def create_wheel(path, files, *, record=None):
+    if record is None:
+        record = [(name, record_hash(contents), str(len(contents))) for name, contents in files.items()]
+        record.append(('foo-1.0.dist-info/RECORD', '', ''))
+
+    with zipfile.ZipFile(str(path), 'w') as zip_archive:
+        for name, contents in files.items():
+            zip_archive.writestr(name, contents)
+
+        zip_archive.writestr('foo-1.0.dist-info/RECORD', ''.join(f'{",".join(row)}\n' for row in record))
+
+    return path
+
+
+def create_sdist(path):
+    with tarfile.open(str(path), 'w:gz') as tar_archive:
+        contents = b'Name: foo\nVersion: 1.0\n'
+        tar_info = tarfile.TarInfo('foo-1.0/PKG-INFO')
+        tar_info.size = len(contents)
+        tar_archive.addfile(tar_info, BytesIO(contents))
+
+    return path
+
+
+WHEEL_FILES = {'foo/__init__.py': b'', 'foo/bar.py': b'x = 1\n', 'foo-1.0.dist-info/METADATA': b'Name: foo\n'}
+
+
+class TestVerifyArtifact:
+    def test_wheel(self, temp_dir):
+        artifact = create_wheel(temp_dir / 'foo-1.0-py3-none-any.whl', WHEEL_FILES)
+
+        result = verify_artifact(artifact)
+
+        assert result.valid, result.errors
+        contents = artifact.read_bytes()
+        assert result.digests == {
+            'md5_digest': hashlib.md5(contents).hexdigest(),
+            'sha256_digest': hashlib.sha256(contents).hexdigest(),
+            'blake2_256_digest': hashlib.blake2b(contents, digest_size=32).hexdigest(),
+        }
+
+    def test_wheel_digest_mismatch(self, temp_dir):
+        record = [(name, record_hash(b'other'), str(len(contents))) for name, contents in WHEEL_FILES.items()]
+        artifact = create_wheel(temp_dir / 'foo-1.0-py3-none-any.whl', WHEEL_FILES, record=record)
+
+        result = verify_artifact(artifact)
+
+        assert result.errors == [f'Digest mismatch for: {name}' for name in WHEEL_FILES]
+
+    def test_wheel_size_mismatch(self, temp_dir):
+        record = [(name, record_hash(contents), '9000') for name, contents in WHEEL_FILES.items()]
+        artifact = create_wheel(temp_dir / 'foo-1.0-py3-none-any.whl', WHEEL_FILES, record=record)
+
+        result = verify_artifact(artifact)
+
+        assert result.errors == [f'Size mismatch for: {name}' for name in WHEEL_FILES]
+
+    def test_wheel_unrecorded_and_missing_files(self, temp_dir):
+        record = [
+            ('foo/__init__.py', record_hash(b''), '0'),
+            ('foo-1.0.dist-info/METADATA', record_hash(b'Name: foo\n'), '10'),
+            ('foo/missing.py', record_hash(b''), '0'),
+        ]
+        artifact = create_wheel(temp_dir / 'foo-1.0-py3-none-any.whl', WHEEL_FILES, record=record)
+
+        result = verify_artifact(artifact)
+
+        assert result.errors == [
+            'File not listed in RECORD: foo/bar.py',
+            'File listed in RECORD not found: foo/missing.py',
+        ]
+
+    def test_wheel_weak_hash(self, temp_dir):
+        record = [(name, 'md5=abc', '') for name in WHEEL_FILES]
+        artifact = create_wheel(temp_dir / 'foo-1.0-py3-none-any.whl', {'foo/__init__.py': b''}, record=record[:1])
+
+        result = verify_artifact(artifact)
+
+        assert result.errors == ['Unsupported hash algorithm `md5` in RECORD for: foo/__init__.py']
+
+    def test_wheel_without_record(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0-py3-none-any.whl'
+        with zipfile.ZipFile(str(artifact), 'w') as zip_archive:
+            zip_archive.writestr('foo/__init__.py', '')
+
+        result = verify_artifact(artifact)
+
+        assert result.errors == ['Could not find a single `.dist-info/RECORD` file']
+
+    def test_wheel_invalid(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0-py3-none-any.whl'
+        artifact.write_bytes(b'foo')
+
+        result = verify_artifact(artifact)
+
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith('Invalid wheel: ')
+
+    def test_sdist(self, temp_dir):
+        artifact = create_sdist(temp_dir / 'foo-1.0.tar.gz')
+
+        result = verify_artifact(artifact)
+
+        assert result.valid, result.errors
+        assert result.digests['sha256_digest'] == hashlib.sha256(artifact.read_bytes()).hexdigest()
+
+    def test_sdist_truncated(self, temp_dir):
+        artifact = create_sdist(temp_dir / 'foo-1.0.tar.gz')
+        artifact.write_bytes(artifact.read_bytes()[:30])
+
+        result = verify_artifact(artifact)
+
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith('Invalid source distribution: ')
+
+
+def test_verify_artifacts_ordered(temp_dir):
+    artifacts = [create_sdist(temp_dir / f'foo-1.{i}.tar.gz') for i in range(8)]
+    artifacts[3].write_bytes(b'')
+
+    results = verify_artifacts(artifacts, jobs=4)
+
+    assert [result.artifact for result in results] == artifacts
+    assert [result.valid for result in results] == [True, True, True, False, True, True, True, True]
+
+
+class TestManifest:
+    def test_round_trip(self, temp_dir):
+        artifact = create_sdist(temp_dir / 'foo-1.0.tar.gz')
+        manifest = ChecksumManifest(temp_dir)
+        manifest.set(artifact, {'sha256_digest': 'foo'})
+        manifest.save()
+
+        assert ChecksumManifest(temp_dir).get(artifact) == {'sha256_digest': 'foo'}
+
+    def test_modified_artifact(self, temp_dir):
+        artifact = create_sdist(temp_dir / 'foo-1.0.tar.gz')
+        manifest = ChecksumManifest(temp_dir)
+        manifest.set(artifact, {'sha256_digest': 'foo'})
+        manifest.save()
+
+        stat = artifact.stat()
+        os.utime(artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert ChecksumManifest(temp_dir).get(artifact) is None
+
+    def test_invalid(self, temp_dir):
+        artifact = create_sdist(temp_dir / 'foo-1.0.tar.gz')
+        (temp_dir / MANIFEST_FILE_NAME).write_text('[]')
+
+        assert ChecksumManifest(temp_dir).get(artifact) is None
+
+    def test_removed_artifacts_pruned(self, temp_dir):
+        artifacts = [create_sdist(temp_dir / 'foo-1.0.tar.gz'), create_sdist(temp_dir / 'foo-2.0.tar.gz')]
+        manifest = ChecksumManifest(temp_dir)
+        for artifact in artifacts:
+            manifest.set(artifact, {})
+        artifacts[0].unlink()
+        manifest.save()
+
+        assert list(json.loads((temp_dir / MANIFEST_FILE_NAME).read_text())) == ['foo-2.0.tar.gz']
+
+
+def test_update_manifests(temp_dir):
+    valid = create_sdist(temp_dir / 'foo-1.0.tar.gz')
+    invalid = temp_dir / 'foo-2.0.tar.gz'
+    invalid.write_bytes(b'')
+
+    update_manifests(verify_artifacts([valid, invalid]))
+
+    manifest = ChecksumManifest(temp_dir)
+    assert manifest.get(valid) == verify_artifact(valid).digests
+    assert manifest.get(invalid) is None
+
+
+@pytest.mark.parametrize('name', ['foo-1.0.tar.gz', 'foo-1.0-py3-none-any.whl'])
+def test_find_artifacts(temp_dir, name):
+    (temp_dir / name).touch()
+    (temp_dir / MANIFEST_FILE_NAME).touch()
+    (temp_dir / 'foo-1.0.zip').touch()
+
+    assert find_artifacts(temp_dir) == [temp_dir / name]
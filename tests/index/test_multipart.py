@@ -0,0 +1,97 @@
+import hashlib
+from email.parser import BytesParser
+
+import pytest
+
+from hatch.index.multipart import MultipartUpload
+
+
+def parse_body(headers, body):
+    message = BytesParser().parsebytes(f'Content-Type: {headers["Content-Type"]}\r\n\r\n'.encode() + body)
+    return [
+        (part.get_param('name', header='content-disposition'), part.get_filename(), part.get_payload(decode=True))
+        for part in message.get_payload()
+    ]
+
+
+class TestMultipartUpload:
+    def test_fields(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0-py3-none-any.whl'
+        content = bytes(range(256)) * 1000
+        artifact.write_bytes(content)
+
+        upload = MultipartUpload(artifact, {'name': 'foo', 'classifiers': ['A', 'B']}, chunk_size=1000)
+        body = b''.join(upload)
+
+        assert parse_body(upload.headers, body) == [
+            ('name', None, b'foo'),
+            ('classifiers', None, b'A'),
+            ('classifiers', None, b'B'),
+            ('content', 'foo-1.0-py3-none-any.whl', content),
+            ('md5_digest', None, hashlib.md5(content).hexdigest().encode()),
+            ('sha256_digest', None, hashlib.sha256(content).hexdigest().encode()),
+            ('blake2_256_digest', None, hashlib.blake2b(content, digest_size=32).hexdigest().encode()),
+        ]
+
+    def test_leading_digests(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0-py3-none-any.whl'
+        content = bytes(range(256)) * 1000
+        artifact.write_bytes(content)
+
+        upload = MultipartUpload(artifact, {'name': 'foo'}, trailing_digests=False, chunk_size=1000)
+        body = b''.join(upload)
+
+        assert parse_body(upload.headers, body) == [
+            ('name', None, b'foo'),
+            ('md5_digest', None, hashlib.md5(content).hexdigest().encode()),
+            ('sha256_digest', None, hashlib.sha256(content).hexdigest().encode()),
+            ('blake2_256_digest', None, hashlib.blake2b(content, digest_size=32).hexdigest().encode()),
+            ('content', 'foo-1.0-py3-none-any.whl', content),
+        ]
+        assert int(upload.headers['Content-Length']) == len(body)
+
+    @pytest.mark.parametrize('trailing_digests', [True, False])
+    def test_empty(self, temp_dir, trailing_digests):
+        artifact = temp_dir / 'foo-1.0.tar.gz'
+        artifact.touch()
+
+        upload = MultipartUpload(artifact, {}, trailing_digests=trailing_digests)
+        body = b''.join(upload)
+
+        assert int(upload.headers['Content-Length']) == len(body)
+        assert upload.digests['sha256_digest'] == hashlib.sha256(b'').hexdigest()
+
+    def test_digests(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0.tar.gz'
+        artifact.write_bytes(b'foo')
+
+        upload = MultipartUpload(artifact, {})
+        assert upload.digests == {}
+
+        b''.join(upload)
+        assert upload.digests['sha256_digest'] == hashlib.sha256(b'foo').hexdigest()
+
+    def test_content_length(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0.tar.gz'
+        artifact.write_bytes(b'foo' * 100_000)
+
+        upload = MultipartUpload(artifact, {'summary': 'Unicode ☃', 'name': 'foo'})
+
+        assert int(upload.headers['Content-Length']) == len(b''.join(upload))
+
+    def test_reiterable(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0.tar.gz'
+        artifact.write_bytes(b'foo')
+
+        upload = MultipartUpload(artifact, {'name': 'foo'})
+
+        assert b''.join(upload) == b''.join(upload)
+
+    def test_quoted_names(self, temp_dir):
+        artifact = temp_dir / 'foo"1.0.tar.gz'
+        artifact.write_bytes(b'foo')
+
+        upload = MultipartUpload(artifact, {})
+        body = b''.join(upload)
+
+        assert b'filename="foo%221.0.tar.gz"' in body
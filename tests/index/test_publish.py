@@ -0,0 +1,104 @@
+import gzip
+import os
+import tarfile
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from hatch.index.errors import ArtifactMetadataError
+from hatch.index.publish import get_sdist_form_data, get_wheel_form_data
+
+
+def add_file(tar_archive, name, contents):
+    tar_info = tarfile.TarInfo(name)
+    tar_info.size = len(contents)
+    tar_archive.addfile(tar_info, BytesIO(contents))
+
+
+def create_sdist(path, members):
+    with tarfile.open(str(path), 'w:gz') as tar_archive:
+        for name, contents in members:
+            add_file(tar_archive, name, contents)
+
+    return path
+
+
+class TestSdist:
+    def test_metadata_first(self, temp_dir):
+        artifact = create_sdist(
+            temp_dir / 'foo-1.0.tar.gz', [('foo-1.0/PKG-INFO', b'Name: foo\nVersion: 1.0\n'), ('foo-1.0/a.py', b'')]
+        )
+        # Corrupt everything after the first members to prove that the rest is never decompressed
+        contents = artifact.read_bytes()
+        artifact.write_bytes(contents[:-8] + b'\x00' * 8)
+
+        data = get_sdist_form_data(artifact)
+
+        assert data['name'] == 'foo'
+        assert data['version'] == '1.0'
+        assert data['filetype'] == 'sdist'
+        assert data['pyversion'] == 'source'
+
+    def test_metadata_last(self, temp_dir):
+        artifact = create_sdist(
+            temp_dir / 'foo-1.0.tar.gz',
+            [('foo-1.0/a.py', b''), ('foo-1.0/b/PKG-INFO', b''), ('foo-1.0/PKG-INFO', b'Name: foo\nVersion: 1.0\n')],
+        )
+
+        data = get_sdist_form_data(artifact)
+
+        assert data['name'] == 'foo'
+
+    def test_missing_metadata(self, temp_dir):
+        artifact = create_sdist(temp_dir / 'foo-1.0.tar.gz', [('foo-1.0/a.py', b'')])
+
+        with pytest.raises(ArtifactMetadataError, match='Could not find file: foo-1.0/PKG-INFO'):
+            get_sdist_form_data(artifact)
+
+    def test_sidecar(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0.tar.gz'
+        artifact.write_bytes(gzip.compress(b'not a tar archive'))
+        (temp_dir / 'foo-1.0.tar.gz.metadata').write_text('Name: foo\nVersion: 1.0\n')
+
+        data = get_sdist_form_data(artifact)
+
+        assert data['name'] == 'foo'
+        assert data['version'] == '1.0'
+
+    def test_sidecar_outdated(self, temp_dir):
+        artifact = create_sdist(temp_dir / 'foo-1.0.tar.gz', [('foo-1.0/PKG-INFO', b'Name: foo\nVersion: 2.0\n')])
+        sidecar = temp_dir / 'foo-1.0.tar.gz.metadata'
+        sidecar.write_text('Name: foo\nVersion: 1.0\n')
+        artifact_mtime = artifact.stat().st_mtime
+        os.utime(sidecar, (artifact_mtime - 10, artifact_mtime - 10))
+
+        data = get_sdist_form_data(artifact)
+
+        assert data['version'] == '2.0'
+
+
+class TestWheel:
+    def test_metadata(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0-py2.py3-none-any.whl'
+        with zipfile.ZipFile(str(artifact), 'w') as zip_archive:
+            zip_archive.writestr(
+                'foo-1.0.dist-info/METADATA', 'Name: foo\nVersion: 1.0\nClassifier: A\nClassifier: B\n'
+            )
+
+        data = get_wheel_form_data(artifact)
+
+        assert data['name'] == 'foo'
+        assert data['classifiers'] == ['A', 'B']
+        assert data['filetype'] == 'bdist_wheel'
+        assert data['pyversion'] == 'py2.py3'
+
+    def test_sidecar(self, temp_dir):
+        artifact = temp_dir / 'foo-1.0-py3-none-any.whl'
+        artifact.write_bytes(b'not a zip archive')
+        (temp_dir / 'foo-1.0-py3-none-any.whl.metadata').write_text('Name: foo\nVersion: 1.0\n')
+
+        data = get_wheel_form_data(artifact)
+
+        assert data['name'] == 'foo'
+        assert data['pyversion'] == 'py3'
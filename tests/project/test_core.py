@@ -1,6 +1,6 @@
 import pytest
 
-from hatch.project.core import Project
+from hatch.project.core import Project, get_dev_mode_state
 
 
 class TestFindProjectRoot:
@@ -183,3 +183,51 @@ class TestEnsureCWD:
 
         with temp_dir.as_cwd(), project.ensure_cwd() as cwd:
             assert cwd == subdir
+
+
+class TestDevModeState:
+    @pytest.fixture
+    def project_root(self, temp_dir):
+        (temp_dir / 'pyproject.toml').write_text('[project]\nname = "my-app"\nversion = "0.0.1"\n')
+        package = temp_dir / 'src' / 'my_app'
+        package.ensure_dir_exists()
+        (package / '__init__.py').touch()
+
+        return temp_dir
+
+    @staticmethod
+    def get_state(project_root):
+        from hatchling.builders.wheel import WheelBuilder
+
+        return get_dev_mode_state(WheelBuilder(str(project_root)))
+
+    def test_stable(self, project_root):
+        subpackage = project_root / 'src' / 'my_app' / 'sub'
+        subpackage.ensure_dir_exists()
+        state = self.get_state(project_root)
+
+        (project_root / 'src' / 'my_app' / '__init__.py').write_text('x = 1\n')
+        (subpackage / 'foo.py').touch()
+
+        assert self.get_state(project_root) == state
+
+    def test_config_changed(self, project_root):
+        state = self.get_state(project_root)
+
+        (project_root / 'hatch.toml').write_text('[build.targets.wheel]\ndev-mode-dirs = ["."]\n')
+
+        assert self.get_state(project_root) != state
+
+    def test_source_root_changed(self, project_root):
+        state = self.get_state(project_root)
+
+        (project_root / 'src' / 'other').ensure_dir_exists()
+
+        assert self.get_state(project_root) != state
+
+    def test_project_root_changed(self, project_root):
+        state = self.get_state(project_root)
+
+        (project_root / 'other.py').touch()
+
+        assert self.get_state(project_root) != state
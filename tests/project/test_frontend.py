@@ -1,10 +1,14 @@
 import json
+import os
+import shlex
 import sys
 
 import pytest
 
 from hatch.env.plugin.interface import EnvironmentInterface
 from hatch.project.core import Project
+from hatch.project.frontend.core import get_hook_kwargs
+from hatch.utils.structures import EnvVars
 from hatchling.builders.constants import EDITABLES_REQUIREMENT
 from hatchling.metadata.spec import project_metadata_from_core_metadata
 
@@ -400,3 +404,308 @@ version = "9000.42"
         output = json.loads((output_dir / 'output.json').read_text())
 
         assert output == []
+
+
+class TestHatchGetBuildOptions:
+    def test_default(self, temp_dir, temp_application, platform):
+        project_dir = temp_dir / 'project'
+        project_dir.mkdir()
+        (project_dir / 'pyproject.toml').write_text(
+            """\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "foo"
+version = "9000.42"
+"""
+        )
+
+        output_dir = temp_dir / 'output'
+        output_dir.mkdir()
+        project = get_builder_project(project_dir, temp_application)
+        script = project.build_frontend.hatch.scripts.get_build_options(output_dir=str(output_dir))
+        platform.check_command([sys.executable, '-c', script])
+        output = json.loads((output_dir / 'output.json').read_text())
+
+        assert 'artifacts_file' in output
+        assert 'wheel_from_sdist' in output
+
+
+def get_builder_project(project_dir, application):
+    application.cache_dir = project_dir.parent / 'cache'
+    project = Project(project_dir)
+    project.build_env = MockEnvironment(
+        project_dir,
+        project.metadata,
+        'hatch-build',
+        {'builder': True},
+        {},
+        project_dir.parent / 'data',
+        project_dir.parent / 'data',
+        application.platform,
+        0,
+        application,
+    )
+    return project
+
+
+class TestHookResultCache:
+    @staticmethod
+    def create_project(temp_dir, application, *, dynamic=False):
+        project_dir = temp_dir / 'project'
+        project_dir.mkdir()
+        (project_dir / 'pyproject.toml').write_text(
+            f"""\
+[build-system]
+requires = ["flit-core"]
+build-backend = "flit_core.buildapi"
+
+[project]
+name = "foo"
+{'dynamic = ["version"]' if dynamic else 'version = "9000.42"'}
+readme = "README.md"
+"""
+        )
+        (project_dir / 'README.md').write_text('foo')
+
+        return get_builder_project(project_dir, application)
+
+    def test_round_trip(self, temp_dir, temp_application):
+        project = self.create_project(temp_dir, temp_application)
+        project.build_frontend.hook_cache.set('get_requires_for_build_wheel', ['foo'])
+
+        assert project.build_frontend.hook_cache.get('get_requires_for_build_wheel') == ['foo']
+        assert project.build_frontend.hook_cache.get('get_requires_for_build_sdist') is None
+
+    def test_config_changed(self, temp_dir, temp_application):
+        project = self.create_project(temp_dir, temp_application)
+        project.build_frontend.hook_cache.set('get_requires_for_build_wheel', ['foo'])
+
+        (project.location / 'setup.cfg').write_text('[metadata]\n')
+
+        assert project.build_frontend.hook_cache.get('get_requires_for_build_wheel') is None
+
+    def test_dependencies_changed(self, temp_dir, temp_application):
+        project = self.create_project(temp_dir, temp_application)
+        project.build_frontend.hook_cache.set('get_requires_for_build_wheel', ['foo'])
+
+        project.build_env.config['dependencies'] = ['bar']
+        project = get_builder_project(project.location, temp_application)
+        project.build_env.config['dependencies'] = ['bar']
+
+        assert project.build_frontend.hook_cache.get('get_requires_for_build_wheel') is None
+
+    @pytest.mark.parametrize(
+        'env_var', ['HATCH_BUILD_NO_HOOKS', 'HATCH_BUILD_HOOKS_ENABLE', 'HATCH_BUILD_HOOK_ENABLE_FOO']
+    )
+    def test_hook_env_vars_changed(self, temp_dir, temp_application, env_var):
+        project = self.create_project(temp_dir, temp_application)
+        project.build_frontend.hook_cache.set('get_requires_for_build_wheel', ['foo'])
+
+        with EnvVars({env_var: '1'}):
+            assert project.build_frontend.hook_cache.get('get_requires_for_build_wheel') is None
+
+            project.build_frontend.hook_cache.set('get_requires_for_build_wheel', ['bar'])
+
+            assert project.build_frontend.hook_cache.get('get_requires_for_build_wheel') == ['bar']
+
+        assert project.build_frontend.hook_cache.get('get_requires_for_build_wheel') is None
+
+    def test_static_metadata(self, temp_dir, temp_application):
+        project = self.create_project(temp_dir, temp_application)
+        project.build_frontend.hook_cache.set('prepare_metadata_for_build_wheel', {'name': 'foo'}, files=['README.md'])
+
+        assert project.build_frontend.get_cached_core_metadata() == {'name': 'foo'}
+
+        # Files referenced by static fields invalidate the cache
+        (project.location / 'README.md').write_text('bar')
+
+        assert project.build_frontend.get_cached_core_metadata() is None
+
+    def test_dynamic_metadata_without_git(self, temp_dir, temp_application):
+        project = self.create_project(temp_dir, temp_application, dynamic=True)
+        project.build_frontend.hook_cache.set('prepare_metadata_for_build_wheel', {'name': 'foo'}, sources=True)
+
+        assert project.build_frontend.get_cached_core_metadata() is None
+
+    def test_dynamic_metadata(self, temp_dir, temp_application):
+        project = self.create_project(temp_dir, temp_application, dynamic=True)
+        platform = temp_application.platform
+        package_file = project.location / 'foo.py'
+        package_file.write_text('__version__ = "1"\n')
+        with project.location.as_cwd():
+            platform.check_command_output(['git', 'init', '-q'])
+            platform.check_command_output(['git', 'add', '.'])
+            platform.check_command_output([
+                'git',
+                '-c',
+                'user.name=foo',
+                '-c',
+                'user.email=foo@bar.baz',
+                'commit',
+                '-q',
+                '-m',
+                'init',
+            ])
+
+        project.build_frontend.hook_cache.set('prepare_metadata_for_build_wheel', {'name': 'foo'}, sources=True)
+
+        assert project.build_frontend.get_cached_core_metadata() == {'name': 'foo'}
+
+        # Any modified or untracked file invalidates the cache
+        package_file.write_text('__version__ = "2"\n')
+
+        assert project.build_frontend.get_cached_core_metadata() is None
+
+        project.build_frontend.hook_cache.set('prepare_metadata_for_build_wheel', {'name': 'foo'}, sources=True)
+
+        assert project.build_frontend.get_cached_core_metadata() == {'name': 'foo'}
+
+        (project.location / 'bar.py').touch()
+
+        assert project.build_frontend.get_cached_core_metadata() is None
+
+
+class TestHatchGetBuildDepsCached:
+    def test_custom_hook(self, temp_dir, temp_application, mocker):
+        project_dir = temp_dir / 'project'
+        project_dir.mkdir()
+        (project_dir / 'pyproject.toml').write_text(
+            """\
+[build-system]
+requires = ["hatchling"]
+build-backend = "hatchling.build"
+
+[project]
+name = "foo"
+version = "9000.42"
+
+[tool.hatch.build.hooks.custom]
+"""
+        )
+        (project_dir / 'hatch_build.py').write_text(
+            """\
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+class CustomHook(BuildHookInterface):
+    pass
+"""
+        )
+        (project_dir / 'foo.py').touch()
+
+        def execute_context(context):
+            script = shlex.split(context.shell_commands[0])[-1]
+            temp_application.platform.check_command([sys.executable, '-u', script])
+
+        execute = mocker.patch('hatch.cli.application.Application.execute_context', side_effect=execute_context)
+
+        project = get_builder_project(project_dir, temp_application)
+        assert project.build_frontend.hatch.get_build_deps(['wheel']) == []
+        assert execute.call_count == 1
+
+        project = get_builder_project(project_dir, temp_application)
+        assert project.build_frontend.hatch.get_build_deps(['wheel']) == []
+        assert execute.call_count == 1
+
+        # The code of custom hooks may define dependencies
+        (project_dir / 'hatch_build.py').write_text(
+            """\
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+class CustomHook(BuildHookInterface):
+    def dependencies(self):
+        return ['bar']
+"""
+        )
+
+        project = get_builder_project(project_dir, temp_application)
+        assert project.build_frontend.hatch.get_build_deps(['wheel']) == ['bar']
+        assert execute.call_count == 2
+
+
+class TestSession:
+    @staticmethod
+    def create_project(temp_dir, application, *, backend_api='flit_core.buildapi'):
+        project_dir = temp_dir / 'project'
+        project_dir.mkdir()
+        (project_dir / 'pyproject.toml').write_text(
+            f"""\
+[build-system]
+requires = ["flit-core"]
+build-backend = "{backend_api}"
+
+[project]
+name = "foo"
+version = "9000.42"
+description = "text"
+"""
+        )
+
+        package_dir = project_dir / 'foo'
+        package_dir.mkdir()
+        (package_dir / '__init__.py').touch()
+
+        return get_builder_project(project_dir, application)
+
+    def test_script(self, temp_dir, temp_application, platform):
+        project = self.create_project(temp_dir, temp_application)
+        script = project.build_frontend.scripts.get_session_script(project_root=str(project.location))
+        requests = []
+        for hook in ('get_requires_for_build_wheel', 'build_sdist', 'build_wheel'):
+            output_dir = temp_dir / 'output' / hook
+            output_dir.ensure_dir_exists()
+            requests.append({'output_dir': str(output_dir), 'hook': hook, 'kwargs': get_hook_kwargs(hook)})
+
+        process = platform.modules.subprocess.run(
+            [sys.executable, '-c', script],
+            input=''.join(f'{json.dumps(request)}\n' for request in requests),
+            capture_output=True,
+            encoding='utf-8',
+            check=True,
+        )
+
+        assert process.stdout.splitlines() == ['{"code": 0}'] * 3
+        assert json.loads((temp_dir / 'output' / 'get_requires_for_build_wheel' / 'output.json').read_text()) == {
+            'unsupported': False,
+            'return_val': [],
+        }
+        sdist_output = json.loads((temp_dir / 'output' / 'build_sdist' / 'output.json').read_text())
+        assert (temp_dir / 'output' / 'build_sdist' / 'work' / sdist_output['return_val']).is_file()
+        wheel_output = json.loads((temp_dir / 'output' / 'build_wheel' / 'output.json').read_text())
+        assert (temp_dir / 'output' / 'build_wheel' / 'work' / wheel_output['return_val']).is_file()
+
+    def test_single_process(self, temp_dir, temp_application, mocker):
+        project = self.create_project(temp_dir, temp_application)
+        mocker.patch.dict(os.environ, {'PATH': f'{os.path.dirname(sys.executable)}{os.pathsep}{os.environ["PATH"]}'})
+        popen = mocker.spy(project.build_env.platform.modules.subprocess, 'Popen')
+
+        build_dir = temp_dir / 'dist'
+        build_dir.mkdir()
+        with project.build_frontend.session():
+            assert project.build_frontend.get_requires('sdist') == []
+            assert project.build_frontend.get_requires('wheel') == []
+            sdist_path = project.build_frontend.build_sdist(build_dir)
+            wheel_path = project.build_frontend.build_wheel(build_dir)
+
+        assert popen.call_count == 1
+        assert sdist_path.name == 'foo-9000.42.tar.gz'
+        assert sdist_path.is_file()
+        assert wheel_path.name == 'foo-9000.42-py2.py3-none-any.whl'
+        assert wheel_path.is_file()
+
+    def test_hook_error(self, temp_dir, temp_application, mocker):
+        project = self.create_project(temp_dir, temp_application, backend_api='foo_unknown_backend')
+        mocker.patch.dict(os.environ, {'PATH': f'{os.path.dirname(sys.executable)}{os.pathsep}{os.environ["PATH"]}'})
+
+        with project.build_frontend.session(), pytest.raises(SystemExit) as e:
+            project.build_frontend.build_sdist(temp_dir)
+
+        assert e.value.code == 1
+
+    def test_unsupported_environment(self, temp_dir, temp_application, mocker):
+        project = self.create_project(temp_dir, temp_application)
+        mocker.patch.object(MockEnvironment, 'run_shell_command')
+
+        assert not project.build_frontend.supports_session()
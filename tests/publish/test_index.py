@@ -0,0 +1,347 @@
+import hashlib
+import tarfile
+import threading
+import zipfile
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import pytest
+
+
+class IndexServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), IndexHandler)
+        self.files = {}
+        self.simple_requests = []
+        self.rejected = set()
+        # Uploads are held until this many are in flight so that tests can observe concurrency
+        self.hold_uploads = 0
+        self.release = threading.Event()
+        self.active_uploads = 0
+        self.max_active_uploads = 0
+        # The files that had been uploaded when each upload started
+        self.upload_starts = {}
+        self.lock = threading.Lock()
+
+    @property
+    def repo(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/root/dev/'
+
+
+class IndexHandler(BaseHTTPRequestHandler):
+    server: IndexServer
+
+    def log_message(self, *args, **kwargs):
+        pass
+
+    def do_GET(self):
+        project = self.path.rstrip('/').rsplit('/', 1)[-1]
+        with self.server.lock:
+            self.server.simple_requests.append(project)
+            links = [
+                f'<a href="/{name}">{name}</a>' for name, data in self.server.files.items() if data['name'] == project
+            ]
+
+        if not links:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = '\n'.join(links).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            uploaded = set(server.files)
+            server.active_uploads += 1
+            server.max_active_uploads = max(server.max_active_uploads, server.active_uploads)
+            if server.active_uploads >= server.hold_uploads:
+                server.release.set()
+
+        try:
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            server.release.wait(5)
+        finally:
+            # The client may send its next upload as soon as it receives a response
+            with server.lock:
+                server.active_uploads -= 1
+
+        message = BytesParser().parsebytes(f'Content-Type: {self.headers["Content-Type"]}\r\n\r\n'.encode() + body)
+        fields = {}
+        for part in message.get_payload():
+            fields[part.get_param('name', header='content-disposition')] = part.get_payload(decode=True)
+            if part.get_filename():
+                filename = part.get_filename()
+
+        with server.lock:
+            server.upload_starts[filename] = uploaded
+
+        if filename in server.rejected:
+            self.send_response(400)
+        else:
+            with server.lock:
+                server.files[filename] = {
+                    'name': fields['name'].decode(),
+                    'content': fields['content'],
+                    'sha256_digest': fields['sha256_digest'].decode(),
+                    'fields': list(fields),
+                }
+            self.send_response(200)
+
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+@pytest.fixture
+def index_server():
+    server = IndexServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.release.set()
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def create_wheel(directory, name, version, tag='py3-none-any'):
+    path = directory / f'{name}-{version}-{tag}.whl'
+    with zipfile.ZipFile(str(path), 'w') as zip_archive:
+        zip_archive.writestr(f'{name}-{version}.dist-info/METADATA', f'Name: {name}\nVersion: {version}\n')
+
+    return path
+
+
+def create_sdist(directory, name, version):
+    path = directory / f'{name}-{version}.tar.gz'
+    metadata = f'Name: {name}\nVersion: {version}\n'.encode()
+    with tarfile.open(str(path), 'w:gz') as tar_archive:
+        tar_info = tarfile.TarInfo(f'{name}-{version}/PKG-INFO')
+        tar_info.size = len(metadata)
+        tar_archive.addfile(tar_info, BytesIO(metadata))
+
+    return path
+
+
+def publish(hatch, index_server, *args):
+    return hatch('publish', '--repo', index_server.repo, '--user', 'foo', '--auth', 'bar', '--no-prompt', *args)
+
+
+class TestPublish:
+    def test_concurrent(self, hatch, temp_dir, helpers, index_server):
+        artifacts = [
+            create_sdist(temp_dir, 'foo', '1.0'),
+            create_wheel(temp_dir, 'foo', '1.0'),
+            create_wheel(temp_dir, 'foo', '1.0', 'cp312-cp312-manylinux_2_17_x86_64'),
+            create_wheel(temp_dir, 'bar', '2.0'),
+        ]
+
+        # Existing releases may receive concurrent uploads
+        for name, existing_artifact in (('foo', 'foo-1.0-py2-none-any.whl'), ('bar', 'bar-2.0.tar.gz')):
+            index_server.files[existing_artifact] = {'name': name, 'content': b'', 'sha256_digest': ''}
+
+        index_server.hold_uploads = len(artifacts)
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, '--jobs', '4', *(artifact.name for artifact in artifacts))
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            f"""
+            foo-1.0.tar.gz ... success
+            foo-1.0-py3-none-any.whl ... success
+            foo-1.0-cp312-cp312-manylinux_2_17_x86_64.whl ... success
+            bar-2.0-py3-none-any.whl ... success
+
+            [foo]
+            {index_server.repo}foo/1.0/
+
+            [bar]
+            {index_server.repo}bar/2.0/
+            """
+        )
+        assert index_server.max_active_uploads == 4
+        assert sorted(index_server.simple_requests) == ['bar', 'foo']
+        for artifact in artifacts:
+            uploaded = index_server.files[artifact.name]
+            assert uploaded['content'] == artifact.read_bytes()
+            assert uploaded['sha256_digest'] == hashlib.sha256(artifact.read_bytes()).hexdigest()
+
+    def test_new_projects_and_releases(self, hatch, temp_dir, index_server):
+        artifacts = [
+            create_sdist(temp_dir, 'foo', '1.0'),
+            create_wheel(temp_dir, 'foo', '1.0'),
+            create_wheel(temp_dir, 'foo', '1.1'),
+            create_wheel(temp_dir, 'bar', '2.0'),
+            create_sdist(temp_dir, 'bar', '2.0'),
+        ]
+        index_server.files['bar-1.0.tar.gz'] = {'name': 'bar', 'content': b'', 'sha256_digest': ''}
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, '--jobs', '4', *(artifact.name for artifact in artifacts))
+
+        assert result.exit_code == 0, result.output
+
+        # The first upload of a new project is followed by the first upload of each of its new releases
+        upload_starts = index_server.upload_starts
+        assert 'foo-1.0.tar.gz' in upload_starts['foo-1.1-py3-none-any.whl']
+        assert {'foo-1.0.tar.gz', 'foo-1.1-py3-none-any.whl'} <= upload_starts['foo-1.0-py3-none-any.whl']
+        assert 'bar-2.0-py3-none-any.whl' in upload_starts['bar-2.0.tar.gz']
+
+    def test_sequential(self, hatch, temp_dir, index_server):
+        artifacts = [create_wheel(temp_dir, 'foo', '1.0'), create_sdist(temp_dir, 'foo', '1.0')]
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, '--jobs', '1', *(artifact.name for artifact in artifacts))
+
+        assert result.exit_code == 0, result.output
+        assert index_server.max_active_uploads == 1
+        assert sorted(index_server.files) == sorted(artifact.name for artifact in artifacts)
+
+    def test_already_exists(self, hatch, temp_dir, helpers, index_server):
+        wheel = create_wheel(temp_dir, 'foo', '1.0')
+        sdist = create_sdist(temp_dir, 'foo', '1.0')
+        index_server.files[wheel.name] = {'name': 'foo', 'content': b'', 'sha256_digest': ''}
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, wheel.name, sdist.name, sdist.name)
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            f"""
+            foo-1.0-py3-none-any.whl ... already exists
+            foo-1.0.tar.gz ... success
+            foo-1.0.tar.gz ... already exists
+
+            [foo]
+            {index_server.repo}foo/1.0/
+            """
+        )
+
+    def test_failure(self, hatch, temp_dir, helpers, index_server):
+        artifacts = [
+            create_wheel(temp_dir, 'foo', '1.0'),
+            create_sdist(temp_dir, 'foo', '1.0'),
+            create_wheel(temp_dir, 'bar', '2.0'),
+        ]
+        index_server.rejected.add(artifacts[1].name)
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, '--jobs', '1', *(artifact.name for artifact in artifacts))
+
+        assert result.exit_code == 1, result.output
+        assert result.output.startswith(
+            helpers.dedent(
+                f"""
+                foo-1.0-py3-none-any.whl ... success
+                foo-1.0.tar.gz ... failed
+                Error uploading to repository: {index_server.repo} - Client error '400 Bad Request'
+                """
+            ).rstrip()
+        )
+        assert 'bar' not in result.output
+
+    def test_leading_digests_by_default(self, hatch, temp_dir, index_server):
+        artifact = create_wheel(temp_dir, 'foo', '1.0')
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, artifact.name)
+
+        assert result.exit_code == 0, result.output
+        uploaded = index_server.files[artifact.name]
+        assert uploaded['sha256_digest'] == hashlib.sha256(artifact.read_bytes()).hexdigest()
+        assert uploaded['fields'].index('sha256_digest') < uploaded['fields'].index('content')
+
+    def test_trailing_digests(self, hatch, temp_dir, config_file, index_server):
+        config_file.model.publish['index']['repos'] = {
+            'dev': {'url': index_server.repo, 'trailing-digests': True},
+        }
+        config_file.save()
+        artifact = create_wheel(temp_dir, 'foo', '1.0')
+
+        with temp_dir.as_cwd():
+            result = hatch('publish', '--repo', 'dev', '--user', 'foo', '--auth', 'bar', '--no-prompt', artifact.name)
+
+        assert result.exit_code == 0, result.output
+        uploaded = index_server.files[artifact.name]
+        assert uploaded['sha256_digest'] == hashlib.sha256(artifact.read_bytes()).hexdigest()
+        assert uploaded['fields'].index('sha256_digest') > uploaded['fields'].index('content')
+
+    def test_invalid_trailing_digests(self, hatch, temp_dir, config_file, index_server):
+        config_file.model.publish['index']['trailing-digests'] = 'no'
+        config_file.save()
+        artifact = create_wheel(temp_dir, 'foo', '1.0')
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, artifact.name)
+
+        assert result.exit_code == 1, result.output
+        assert result.output == 'Hatch config field `publish.index.trailing-digests` must be a boolean\n'
+
+    def test_checksum_manifest(self, hatch, temp_dir, index_server):
+        from hatch.index.checksums import ChecksumManifest
+
+        artifact = create_wheel(temp_dir, 'foo', '1.0')
+        manifest = ChecksumManifest(temp_dir)
+        manifest.set(artifact, {'md5_digest': 'a', 'sha256_digest': 'b', 'blake2_256_digest': 'c'})
+        manifest.save()
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, artifact.name)
+
+        assert result.exit_code == 0, result.output
+        assert index_server.files[artifact.name]['sha256_digest'] == 'b'
+
+    def test_verify(self, hatch, temp_dir, helpers, index_server):
+        from hatch.index.checksums import ChecksumManifest
+
+        artifact = create_sdist(temp_dir, 'foo', '1.0')
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, '--verify', artifact.name)
+
+        assert result.exit_code == 0, result.output
+        assert result.output == helpers.dedent(
+            f"""
+            Verifying 1 artifact
+            foo-1.0.tar.gz ... verified
+            foo-1.0.tar.gz ... success
+
+            [foo]
+            {index_server.repo}foo/1.0/
+            """
+        )
+        digest = hashlib.sha256(artifact.read_bytes()).hexdigest()
+        assert ChecksumManifest(temp_dir).get(artifact)['sha256_digest'] == digest
+        assert index_server.files[artifact.name]['sha256_digest'] == digest
+
+    def test_verify_failure(self, hatch, temp_dir, index_server):
+        artifact = create_wheel(temp_dir, 'foo', '1.0')
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, '--verify', artifact.name)
+
+        assert result.exit_code == 1, result.output
+        assert result.output.endswith('Failed to verify 1 artifact\n')
+        assert not index_server.files
+
+    def test_invalid_jobs(self, hatch, temp_dir, config_file, index_server):
+        config_file.model.publish['index']['jobs'] = 0
+        config_file.save()
+        artifact = create_wheel(temp_dir, 'foo', '1.0')
+
+        with temp_dir.as_cwd():
+            result = publish(hatch, index_server, artifact.name)
+
+        assert result.exit_code == 1, result.output
+        assert result.output == 'Hatch config field `publish.index.jobs` must be a positive integer\n'
@@ -0,0 +1,173 @@
+import json
+import os
+import time
+from hashlib import sha256
+
+import pytest
+
+from hatch.python.cache import STAGING_EXPIRY, ArchiveCache
+
+URL = 'https://example.com/foo.tar.gz'
+
+
+def add_archive(cache, temp_dir, url, contents, mtime=None):
+    staged = temp_dir / 'staged'
+    staged.write_bytes(contents)
+    entry = cache.add(url, staged, sha256(contents).hexdigest())
+    if mtime is not None:
+        os.utime(entry.path, (mtime, mtime))
+
+    return entry
+
+
+class TestArchiveCache:
+    def test_missing(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+
+        assert cache.get(URL) is None
+        assert cache.entries() == []
+
+    def test_add(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+        entry = add_archive(cache, temp_dir, URL, b'foo')
+
+        assert entry.path == cache.archive_directory / sha256(b'foo').hexdigest()
+        assert entry.name == 'foo.tar.gz'
+        assert entry.size == 3
+        assert entry.verify()
+        assert not (temp_dir / 'staged').exists()
+
+        cached = cache.get(URL)
+        assert cached is not None
+        assert cached.sha256 == entry.sha256
+        assert cached.path.read_bytes() == b'foo'
+
+    @pytest.mark.parametrize(
+        'data',
+        [
+            '{',
+            '[]',
+            {'url': URL},
+            {'sha256': sha256(b'foo').hexdigest()},
+            {'url': URL, 'sha256': 1},
+            {'url': URL, 'sha256': '../foo'},
+        ],
+    )
+    def test_malformed_entry(self, temp_dir, data):
+        cache = ArchiveCache(temp_dir / 'cache')
+        entry = add_archive(cache, temp_dir, URL, b'foo')
+        entry_path = next(cache.entry_directory.iterdir())
+        entry_path.write_text(data if isinstance(data, str) else json.dumps(data))
+
+        assert cache.get(URL) is None
+        assert not entry_path.exists()
+
+        cache.prune()
+
+        assert not entry.path.exists()
+
+    def test_get_updates_last_used(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+        entry = add_archive(cache, temp_dir, URL, b'foo', mtime=0)
+
+        cache.get(URL)
+
+        assert entry.path.stat().st_mtime > 0
+
+    def test_verify_corrupted(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+        entry = add_archive(cache, temp_dir, URL, b'foo')
+        entry.path.write_bytes(b'bar')
+
+        assert not cache.get(URL).verify()
+
+    def test_missing_archive(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+        entry = add_archive(cache, temp_dir, URL, b'foo')
+        entry.path.unlink()
+
+        assert cache.get(URL) is None
+        assert not list(cache.entry_directory.iterdir())
+
+    def test_archive_evicted_after_lookup(self, temp_dir, mocker):
+        cache = ArchiveCache(temp_dir / 'cache')
+        entry = add_archive(cache, temp_dir, URL, b'foo')
+
+        def evict(*_, **__):
+            entry.path.unlink()
+            raise FileNotFoundError
+
+        mocker.patch('os.utime', side_effect=evict)
+
+        cached = cache.get(URL)
+
+        assert cached is not None
+        assert not cached.verify()
+
+    def test_changes_locked(self, temp_dir, mocker):
+        from hatch.utils.fs import exclusive_lock
+
+        lock = mocker.patch('hatch.utils.fs.exclusive_lock', wraps=exclusive_lock)
+        cache = ArchiveCache(temp_dir / 'cache')
+        add_archive(cache, temp_dir, URL, b'foo')
+        cache.remove(URL)
+        cache.prune()
+
+        assert lock.call_args_list == [mocker.call(cache.directory / '.lock')] * 3
+        assert (cache.directory / '.lock').is_file()
+
+    def test_shared_archive(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+        entry = add_archive(cache, temp_dir, URL, b'foo')
+        add_archive(cache, temp_dir, 'https://example.com/bar.tar.gz', b'foo')
+
+        cache.remove(URL)
+
+        assert entry.path.is_file()
+        assert [e.name for e in cache.entries()] == ['bar.tar.gz']
+
+    def test_prune_least_recently_used(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache', max_size=10)
+        add_archive(cache, temp_dir, 'https://example.com/1.tar.gz', b'1' * 4, mtime=1)
+        add_archive(cache, temp_dir, 'https://example.com/2.tar.gz', b'2' * 4, mtime=2)
+        add_archive(cache, temp_dir, 'https://example.com/3.tar.gz', b'3' * 4)
+
+        assert [e.name for e in cache.entries()] == ['3.tar.gz', '2.tar.gz']
+
+        evicted = cache.prune(4)
+
+        assert [e.name for e in evicted] == ['2.tar.gz']
+        assert [e.name for e in cache.entries()] == ['3.tar.gz']
+        assert len(list(cache.archive_directory.iterdir())) == 1
+
+    def test_prune_all(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+        add_archive(cache, temp_dir, URL, b'foo')
+
+        assert len(cache.prune(0)) == 1
+        assert cache.entries() == []
+        assert not list(cache.archive_directory.iterdir())
+
+    def test_prune_unreferenced(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+        add_archive(cache, temp_dir, URL, b'foo')
+        orphan = cache.archive_directory / 'orphan'
+        orphan.write_bytes(b'bar')
+
+        assert cache.prune() == []
+        assert not orphan.exists()
+        assert len(cache.entries()) == 1
+
+    def test_prune_abandoned_staged_archives(self, temp_dir):
+        cache = ArchiveCache(temp_dir / 'cache')
+        abandoned = cache.new_archive_path()
+        abandoned.write_bytes(b'foo')
+        mtime = time.time() - STAGING_EXPIRY - 1
+        os.utime(abandoned, (mtime, mtime))
+        in_progress = cache.new_archive_path()
+        in_progress.write_bytes(b'bar')
+
+        cache.prune()
+
+        assert not abandoned.exists()
+        assert in_progress.is_file()
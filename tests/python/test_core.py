@@ -1,8 +1,14 @@
+import io
 import json
+import os
+import tarfile
+import time
+from hashlib import sha256
 
 import pytest
 
 from hatch.config.constants import PythonEnvVars
+from hatch.python.cache import ArchiveCache
 from hatch.python.core import InstalledDistribution, PythonManager
 from hatch.python.distributions import ORDERED_DISTRIBUTIONS
 from hatch.python.resolve import custom_env_var, get_distribution
@@ -93,3 +99,196 @@ class TestGetInstalled:
             python_path.touch()
 
         assert tuple(manager.get_installed()) == compatible_python_distributions
+
+
+def create_installed(directory, name):
+    dist = get_distribution(name)
+    path = directory / dist.name
+    path.mkdir()
+    metadata_file = path / InstalledDistribution.metadata_filename()
+    metadata_file.write_text(json.dumps({'source': dist.source}))
+    python_path = path / dist.python_path
+    python_path.parent.ensure_dir_exists()
+    python_path.touch()
+
+    return path
+
+
+def age_directory(directory):
+    mtime_ns = time.time_ns() - 10_000_000_000
+    os.utime(directory, ns=(mtime_ns, mtime_ns))
+
+
+class TestInventory:
+    def test_distributions_not_read(self, temp_dir):
+        manager = PythonManager(temp_dir)
+        path = create_installed(temp_dir, '3.12')
+        manager.get_installed()
+        age_directory(temp_dir)
+
+        assert list(manager.get_installed()) == ['3.12']
+        assert manager.inventory_file.is_file()
+
+        # Only the installation directory is checked for changes once the inventory is current
+        (path / InstalledDistribution.metadata_filename()).unlink()
+
+        assert list(manager.get_installed()) == ['3.12']
+
+    def test_directory_changed(self, temp_dir):
+        manager = PythonManager(temp_dir)
+        create_installed(temp_dir, '3.12')
+        manager.get_installed()
+        age_directory(temp_dir)
+
+        assert list(manager.get_installed()) == ['3.12']
+
+        create_installed(temp_dir, '3.11')
+
+        assert list(manager.get_installed()) == ['3.11', '3.12']
+
+    def test_recent_changes(self, temp_dir):
+        manager = PythonManager(temp_dir)
+        create_installed(temp_dir, '3.12')
+
+        assert list(manager.get_installed()) == ['3.12']
+
+        # The modification time may not change when distributions are removed in quick succession
+        mtime_ns = temp_dir.stat().st_mtime_ns
+        (temp_dir / '3.12').wait_for_dir_removed()
+        os.utime(temp_dir, ns=(mtime_ns, mtime_ns))
+
+        assert list(manager.get_installed()) == []
+
+    def test_invalid(self, temp_dir):
+        manager = PythonManager(temp_dir)
+        create_installed(temp_dir, '3.12')
+        manager.inventory_file.parent.ensure_dir_exists()
+        manager.inventory_file.write_text('[]')
+
+        assert list(manager.get_installed()) == ['3.12']
+
+    def test_remove(self, temp_dir):
+        manager = PythonManager(temp_dir)
+        create_installed(temp_dir, '3.12')
+        create_installed(temp_dir, '3.11')
+        installed = manager.get_installed()
+
+        manager.remove(installed['3.12'])
+
+        assert json.loads(manager.inventory_file.read_text())['distributions'] == {
+            '3.11': {'source': get_distribution('3.11').source}
+        }
+        assert list(manager.get_installed()) == ['3.11']
+
+    def test_current_after_change(self, temp_dir):
+        manager = PythonManager(temp_dir)
+        create_installed(temp_dir, '3.12')
+        path = create_installed(temp_dir, '3.11')
+        installed = manager.get_installed()
+
+        manager.remove(installed['3.12'])
+
+        # The inventory written after the change is used right away
+        (path / InstalledDistribution.metadata_filename()).unlink()
+
+        assert list(manager.get_installed()) == ['3.11']
+
+
+def create_archive(members):
+    buffer = io.BytesIO()
+    with tarfile.open(mode='w:gz', fileobj=buffer) as tf:
+        for name, contents in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(contents)
+            tf.addfile(info, io.BytesIO(contents))
+
+    return buffer.getvalue()
+
+
+class TestInstall:
+    @pytest.fixture
+    def mock_download(self, mocker):
+        def mock_archive(archive):
+            def iter_download(*args, **kwargs):  # noqa: ARG001
+                yield archive
+
+            return mocker.patch('hatch.utils.network.iter_download', side_effect=iter_download)
+
+        return mock_archive
+
+    def test_streaming(self, temp_dir, mock_download):
+        dist = get_distribution('3.12')
+        archive = create_archive({dist.python_path: b'binary', 'python/lib/foo.py': b'bar'})
+        mock_download(archive)
+
+        manager = PythonManager(temp_dir / 'foo')
+        installed = manager.install('3.12')
+
+        assert installed.path == temp_dir / 'foo' / '3.12'
+        assert installed.python_path.read_bytes() == b'binary'
+        assert (installed.path / 'python' / 'lib' / 'foo.py').read_bytes() == b'bar'
+        assert installed.metadata['sha256'] == sha256(archive).hexdigest()
+        assert not list(manager.directory.glob('*.bak'))
+
+        metadata_file = installed.path / InstalledDistribution.metadata_filename()
+        assert json.loads(metadata_file.read_text()) == installed.metadata
+        assert list(manager.get_installed()) == ['3.12']
+
+    def test_replace_existing(self, temp_dir, mock_download):
+        dist = get_distribution('3.12')
+        manager = PythonManager(temp_dir)
+
+        mock_download(create_archive({dist.python_path: b'old', 'python/old.txt': b''}))
+        manager.install('3.12')
+
+        mock_download(create_archive({dist.python_path: b'new'}))
+        installed = manager.install('3.12')
+
+        assert installed.python_path.read_bytes() == b'new'
+        assert not (installed.path / 'python' / 'old.txt').exists()
+
+    def test_cache(self, temp_dir, mock_download):
+        dist = get_distribution('3.12')
+        archive = create_archive({dist.python_path: b'binary'})
+        download = mock_download(archive)
+
+        archive_cache = ArchiveCache(temp_dir / 'cache')
+        PythonManager(temp_dir / 'foo', archive_cache).install('3.12')
+        installed = PythonManager(temp_dir / 'bar', archive_cache).install('3.12')
+
+        assert download.call_count == 1
+        assert installed.python_path.read_bytes() == b'binary'
+        assert installed.metadata['sha256'] == sha256(archive).hexdigest()
+
+        cached = archive_cache.get(dist.source)
+        assert cached.path.read_bytes() == archive
+        assert not list((archive_cache.directory / 'staging').iterdir())
+
+    def test_cache_corrupted(self, temp_dir, mock_download):
+        dist = get_distribution('3.12')
+        archive = create_archive({dist.python_path: b'binary'})
+        download = mock_download(archive)
+
+        archive_cache = ArchiveCache(temp_dir / 'cache')
+        manager = PythonManager(temp_dir, archive_cache)
+        manager.install('3.12')
+        archive_cache.get(dist.source).path.write_bytes(b'corrupted')
+
+        installed = manager.install('3.12')
+
+        assert download.call_count == 2
+        assert installed.python_path.read_bytes() == b'binary'
+        assert archive_cache.get(dist.source).verify()
+
+    def test_corrupt_archive_keeps_existing(self, temp_dir, mock_download):
+        dist = get_distribution('3.12')
+        manager = PythonManager(temp_dir)
+
+        mock_download(create_archive({dist.python_path: b'old'}))
+        installed = manager.install('3.12')
+
+        mock_download(b'not an archive')
+        with pytest.raises(tarfile.TarError):
+            manager.install('3.12')
+
+        assert installed.python_path.read_bytes() == b'old'
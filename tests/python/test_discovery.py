@@ -0,0 +1,300 @@
+import json
+import os
+import sys
+
+import pytest
+
+from hatch.python.discovery import Interpreter, InterpreterDiscovery, InterpreterRegistry, find_interpreter
+
+pytestmark = pytest.mark.requires_unix
+
+
+def create_interpreter(directory, name):
+    directory.ensure_dir_exists()
+    path = directory / name
+    path.symlink_to(sys.executable)
+
+    return path
+
+
+def create_shim(directory, name):
+    directory.ensure_dir_exists()
+    path = directory / name
+    path.write_text(f'#!/bin/sh\nexec "{sys.executable}" "$@"\n')
+    path.chmod(0o755)
+
+    return path
+
+
+def create_broken_interpreter(directory, name):
+    directory.ensure_dir_exists()
+    path = directory / name
+    path.write_text('#!/bin/sh\nexit 1\n')
+    path.chmod(0o755)
+
+    return path
+
+
+class TestInterpreter:
+    @pytest.mark.parametrize(
+        ('spec', 'expected'),
+        [
+            ('', True),
+            ('3', True),
+            ('3.12', True),
+            ('3.12.1', True),
+            ('3.11', False),
+            ('cpython3.12', True),
+            ('pypy3.12', False),
+            ('3.12-64', True),
+            ('3.12-32', False),
+        ],
+    )
+    def test_satisfies(self, spec, expected):
+        from virtualenv.discovery.py_spec import PythonSpec
+
+        interpreter = Interpreter('python', implementation='CPython', version=(3, 12, 1), architecture=64)
+
+        assert interpreter.satisfies(PythonSpec.from_string_spec(spec)) is expected
+
+    def test_round_trip(self):
+        interpreter = Interpreter('python', implementation='PyPy', version=(3, 10, 14), architecture=64)
+        loaded = Interpreter.from_dict('python', interpreter.to_dict())
+
+        assert loaded.to_dict() == interpreter.to_dict()
+        assert loaded.version_str == '3.10.14'
+
+
+class TestInterpreterRegistry:
+    def test_cached(self, temp_dir, mocker):
+        registry_file = temp_dir / 'interpreters.json'
+        registry = InterpreterRegistry(registry_file)
+        interpreter = registry.get(sys.executable)
+        registry.save()
+
+        assert interpreter.version == sys.version_info[:3]
+
+        from_exe = mocker.patch('virtualenv.discovery.py_info.PythonInfo.from_exe')
+        cached = InterpreterRegistry(registry_file).get(sys.executable)
+
+        from_exe.assert_not_called()
+        assert cached.executable == sys.executable
+        assert cached.version_str == interpreter.version_str
+        assert cached.implementation == interpreter.implementation
+
+    def test_minimal_record(self, temp_dir):
+        registry_file = temp_dir / 'interpreters.json'
+        registry = InterpreterRegistry(registry_file)
+        interpreter = registry.get(sys.executable)
+        registry.save()
+
+        entry = json.loads(registry_file.read_text())[sys.executable]
+
+        assert entry['interpreter'] == {
+            'implementation': interpreter.implementation,
+            'version': list(sys.version_info[:3]),
+            'architecture': interpreter.architecture,
+            'free_threaded': interpreter.free_threaded,
+        }
+
+    def test_other_format(self, temp_dir, mocker):
+        from virtualenv.discovery.py_info import PythonInfo
+
+        registry_file = temp_dir / 'interpreters.json'
+        registry = InterpreterRegistry(registry_file)
+        registry.get(sys.executable)
+        registry.save()
+
+        entries = json.loads(registry_file.read_text())
+        entries[sys.executable] = {'identity': entries[sys.executable]['identity'], 'info': {'version_info': []}}
+        registry_file.write_text(json.dumps(entries))
+        from_exe = mocker.spy(PythonInfo, 'from_exe')
+
+        registry = InterpreterRegistry(registry_file)
+        interpreter = registry.get(sys.executable)
+
+        assert from_exe.call_args_list[0].args[0] == sys.executable
+        assert interpreter.version == sys.version_info[:3]
+        assert 'info' not in registry.entries[sys.executable]
+
+    def test_not_an_interpreter(self, temp_dir, mocker):
+        executable = create_broken_interpreter(temp_dir / 'bin', 'python3')
+        registry = InterpreterRegistry(temp_dir / 'interpreters.json')
+
+        assert registry.get(str(executable)) is None
+
+        from_exe = mocker.patch('virtualenv.discovery.py_info.PythonInfo.from_exe', return_value=None)
+
+        assert registry.get(str(executable)) is None
+        from_exe.assert_not_called()
+
+    def test_changed(self, temp_dir, mocker):
+        executable = create_broken_interpreter(temp_dir / 'bin', 'python3')
+        registry = InterpreterRegistry(temp_dir / 'interpreters.json')
+        registry.get(str(executable))
+
+        stat = executable.stat()
+        os.utime(executable, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        from_exe = mocker.patch('virtualenv.discovery.py_info.PythonInfo.from_exe', return_value=None)
+
+        registry.get(str(executable))
+
+        from_exe.assert_called_once()
+
+    def test_shim(self, temp_dir, mocker):
+        executable = create_shim(temp_dir / 'bin', 'python3')
+        registry = InterpreterRegistry(temp_dir / 'interpreters.json')
+
+        interpreter = registry.get(str(executable))
+
+        assert interpreter.version == sys.version_info[:3]
+        assert str(executable) not in registry.entries
+
+        from_exe = mocker.patch('virtualenv.discovery.py_info.PythonInfo.from_exe', return_value=None)
+        registry.get(str(executable))
+
+        from_exe.assert_called_once()
+
+    def test_missing(self, temp_dir):
+        registry = InterpreterRegistry(temp_dir / 'interpreters.json')
+
+        assert registry.get(str(temp_dir / 'python3')) is None
+        assert registry.entries == {}
+
+    def test_invalid(self, temp_dir):
+        registry_file = temp_dir / 'interpreters.json'
+        registry_file.write_text('[]')
+
+        assert InterpreterRegistry(registry_file).entries == {}
+
+    def test_refresh(self, temp_dir):
+        bin_dir = temp_dir / 'bin'
+        interpreter = create_interpreter(bin_dir, 'python3.99')
+        broken = create_broken_interpreter(bin_dir, 'python3.98')
+        registry_file = temp_dir / 'interpreters.json'
+        registry_file.write_text(json.dumps({str(temp_dir / 'python3'): {'identity': [], 'interpreter': None}}))
+
+        interpreters = InterpreterRegistry(registry_file).refresh({'PATH': str(bin_dir)})
+
+        assert [interpreter.executable for interpreter in interpreters] == [str(interpreter)]
+        assert sorted(json.loads(registry_file.read_text())) == [str(broken), str(interpreter)]
+
+
+class TestFindInterpreter:
+    def test_search_path(self, temp_dir):
+        bin_dir = temp_dir / 'bin'
+        create_broken_interpreter(bin_dir, 'python3')
+        interpreter = create_interpreter(bin_dir, f'python{sys.version_info.major}.{sys.version_info.minor}')
+        registry = InterpreterRegistry(temp_dir / 'interpreters.json')
+
+        found = find_interpreter(
+            f'{sys.version_info.major}.{sys.version_info.minor}',
+            registry,
+            env={'PATH': str(bin_dir)},
+            predicate=lambda interpreter: interpreter.executable != sys.executable,
+        )
+
+        assert found.executable == str(interpreter)
+        assert str(interpreter) in json.loads((temp_dir / 'interpreters.json').read_text())
+
+    def test_no_match(self, temp_dir):
+        registry = InterpreterRegistry()
+
+        assert find_interpreter('2.1', registry, env={'PATH': str(temp_dir)}) is None
+
+    def test_absolute_path(self, temp_dir):
+        interpreter = create_interpreter(temp_dir, 'python')
+        registry = InterpreterRegistry()
+
+        found = find_interpreter(str(interpreter), registry, env={'PATH': ''})
+
+        assert found.executable == str(interpreter)
+
+
+class TestInterpreterDiscovery:
+    def test_probed_once(self, temp_dir, mocker):
+        from virtualenv.discovery.py_info import PythonInfo
+
+        bin_dir = temp_dir / 'bin'
+        broken = create_broken_interpreter(bin_dir, 'python3')
+        interpreter = create_interpreter(bin_dir, f'python{sys.version_info.major}.{sys.version_info.minor}')
+        other = create_broken_interpreter(bin_dir, 'python2.7')
+        from_exe = mocker.spy(PythonInfo, 'from_exe')
+        discovery = InterpreterDiscovery(
+            InterpreterRegistry(temp_dir / 'interpreters.json'),
+            env={'PATH': str(bin_dir)},
+            predicate=lambda interpreter: interpreter.executable != sys.executable,
+        )
+
+        assert discovery.find('3.99') is None
+        assert discovery.find('2.7') is None
+        assert discovery.find('').executable == str(interpreter)
+        assert discovery.find(f'{sys.version_info.major}').executable == str(interpreter)
+
+        probed = [call.args[0] for call in from_exe.call_args_list]
+        for executable in (broken, interpreter, other):
+            assert probed.count(str(executable)) == 1
+
+    def test_current_interpreter(self, temp_dir, mocker):
+        from virtualenv.discovery.py_info import PythonInfo
+
+        create_broken_interpreter(temp_dir / 'bin', 'python3')
+        from_exe = mocker.spy(PythonInfo, 'from_exe')
+        discovery = InterpreterDiscovery(InterpreterRegistry(), env={'PATH': str(temp_dir / 'bin')})
+
+        assert discovery.find(f'{sys.version_info.major}.{sys.version_info.minor}').executable == sys.executable
+        from_exe.assert_not_called()
+
+    def test_cached_first(self, temp_dir, mocker):
+        from virtualenv.discovery.py_info import PythonInfo
+
+        bin_dir = temp_dir / 'bin'
+        create_broken_interpreter(bin_dir, 'python3')
+        interpreter = create_interpreter(bin_dir, f'python{sys.version_info.major}.{sys.version_info.minor}')
+        registry = InterpreterRegistry(temp_dir / 'interpreters.json')
+        registry.get(str(interpreter))
+        registry.save()
+
+        from_exe = mocker.spy(PythonInfo, 'from_exe')
+        discovery = InterpreterDiscovery(
+            InterpreterRegistry(temp_dir / 'interpreters.json'),
+            env={'PATH': str(bin_dir)},
+            predicate=lambda interpreter: interpreter.executable != sys.executable,
+        )
+
+        assert discovery.find('').executable == str(interpreter)
+        from_exe.assert_not_called()
+
+    def test_stop_after_match(self, temp_dir, mocker):
+        from virtualenv.discovery.py_info import PythonInfo
+
+        bin_dir = temp_dir / 'bin'
+        interpreter = create_interpreter(bin_dir, 'python3')
+        broken = [create_broken_interpreter(bin_dir, f'python3.{minor}') for minor in range(10, 20)]
+        mocker.patch('os.cpu_count', return_value=1)
+        from_exe = mocker.spy(PythonInfo, 'from_exe')
+        discovery = InterpreterDiscovery(
+            InterpreterRegistry(),
+            env={'PATH': str(bin_dir)},
+            predicate=lambda interpreter: interpreter.executable != sys.executable,
+        )
+
+        assert discovery.find('').executable == str(interpreter)
+
+        probed = {call.args[0] for call in from_exe.call_args_list}
+        assert str(interpreter) in probed
+        assert not probed.intersection(str(executable) for executable in broken[4:])
+
+    def test_probe_order(self, temp_dir):
+        bin_dir = temp_dir / 'bin'
+        broken = create_broken_interpreter(bin_dir, 'python3')
+        interpreter = create_interpreter(bin_dir, 'python3.99')
+        discovery = InterpreterDiscovery(InterpreterRegistry())
+
+        results = discovery.probe([str(interpreter), str(broken), str(interpreter)])
+
+        assert [None if result is None else result.executable for result in results] == [
+            str(interpreter),
+            None,
+            str(interpreter),
+        ]
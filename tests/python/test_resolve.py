@@ -1,4 +1,6 @@
+import io
 import sys
+import tarfile
 from platform import machine
 
 import pytest
@@ -156,3 +158,31 @@ class TestVariantGIL:
             match=f"Could not find a default source for name='3.12' system='{platform.name}' arch=",
         ):
             get_distribution('3.12')
+
+
+class TestUnpackStream:
+    @pytest.mark.parametrize(('extension', 'mode'), [('tar.gz', 'w:gz'), ('tgz', 'w:gz'), ('tar.bz2', 'w:bz2')])
+    def test_tar(self, temp_dir, extension, mode):
+        buffer = io.BytesIO()
+        with tarfile.open(mode=mode, fileobj=buffer) as tf:
+            info = tarfile.TarInfo('python/bin/python3')
+            info.size = 3
+            tf.addfile(info, io.BytesIO(b'foo'))
+
+        buffer.seek(0)
+        dist = get_distribution(
+            '3.12',
+            f'https://github.com/indygreg/python-build-standalone/releases/download/20240107/cpython-3.12.1%2B20240107-x86_64-unknown-linux-gnu-install_only.{extension}',
+        )
+        assert dist.streamable
+
+        dist.unpack_stream(buffer, temp_dir)
+
+        assert (temp_dir / 'python' / 'bin' / 'python3').read_bytes() == b'foo'
+
+    def test_zip(self, temp_dir):
+        dist = get_distribution('pypy3.10', 'https://downloads.python.org/pypy/pypy3.10-v7.3.15-win64.zip')
+        assert not dist.streamable
+
+        with pytest.raises(ValueError, match='Archive type cannot be streamed: pypy3.10-v7.3.15-win64.zip'):
+            dist.unpack_stream(io.BytesIO(), temp_dir)
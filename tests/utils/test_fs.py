@@ -1,7 +1,11 @@
 import os
 import pathlib
+import subprocess
+import sys
 
-from hatch.utils.fs import Path, temp_chdir, temp_directory
+import pytest
+
+from hatch.utils.fs import Path, exclusive_lock, temp_chdir, temp_directory
 
 
 class TestPath:
@@ -127,3 +131,22 @@ def test_temp_chdir():
 
     assert os.getcwd() == origin
     assert not temp_dir.exists()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Locks are tested with `fcntl`')
+def test_exclusive_lock(temp_dir):
+    path = temp_dir / 'sub' / '.lock'
+    script = (
+        'import fcntl, sys\n'
+        'with open(sys.argv[1], "a+b") as f:\n'
+        '    try:\n'
+        '        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)\n'
+        '    except OSError:\n'
+        '        sys.exit(1)\n'
+    )
+
+    with exclusive_lock(path):
+        assert path.is_file()
+        assert subprocess.run([sys.executable, '-c', script, str(path)], check=False).returncode == 1
+
+    assert subprocess.run([sys.executable, '-c', script, str(path)], check=False).returncode == 0
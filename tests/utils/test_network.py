@@ -0,0 +1,275 @@
+import os
+import threading
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from hatch.config.constants import AppEnvVars
+from hatch.errors import DownloadError
+from hatch.utils.network import DownloadStream, close_clients, download_file, get_client, get_environment_proxies
+from hatch.utils.structures import EnvVars
+
+PROXY_ENV_VARS = ['*_proxy', '*_PROXY']
+
+
+class FileServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, content):
+        super().__init__(('127.0.0.1', 0), FileHandler)
+        self.content = content
+        self.etag = '"v1"'
+        self.ranges = True
+        # Each failure closes the connection after sending this many bytes of the body
+        self.failures = 0
+        self.fail_after = 0
+        self.requests = []
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/archive.tar.gz'
+
+    def handle_error(self, request, client_address):
+        # Pooled connections are reset when clients are closed
+        pass
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    server: FileServer
+    # Persistent connections are required to observe reuse
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args, **kwargs):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        content = server.content
+        with server.lock:
+            server.requests.append(dict(self.headers))
+            fail = server.failures > 0
+            if fail:
+                server.failures -= 1
+
+        start, end = 0, len(content) - 1
+        range_header = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if server.ranges and range_header and (if_range is None or if_range == server.etag):
+            range_start, _, range_end = range_header.partition('=')[2].partition('-')
+            start = int(range_start)
+            if range_end:
+                end = int(range_end)
+
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(content)}')
+        else:
+            self.send_response(200)
+
+        body = content[start : end + 1]
+        self.send_headers(len(body))
+        self.end_headers()
+
+        if fail:
+            self.wfile.write(body[: server.fail_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+    def send_headers(self, length):
+        self.send_header('Content-Length', str(length))
+        if self.server.etag is not None:
+            self.send_header('ETag', self.server.etag)
+        if self.server.ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+
+
+@pytest.fixture
+def file_server(mocker):
+    mocker.patch('hatch.utils.network.time.sleep')
+
+    server = FileServer(os.urandom(100_000))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+class TestDownloadFile:
+    def test_complete(self, temp_dir, file_server):
+        path = temp_dir / 'archive.tar.gz'
+        download_file(path, file_server.url)
+
+        assert path.read_bytes() == file_server.content
+        assert list(temp_dir.iterdir()) == [path]
+        assert len(file_server.requests) == 1
+
+    def test_resume(self, temp_dir, file_server):
+        file_server.failures = 2
+        file_server.fail_after = 10_000
+
+        path = temp_dir / 'archive.tar.gz'
+        download_file(path, file_server.url)
+
+        assert path.read_bytes() == file_server.content
+        ranges = [(request.get('Range'), request.get('If-Range')) for request in file_server.requests]
+        assert ranges == [(None, None), ('bytes=10000-', '"v1"'), ('bytes=20000-', '"v1"')]
+
+    def test_resume_without_range_support(self, temp_dir, file_server):
+        file_server.ranges = False
+        file_server.failures = 1
+        file_server.fail_after = 10_000
+
+        path = temp_dir / 'archive.tar.gz'
+        download_file(path, file_server.url)
+
+        assert path.read_bytes() == file_server.content
+        assert len(file_server.requests) == 2
+
+    def test_interrupted_without_validator(self, temp_dir, file_server):
+        file_server.etag = None
+        file_server.failures = 1
+        file_server.fail_after = 10_000
+
+        path = temp_dir / 'archive.tar.gz'
+        with pytest.raises(DownloadError, match='cannot be resumed without a strong validator'):
+            download_file(path, file_server.url)
+
+        assert not list(temp_dir.iterdir())
+        assert len(file_server.requests) == 1
+
+    def test_retry_without_validator(self, temp_dir, file_server):
+        file_server.etag = None
+        file_server.failures = 1
+        file_server.fail_after = 0
+
+        path = temp_dir / 'archive.tar.gz'
+        download_file(path, file_server.url)
+
+        assert path.read_bytes() == file_server.content
+        assert [request.get('Range') for request in file_server.requests] == [None, None]
+
+    def test_resource_changed(self, temp_dir, file_server):
+        file_server.failures = 1
+        file_server.fail_after = 10_000
+
+        original_handler = FileHandler.do_GET
+
+        def change_after_first_request(handler):
+            original_handler(handler)
+            file_server.etag = '"v2"'
+
+        path = temp_dir / 'archive.tar.gz'
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(FileHandler, 'do_GET', change_after_first_request)
+            with pytest.raises(DownloadError, match='Resource changed while downloading'):
+                download_file(path, file_server.url)
+
+        assert not list(temp_dir.iterdir())
+
+
+class TestDownloadStream:
+    def test_resume(self, file_server):
+        file_server.failures = 1
+        file_server.fail_after = 10_000
+
+        with DownloadStream(file_server.url) as stream:
+            content = stream.read()
+
+        assert content == file_server.content
+        assert stream.hexdigest == sha256(file_server.content).hexdigest()
+
+    def test_sink(self, temp_dir, file_server):
+        path = temp_dir / 'archive.tar.gz'
+        with path.open('wb') as sink, DownloadStream(file_server.url, sink=sink) as stream:
+            stream.read(100)
+            stream.exhaust()
+
+        assert path.read_bytes() == file_server.content
+        assert stream.hexdigest == sha256(file_server.content).hexdigest()
+
+
+class TestGetEnvironmentProxies:
+    def test_proxies(self):
+        env_vars = {'HTTP_PROXY': 'proxy:8080', 'HTTPS_PROXY': 'https://proxy:8443'}
+        with EnvVars(env_vars, exclude=PROXY_ENV_VARS):
+            assert get_environment_proxies() == {'http://': 'http://proxy:8080', 'https://': 'https://proxy:8443'}
+
+    def test_excluded_hosts(self):
+        env_vars = {'ALL_PROXY': 'http://proxy', 'NO_PROXY': 'localhost, .example.com,10.0.0.1,::1,https://foo.bar'}
+        with EnvVars(env_vars, exclude=PROXY_ENV_VARS):
+            assert get_environment_proxies() == {
+                'all://': 'http://proxy',
+                'all://localhost': None,
+                'all://*.example.com': None,
+                'all://10.0.0.1': None,
+                'all://[::1]': None,
+                'https://foo.bar': None,
+            }
+
+    def test_excluded_everything(self):
+        with EnvVars({'ALL_PROXY': 'http://proxy', 'NO_PROXY': 'foo,*'}, exclude=PROXY_ENV_VARS):
+            assert get_environment_proxies() == {}
+
+
+class TestGetClient:
+    def test_shared(self):
+        assert get_client() is get_client()
+
+    def test_tls_settings(self):
+        import certifi
+
+        ca_file = certifi.where()
+        assert get_client(verify=ca_file) is not get_client()
+        assert get_client(verify=ca_file) is get_client(verify=ca_file)
+
+    def test_close(self):
+        client = get_client()
+        close_clients()
+
+        assert client.is_closed
+        assert get_client() is not client
+
+    def test_http2(self, mocker):
+        transport = mocker.patch('httpx.HTTPTransport')
+        with EnvVars({AppEnvVars.HTTP2: 'true'}):
+            get_client()
+
+        assert transport.call_args.kwargs['http2'] is True
+
+    def test_environment_proxy(self, temp_dir, file_server):
+        path = temp_dir / 'archive.tar.gz'
+        proxy = f'http://127.0.0.1:{file_server.server_address[1]}'
+        with EnvVars({'HTTP_PROXY': proxy}, exclude=PROXY_ENV_VARS):
+            download_file(path, 'http://example.invalid/archive.tar.gz')
+
+        assert path.read_bytes() == file_server.content
+        assert file_server.requests[0]['Host'] == 'example.invalid'
+
+    def test_environment_proxy_excluded(self, temp_dir, file_server):
+        path = temp_dir / 'archive.tar.gz'
+        with EnvVars({'HTTP_PROXY': 'http://127.0.0.1:1', 'NO_PROXY': '127.0.0.1'}, exclude=PROXY_ENV_VARS):
+            download_file(path, file_server.url)
+
+        assert path.read_bytes() == file_server.content
+
+    def test_reused_connection(self, file_server):
+        with DownloadStream(file_server.url) as stream:
+            stream.exhaust()
+        with DownloadStream(file_server.url) as stream:
+            stream.exhaust()
+
+        assert file_server.connections == 1